@@ -234,10 +234,19 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if self.client_config_map.event_driven_clock:
+                self.clock = Clock(ClockMode.EVENT_DRIVEN,
+                                   tick_size=tick_size,
+                                   min_tick_interval=self.client_config_map.min_tick_interval)
+            else:
+                self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if self.client_config_map.tick_profiling:
+                self.clock.enable_tick_profiling()
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
+                    if self.client_config_map.event_driven_clock:
+                        self.clock.add_connector_triggers(market)
                     self.markets_recorder.restore_market_states(self.strategy_file_name, market)
                     if len(market.limit_orders) > 0:
                         self.notify(f"Canceling dangling limit orders on {market.name}...")
@@ -388,6 +388,12 @@ class AutofillImportEnum(str, ClientConfigEnum):
     disabled = "disabled"
 
 
+class QueueOverflowPolicyEnum(str, ClientConfigEnum):
+    block = "block"
+    coalesce = "coalesce"
+    drop_and_resnapshot = "drop_and_resnapshot"
+
+
 class TelegramMode(BaseClientModel, ABC):
     @abstractmethod
     def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
@@ -1087,6 +1093,95 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_share_group: Optional[str] = Field(
+        default=None,
+        description=("Name of a group of bot instances, running on this host, that trade with the same API keys."
+                     "\nThe instances of a group share the API rate limits of each exchange through a local broker,"
+                     "\ninstead of each one using a fixed percentage of them. Leave empty to disable."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the name of the group of bot instances sharing the API rate limits with this one"
+                " (leave empty to disable)"
+            ),
+        ),
+    )
+    exchange_metadata_cache: bool = Field(
+        default=False,
+        description=("Cache the exchange metadata (trading pairs, trading rules) on disk, so that the connectors start"
+                     "\nfrom the cached data and refresh it in the background, instead of requesting it again."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to cache the exchange metadata on disk to speed up the connectors start? (Yes/No)"
+            ),
+        ),
+    )
+    prewarm_connections: int = Field(
+        default=0,
+        ge=0,
+        description=("Number of connections each connector opens to its exchange once it is ready, so that the first"
+                     "\norders do not wait for the connections to be established. Set to 0 to disable."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many connections should the connectors open ahead of the first orders?",
+        ),
+    )
+    websocket_hot_standby: bool = Field(
+        default=False,
+        description=("Keep a second websocket connection to the order book and user streams of the connectors that"
+                     "\nsupport it, so that the streams keep flowing when a connection drops and reconnects."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to keep hot standby websocket connections to the exchange streams? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_connections: int = Field(
+        default=1,
+        ge=1,
+        description=("Number of websocket connections the connectors that support it spread their order book"
+                     "\nsubscriptions across, balancing the trading pairs by their message rate."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many websocket connections should the order book subscriptions be spread across?",
+        ),
+    )
+    order_book_diff_coalescing: bool = Field(
+        default=False,
+        description=("Merge the order book diffs waiting for a trading pair by price level and apply them at once,"
+                     "\ninstead of applying the diff messages one at a time."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Do you want to coalesce the waiting order book diffs? (Yes/No)",
+        ),
+    )
+    order_book_dispatcher_shards: int = Field(
+        default=0,
+        ge=0,
+        description=("Number of workers the order book messages of the connectors are split across, each worker"
+                     "\napplying the messages of its trading pairs, instead of one task per trading pair."
+                     "\nSet to 0 to disable."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many workers should apply the order book messages? (Enter 0 to disable)",
+        ),
+    )
+    message_queue_max_size: int = Field(
+        default=0,
+        ge=0,
+        description=("Maximum number of messages waiting in each order book and user stream queue of the connectors."
+                     "\nSet to 0 for unbounded queues."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "What is the maximum number of messages waiting in each queue? (Enter 0 for no limit)",
+        ),
+    )
+    order_book_queue_overflow_policy: QueueOverflowPolicyEnum = Field(
+        default=QueueOverflowPolicyEnum.block,
+        description=("What to do with the order book messages arriving to a full queue: block (wait for room),"
+                     "\ncoalesce (merge the diffs of a trading pair) or drop_and_resnapshot (drop the diffs of the"
+                     "\ntrading pair and request a new snapshot). User stream messages always wait for room."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What to do with the order book messages arriving to a full queue?"
+                f" ({'/'.join(list(QueueOverflowPolicyEnum))})"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1116,6 +1211,36 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    event_driven_clock: bool = Field(
+        default=False,
+        description="When enabled, the clock also ticks as soon as an order is filled or the best price of an order"
+                    "\nbook changes, keeping the tick size as the longest interval between two ticks.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want the clock to tick on fills and best price changes? (Yes/No)"
+            ),
+        ),
+    )
+    min_tick_interval: float = Field(
+        default=0.1,
+        gt=0,
+        description="The shortest interval (in seconds) between two ticks of the event driven clock.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What is the shortest interval (in seconds) between two ticks of the event driven clock?"
+            ),
+        ),
+    )
+    tick_profiling: bool = Field(
+        default=False,
+        description="When enabled, the clock records how long each connector and strategy takes to process a tick,"
+                    "\nthe overrunning and missed ticks, and shows them in the status command output.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to profile the clock ticks? (Yes/No)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
 
     class Config:
@@ -1139,6 +1264,12 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(f"The value must be one of {', '.join(list(AutofillImportEnum))}.")
         return v
 
+    @validator("order_book_queue_overflow_policy", pre=True)
+    def validate_order_book_queue_overflow_policy(cls, v: Union[str, QueueOverflowPolicyEnum]):
+        if isinstance(v, str) and v not in QueueOverflowPolicyEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(QueueOverflowPolicyEnum))}.")
+        return v
+
     @validator("telegram_mode", pre=True)
     def validate_telegram_mode(cls, v: Union[(str, Dict) + tuple(TELEGRAM_MODES.values())]):
         if isinstance(v, tuple(TELEGRAM_MODES.values()) + (Dict,)):
@@ -1151,7 +1282,8 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "event_driven_clock", "tick_profiling",
+               "order_book_diff_coalescing", "exchange_metadata_cache", "websocket_hot_standby", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -1232,6 +1364,14 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(ret)
         return v
 
+    @validator("min_tick_interval", pre=True)
+    def validate_min_tick_interval(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0, inclusive=False)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
     # === post-validations ===
 
     @root_validator()
@@ -11,6 +11,7 @@ from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdat
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.connections.json_codec import scan_json_string_field
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
@@ -133,6 +134,19 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
                 channel = self._funding_info_messages_queue_key
         return channel
 
+    def _channel_originating_raw_message(self, raw_message: str) -> Optional[str]:
+        # The stream name is the first field of the combined stream messages
+        stream_name = scan_json_string_field(raw_message, "stream")
+        channel = None
+        if stream_name is not None:
+            if "@depth" in stream_name:
+                channel = self._diff_messages_queue_key
+            elif "@aggTrade" in stream_name:
+                channel = self._trade_messages_queue_key
+            elif "@markPrice" in stream_name:
+                channel = self._funding_info_messages_queue_key
+        return channel
+
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         timestamp: float = time.time()
         raw_message["data"]["s"] = await self._connector.trading_pair_associated_to_exchange_symbol(
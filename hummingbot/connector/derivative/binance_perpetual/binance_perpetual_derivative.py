@@ -22,7 +22,7 @@ from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RateLimitUsageHeader
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -75,6 +75,10 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def rate_limits_rules(self) -> List[RateLimit]:
         return CONSTANTS.RATE_LIMITS
 
+    @property
+    def rate_limit_usage_headers(self) -> List[RateLimitUsageHeader]:
+        return CONSTANTS.RATE_LIMIT_USAGE_HEADERS
+
     @property
     def domain(self) -> str:
         return self._domain
@@ -129,4 +129,4 @@ class BitComPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
             CONSTANTS.USER_POSITIONS_ENDPOINT_NAME,
             CONSTANTS.USER_BALANCES_ENDPOINT_NAME,
         ]:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
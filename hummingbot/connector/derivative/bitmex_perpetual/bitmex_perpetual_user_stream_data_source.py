@@ -89,7 +89,7 @@ class BitmexPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
 
                 async for msg in ws.iter_messages():
                     if len(msg.data) > 0:
-                        output.put_nowait(msg.data)
+                        await output.put(msg.data)
 
             except asyncio.CancelledError:
                 raise
@@ -98,4 +98,4 @@ class GateIoPerpetualAPIUserStreamDataSource(UserStreamTrackerDataSource):
             CONSTANTS.USER_POSITIONS_ENDPOINT_NAME,
             CONSTANTS.TICKER_ENDPOINT_NAME,
         ]:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
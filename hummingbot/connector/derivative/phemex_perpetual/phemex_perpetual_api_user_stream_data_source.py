@@ -113,4 +113,4 @@ class PhemexPerpetualAPIUserStreamDataSource(UserStreamTrackerDataSource):
             if event_message.get("result", "") == "pong":
                 self.pong_received_event.set()
             else:
-                queue.put_nowait(event_message)
+                await queue.put(event_message)
@@ -78,4 +78,4 @@ class AscendExAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 pong_request = WSJSONRequest(payload=pong_payloads)
                 await websocket_assistant.send(request=pong_request)
             elif message_type == CONSTANTS.ORDER_CHANGE_EVENT_TYPE and event_message.get("ac") == "CASH":
-                queue.put_nowait(event_message)
+                await queue.put(event_message)
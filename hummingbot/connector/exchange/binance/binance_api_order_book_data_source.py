@@ -1,12 +1,13 @@
 import asyncio
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
+from hummingbot.core.web_assistant.connections.json_codec import scan_json_string_field
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
@@ -35,6 +36,14 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._domain = domain
         self._api_factory = api_factory
 
+    @property
+    def supports_sequence_gap_detection(self) -> bool:
+        return True
+
+    @property
+    def supports_hot_standby(self) -> bool:
+        return True
+
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
                                      domain: Optional[str] = None) -> Dict[str, float]:
@@ -123,14 +132,14 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=raw_message["s"])
             trade_message = BinanceOrderBook.trade_message_from_exchange(
                 raw_message, {"trading_pair": trading_pair})
-            message_queue.put_nowait(trade_message)
+            await message_queue.put(trade_message)
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         if "result" not in raw_message:
             trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=raw_message["s"])
             order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
                 raw_message, time.time(), {"trading_pair": trading_pair})
-            message_queue.put_nowait(order_book_message)
+            await message_queue.put(order_book_message)
 
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         channel = ""
@@ -139,3 +148,21 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             channel = (self._diff_messages_queue_key if event_type == CONSTANTS.DIFF_EVENT_TYPE
                        else self._trade_messages_queue_key)
         return channel
+
+    def _channel_originating_raw_message(self, raw_message: str) -> Optional[str]:
+        # The event type is the first field of the events
+        event_type = scan_json_string_field(raw_message, "e")
+        channel = None
+        if event_type == CONSTANTS.DIFF_EVENT_TYPE:
+            channel = self._diff_messages_queue_key
+        elif event_type == CONSTANTS.TRADE_EVENT_TYPE:
+            channel = self._trade_messages_queue_key
+        return channel
+
+    def _message_sequence(self, channel: str, event_message: Dict[str, Any]) -> Optional[Tuple[Hashable, int]]:
+        sequence = None
+        if channel == self._diff_messages_queue_key and "u" in event_message:
+            sequence = ((channel, event_message["s"]), event_message["u"])
+        elif channel == self._trade_messages_queue_key and "t" in event_message:
+            sequence = ((channel, event_message["s"]), event_message["t"])
+        return sequence
@@ -1,6 +1,7 @@
 import asyncio
+import json
 import time
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
@@ -36,12 +37,19 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
         self._listen_key_initialized_event: asyncio.Event = asyncio.Event()
         self._last_listen_key_ping_ts = 0
+        self._manage_listen_key_task: Optional[asyncio.Task] = None
+
+    @property
+    def supports_hot_standby(self) -> bool:
+        return True
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         """
         Creates an instance of WSAssistant connected to the exchange
         """
-        self._manage_listen_key_task = safe_ensure_future(self._manage_listen_key_task_loop())
+        # The hot standby connections share the listen key
+        if self._manage_listen_key_task is None or self._manage_listen_key_task.done():
+            self._manage_listen_key_task = safe_ensure_future(self._manage_listen_key_task_loop())
         await self._listen_key_initialized_event.wait()
 
         ws: WSAssistant = await self._get_ws_assistant()
@@ -124,13 +132,35 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             self._listen_key_initialized_event.clear()
 
     async def _get_ws_assistant(self) -> WSAssistant:
-        if self._ws_assistant is None:
-            self._ws_assistant = await self._api_factory.get_ws_assistant()
-        return self._ws_assistant
+        return await self._api_factory.get_ws_assistant()
+
+    def _event_message_key(self, event_message: Dict[str, Any]) -> Optional[Hashable]:
+        event_type = event_message.get("e")
+        key = None
+        if event_type == "executionReport":
+            key = (event_type, event_message.get("E"), event_message.get("i"), event_message.get("x"),
+                   event_message.get("t"))
+        elif event_type == "outboundAccountPosition":
+            key = (event_type, event_message.get("E"), event_message.get("u"))
+        elif event_type == "balanceUpdate":
+            key = (event_type, event_message.get("E"), event_message.get("a"), event_message.get("d"),
+                   event_message.get("T"))
+        elif event_type == "listStatus":
+            key = (event_type, event_message.get("E"), event_message.get("g"), event_message.get("L"),
+                   event_message.get("T"))
+        elif event_type is not None:
+            # Events without known identifying fields are only duplicates when their whole content is the same
+            key = json.dumps(event_message, sort_keys=True)
+        return key
 
     async def _on_user_stream_interruption(self, websocket_assistant: Optional[WSAssistant]):
         await super()._on_user_stream_interruption(websocket_assistant=websocket_assistant)
+        if len(self._hot_standby_ws_assistants) > 0:
+            # The other hot standby connections are still listening with the current listen key
+            await self._sleep(5)
+            return
         self._manage_listen_key_task and self._manage_listen_key_task.cancel()
+        self._manage_listen_key_task = None
         self._current_listen_key = None
         self._listen_key_initialized_event.clear()
         await self._sleep(5)
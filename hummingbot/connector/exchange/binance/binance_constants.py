@@ -1,4 +1,4 @@
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RateLimitUsageHeader
 from hummingbot.core.data_type.in_flight_order import OrderState
 
 DEFAULT_DOMAIN = "com"
@@ -108,6 +108,13 @@ RATE_LIMITS = [
                              LinkedLimitWeightPair(RAW_REQUESTS, 1)])
 ]
 
+# Response headers reporting the capacity used on the pool limits
+RATE_LIMIT_USAGE_HEADERS = [
+    RateLimitUsageHeader(header="X-MBX-USED-WEIGHT-1M", limit_id=REQUEST_WEIGHT),
+    RateLimitUsageHeader(header="X-MBX-ORDER-COUNT-10S", limit_id=ORDERS),
+    RateLimitUsageHeader(header="X-MBX-ORDER-COUNT-1D", limit_id=ORDERS_24HR),
+]
+
 ORDER_NOT_EXIST_ERROR_CODE = -2013
 ORDER_NOT_EXIST_MESSAGE = "Order does not exist"
 UNKNOWN_ORDER_ERROR_CODE = -2011
@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.data_types import RateLimitUsageHeader
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -77,6 +78,10 @@ class BinanceExchange(ExchangePyBase):
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
 
+    @property
+    def rate_limit_usage_headers(self) -> List[RateLimitUsageHeader]:
+        return CONSTANTS.RATE_LIMIT_USAGE_HEADERS
+
     @property
     def domain(self):
         return self._domain
@@ -56,7 +56,7 @@ def build_api_factory_without_time_synchronizer_pre_processor(throttler: AsyncTh
 
 
 def create_throttler() -> AsyncThrottler:
-    return AsyncThrottler(CONSTANTS.RATE_LIMITS)
+    return AsyncThrottler(CONSTANTS.RATE_LIMITS, usage_headers=CONSTANTS.RATE_LIMIT_USAGE_HEADERS)
 
 
 async def get_current_server_time(
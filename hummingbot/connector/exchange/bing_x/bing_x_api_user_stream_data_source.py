@@ -146,9 +146,9 @@ class BingXAPIUserStreamDataSource(UserStreamTrackerDataSource):
         async for ws_response in ws.iter_messages():
             data = utils.decompress_ws_message(ws_response.data)
             if data.get("e") == "ACCOUNT_UPDATE":
-                output.put_nowait(data)
+                await output.put(data)
             elif (data.get("dataType") == "spot.executionReport"):
-                output.put_nowait(data)
+                await output.put(data)
             # if isinstance(data, list):
             #     for message in data:
             #         if message["e"] in ["executionReport", "outboundAccountInfo"]:
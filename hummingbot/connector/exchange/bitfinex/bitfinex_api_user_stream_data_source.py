@@ -48,7 +48,7 @@ class BitfinexAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
                 async for msg in ws.messages():
                     if msg[1] not in [ContentEventType.HEART_BEAT, ContentEventType.AUTH, ContentEventType.INFO]:
-                        output.put_nowait(msg)
+                        await output.put(msg)
 
             except asyncio.CancelledError:
                 raise
@@ -102,7 +102,7 @@ class BitmartAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0 and "table" in event_message and "data" in event_message:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
 
     async def _get_ws_assistant(self) -> WSAssistant:
         if self._ws_assistant is None:
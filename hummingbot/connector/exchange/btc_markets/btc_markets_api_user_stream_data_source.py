@@ -87,7 +87,7 @@ class BtcMarketsAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 raise ValueError(f"Error message ({code}: {msg}) received in the user stream data source: {data}")
 
             if messageType in [CONSTANTS.ORDER_CHANGE_EVENT_TYPE, CONSTANTS.FUND_CHANGE_EVENT_TYPE]:
-                queue.put_nowait(data)
+                await queue.put(data)
 
     async def _get_ws_assistant(self) -> WSAssistant:
         if self._ws_assistant is None:
@@ -108,7 +108,7 @@ class BybitAPIUserStreamDataSource(UserStreamTrackerDataSource):
             if isinstance(data, list):
                 for message in data:
                     if message["e"] in ["executionReport", "outboundAccountInfo"]:
-                        output.put_nowait(message)
+                        await output.put(message)
             elif data.get("auth") == "fail":
                 raise IOError("Private channel authentication failed.")
 
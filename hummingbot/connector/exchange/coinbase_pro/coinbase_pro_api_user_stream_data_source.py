@@ -70,7 +70,7 @@ class CoinbaseProAPIUserStreamDataSource(UserStreamTrackerDataSource):
                     elif msg_type == "error":
                         raise ValueError(f"Coinbase Pro Websocket received error message - {msg['message']}")
                     elif msg_type in ["open", "match", "change", "done"]:
-                        output.put_nowait(msg)
+                        await output.put(msg)
                     elif msg_type in ["received", "activate", "subscriptions"]:
                         # these messages are not needed to track the order book
                         pass
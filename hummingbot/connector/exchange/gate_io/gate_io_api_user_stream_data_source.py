@@ -96,4 +96,4 @@ class GateIoAPIUserStreamDataSource(UserStreamTrackerDataSource):
             CONSTANTS.USER_ORDERS_ENDPOINT_NAME,
             CONSTANTS.USER_BALANCE_ENDPOINT_NAME,
         ]:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
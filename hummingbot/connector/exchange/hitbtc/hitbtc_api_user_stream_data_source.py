@@ -83,7 +83,7 @@ class HitbtcAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             try:
                 async for msg in self._listen_to_orders_trades_balances():
-                    output.put_nowait(msg)
+                    await output.put(msg)
             except asyncio.CancelledError:
                 raise
             except HitbtcAPIError as e:
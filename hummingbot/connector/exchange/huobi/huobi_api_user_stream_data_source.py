@@ -107,4 +107,4 @@ class HuobiAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 if data.get("code") != 200:
                     raise ValueError(f"Error subscribing to topic: {data.get('ch')} ({data})")
             else:
-                queue.put_nowait(data)
+                await queue.put(data)
@@ -113,7 +113,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         msg = ws_response.data
                         if not (type(msg) is dict and "event" in msg.keys() and
                                 msg["event"] in ["heartbeat", "systemStatus", "subscriptionStatus"]):
-                            output.put_nowait(msg)
+                            await output.put(msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
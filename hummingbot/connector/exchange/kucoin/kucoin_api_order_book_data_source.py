@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS, kucoin_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    MAX_TRADING_PAIRS_PER_CONNECTION = CONSTANTS.WS_MAX_SYMBOLS_PER_TOPIC
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -32,6 +33,10 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._last_ws_message_sent_timestamp = 0
         self._ping_interval = 0
 
+    @property
+    def supports_subscription_sharding(self) -> bool:
+        return True
+
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
                                      domain: Optional[str] = None) -> Dict[str, float]:
@@ -48,7 +53,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "bids": snapshot_response["data"]["bids"],
             "asks": snapshot_response["data"]["asks"]
         }
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             order_book_message_content,
             snapshot_timestamp)
@@ -111,7 +116,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "bids": diff_data["changes"]["bids"],
             "asks": diff_data["changes"]["asks"],
         }
-        diff_message: OrderBookMessage = OrderBookMessage(
+        diff_message: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.DIFF,
             order_book_message_content,
             timestamp)
@@ -119,9 +124,12 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         message_queue.put_nowait(diff_message)
 
     async def _subscribe_channels(self, ws: WSAssistant):
+        await self._subscribe_trading_pairs(ws=ws, trading_pairs=self._trading_pairs)
+
+    async def _subscribe_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
         try:
             symbols = ",".join([await self._connector.exchange_symbol_associated_to_pair(trading_pair=pair)
-                                for pair in self._trading_pairs])
+                                for pair in trading_pairs])
 
             trades_payload = {
                 "id": web_utils.next_message_id(),
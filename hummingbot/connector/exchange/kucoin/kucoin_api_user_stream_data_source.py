@@ -103,4 +103,4 @@ class KucoinAPIUserStreamDataSource(UserStreamTrackerDataSource):
         if (len(event_message) > 0
                 and event_message.get("type") == "message"
                 and event_message.get("subject") in [CONSTANTS.ORDER_CHANGE_EVENT_TYPE, CONSTANTS.BALANCE_EVENT_TYPE]):
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
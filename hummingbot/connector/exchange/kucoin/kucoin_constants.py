@@ -35,6 +35,8 @@ GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
 WS_PING_HEARTBEAT = 10
+# Symbols per public market data topic, the topics of one connection are subscribed with the same symbols
+WS_MAX_SYMBOLS_PER_TOPIC = 100
 
 DIFF_EVENT_TYPE = "trade.l2update"
 TRADE_EVENT_TYPE = "trade.l3match"
@@ -75,7 +75,7 @@ class LoopringAPIUserStreamDataSource(UserStreamTrackerDataSource):
                         diff_msg = ujson.loads(raw_msg)
                         if 'op' in diff_msg:
                             continue  # These messages are for control of the stream, so skip sending them to the market class
-                        output.put_nowait(diff_msg)
+                        await output.put(diff_msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
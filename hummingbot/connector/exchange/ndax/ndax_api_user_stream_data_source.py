@@ -125,7 +125,7 @@ class NdaxAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
                 async for msg in ws.iter_messages():
                     self._last_recv_time = int(time.time())
-                    output.put_nowait(ujson.loads(msg))
+                    await output.put(ujson.loads(msg))
             except asyncio.CancelledError:
                 raise
             except Exception as ex:
@@ -98,7 +98,7 @@ class OkxAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0 and "data" in event_message:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
 
     async def _get_ws_assistant(self) -> WSAssistant:
         if self._ws_assistant is None:
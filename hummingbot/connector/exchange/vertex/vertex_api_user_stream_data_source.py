@@ -112,4 +112,4 @@ class VertexAPIUserStreamDataSource(UserStreamTrackerDataSource):
             and "type" in event_message
             and event_message.get("type") in [CONSTANTS.POSITION_CHANGE_EVENT_TYPE, CONSTANTS.FILL_EVENT_TYPE]
         ):
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
@@ -107,4 +107,4 @@ class WooXAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
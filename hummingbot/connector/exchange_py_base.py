@@ -1,13 +1,16 @@
 import asyncio
+import contextvars
 import copy
 import logging
 import math
+import os
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
+from hummingbot import data_path
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
@@ -15,7 +18,10 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RateLimitUsageHeader, RequestPriority
+from hummingbot.core.api_throttler.shared_throttler import SharedAsyncThrottler, shared_throttler_socket_path
+from hummingbot.core.data_type.bounded_message_queue import QueueOverflowPolicy
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -29,13 +35,19 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig, RESTMethod
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+# Priority lane of the API requests sent while creating or cancelling an order. It is set around the order operations,
+# so that the requests sent by the exchange specific implementations are throttled with the right priority.
+_request_priority: contextvars.ContextVar[Optional[RequestPriority]] = contextvars.ContextVar(
+    "request_priority", default=None)
+
 
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
@@ -45,6 +57,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    EXCHANGE_METADATA_CACHE_TTL = 60 * MINUTE
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,26 +73,31 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._prewarm_connections_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler = self._create_throttler(client_config_map)
+        self._rest_response_cache_enabled: bool = client_config_map.exchange_metadata_cache
+        self._rest_response_cache: Optional[RESTResponseCache] = None
+        self._connections_to_prewarm: int = client_config_map.prewarm_connections
+        self._message_queue_max_size: int = client_config_map.message_queue_max_size
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        self._web_assistants_factory.configure_connection_pool(self.connection_pool_config)
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._set_order_book_tracker(self._create_order_book_tracker(client_config_map))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
+        if client_config_map.websocket_hot_standby:
+            self._enable_websocket_hot_standby()
+        if client_config_map.order_book_connections > 1:
+            self._configure_order_book_subscription_sharding(connections=client_config_map.order_book_connections)
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
@@ -104,6 +122,68 @@ class ExchangePyBase(ExchangeBase, ABC):
     def rate_limits_rules(self) -> List[RateLimit]:
         raise NotImplementedError
 
+    def _enable_websocket_hot_standby(self):
+        for data_source in (self._orderbook_ds, self._user_stream_tracker.data_source):
+            if data_source.supports_hot_standby:
+                data_source.enable_hot_standby()
+            else:
+                self.logger().warning(
+                    f"{type(data_source).__name__} does not support hot standby websocket connections,"
+                    f" it will use a single connection.")
+
+    def _configure_order_book_subscription_sharding(self, connections: int):
+        if self._orderbook_ds.supports_subscription_sharding:
+            self._orderbook_ds.configure_subscription_sharding(connections=connections)
+        else:
+            self.logger().warning(
+                f"{type(self._orderbook_ds).__name__} does not support sharded subscriptions,"
+                f" it will use a single connection.")
+
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottlerBase:
+        share_group: Optional[str] = client_config_map.rate_limits_share_group
+        if share_group:
+            # The bots of the group share the rate limits through a local broker
+            return SharedAsyncThrottler(
+                rate_limits=self.rate_limits_rules,
+                socket_path=shared_throttler_socket_path(group=share_group,
+                                                         connector_name=self.name,
+                                                         domain=self.domain,
+                                                         rate_limits=self.rate_limits_rules),
+                limits_share_percentage=client_config_map.rate_limits_share_pct,
+                usage_headers=self.rate_limit_usage_headers)
+        return AsyncThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct,
+            usage_headers=self.rate_limit_usage_headers)
+
+    @property
+    def rate_limit_usage_headers(self) -> List[RateLimitUsageHeader]:
+        """
+        Response headers in which the exchange reports the capacity used on the rate limits, the throttler aligns its
+        view of the capacity used with them
+        """
+        return []
+
+    @property
+    def connection_pool_config(self) -> ConnectionPoolConfig:
+        """
+        Settings of the HTTP connection pool used by the connector. Connectors can tune them for their exchange, for
+        instance to keep the idle connections open as long as the exchange servers do.
+        """
+        return ConnectionPoolConfig()
+
+    @property
+    def rest_response_cache_ttls(self) -> Dict[str, float]:
+        """
+        Time to live, in seconds, of the cached responses of the public endpoints, by endpoint path. The responses are
+        cached on disk only when the exchange metadata cache is enabled in the client configuration.
+        Connectors can add the endpoints of other rarely changing public data, like the trading fees.
+        """
+        return {
+            self.trading_rules_request_path: self.EXCHANGE_METADATA_CACHE_TTL,
+            self.trading_pairs_request_path: self.EXCHANGE_METADATA_CACHE_TTL,
+        }
+
     @property
     @abstractmethod
     def domain(self) -> str:
@@ -448,6 +528,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
+        priority_token = _request_priority.set(RequestPriority.CREATE)
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
 
@@ -464,6 +545,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 exception=ex,
                 **kwargs,
             )
+        finally:
+            _request_priority.reset(priority_token)
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -516,6 +599,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._order_tracker.process_order_update(order_update)
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
+        priority_token = _request_priority.set(RequestPriority.CANCEL)
         try:
             cancelled = await self._execute_order_cancel_and_process_update(order=order)
             if cancelled:
@@ -535,6 +619,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._order_tracker.process_order_not_found(order.client_order_id)
             else:
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
+        finally:
+            _request_priority.reset(priority_token)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
@@ -674,6 +760,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self._connections_to_prewarm > 0:
+                self._prewarm_connections_task = safe_ensure_future(self._prewarm_connections_when_ready())
 
     async def stop_network(self):
         """
@@ -681,6 +769,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         tasks that require the connection with the exchange to work.
         """
         self._stop_network()
+        if isinstance(self._throttler, SharedAsyncThrottler):
+            # Releases the broker socket and lock of the rate limits share group
+            await self._throttler.close()
 
     async def check_network(self) -> NetworkStatus:
         """
@@ -719,9 +810,31 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._prewarm_connections_task is not None:
+            self._prewarm_connections_task.cancel()
+            self._prewarm_connections_task = None
 
     # === loops and sync related methods ===
     #
+    async def _prewarm_connections_when_ready(self):
+        """
+        Opens the configured number of connections to the exchange hosts once the connector is ready, so that the
+        first orders do not pay the TCP and TLS handshakes.
+        """
+        while not self.ready:
+            await self._sleep(1.0)
+        try:
+            urls = await self._connection_prewarm_urls()
+            opened_connections = await self._web_assistants_factory.prewarm_connections(
+                urls=urls,
+                connections_per_host=self._connections_to_prewarm,
+                throttler_limit_id=self.check_network_request_path)
+            self.logger().info(f"Opened {opened_connections} connections to {self.name} ahead of the orders.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning(f"Could not open the connections to {self.name} ahead of the orders.", exc_info=True)
+
     async def _trading_rules_polling_loop(self):
         """
         Updates the trading rules by requesting the latest definitions from the exchange.
@@ -842,8 +955,20 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _is_user_stream_initialized(self):
         return self._user_stream_tracker.data_source.last_recv_time > 0 or not self.is_trading_required
 
+    def _create_order_book_tracker(self, client_config_map: "ClientConfigAdapter") -> OrderBookTracker:
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain,
+            coalesce_diffs=client_config_map.order_book_diff_coalescing,
+            dispatcher_shards=client_config_map.order_book_dispatcher_shards,
+            queue_max_size=self._message_queue_max_size,
+            queue_overflow_policy=QueueOverflowPolicy(client_config_map.order_book_queue_overflow_policy.value),
+            detect_sequence_gaps=self._orderbook_ds.supports_sequence_gap_detection)
+
     def _create_user_stream_tracker(self):
-        return UserStreamTracker(data_source=self._create_user_stream_data_source())
+        return UserStreamTracker(data_source=self._create_user_stream_data_source(),
+                                 queue_max_size=self._message_queue_max_size)
 
     def _create_user_stream_tracker_task(self):
         return safe_ensure_future(self._user_stream_tracker.start())
@@ -874,6 +999,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         kwargs["method"] = RESTMethod.DELETE
         return await self._api_request(*args, **kwargs)
 
+    async def _connection_prewarm_urls(self) -> List[str]:
+        """
+        URLs on the hosts the orders are sent to, to open the connections to ahead of the orders. Most exchanges serve
+        the private endpoints and the network check from the same host, connectors sending the orders to another
+        host should override it. The requests opening the connections are counted in the network check rate limit.
+        """
+        return [await self._api_request_url(path_url=self.check_network_request_path, is_auth_required=True)]
+
     async def _api_request_url(self, path_url: str, is_auth_required: bool = False) -> str:
         if is_auth_required:
             url = self.web_utils.private_rest_url(path_url, domain=self.domain)
@@ -892,37 +1025,66 @@ class ExchangePyBase(ExchangeBase, ABC):
             is_auth_required: bool = False,
             return_err: bool = False,
             limit_id: Optional[str] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
+        """
+        :param priority: the priority lane of the request in the throttler. If not specified, the requests sent while
+            creating or cancelling an order get the CREATE and CANCEL priorities, and the other requests the
+            PRIVATE_QUERY or PUBLIC_DATA priority depending on whether they require authentication
+        """
 
-        last_exception = None
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
 
         url = overwrite_url or await self._api_request_url(path_url=path_url, is_auth_required=is_auth_required)
-
-        for _ in range(2):
-            try:
-                request_result = await rest_assistant.execute_request(
-                    url=url,
-                    params=params,
-                    data=data,
-                    method=method,
-                    is_auth_required=is_auth_required,
-                    return_err=return_err,
-                    throttler_limit_id=limit_id if limit_id else path_url,
-                )
-
-                return request_result
-            except IOError as request_exception:
-                last_exception = request_exception
-                if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
-                    self._time_synchronizer.clear_time_offset_ms_samples()
-                    await self._update_time_synchronizer()
-                else:
-                    raise
-
-        # Failed even after the last retry
-        raise last_exception
+        priority = priority or _request_priority.get() or (
+            RequestPriority.PRIVATE_QUERY if is_auth_required else RequestPriority.PUBLIC_DATA)
+
+        async def send_request() -> Dict[str, Any]:
+            last_exception = None
+            for _ in range(2):
+                try:
+                    request_result = await rest_assistant.execute_request(
+                        url=url,
+                        params=params,
+                        data=data,
+                        method=method,
+                        is_auth_required=is_auth_required,
+                        return_err=return_err,
+                        throttler_limit_id=limit_id if limit_id else path_url,
+                        priority=priority,
+                    )
+
+                    return request_result
+                except IOError as request_exception:
+                    last_exception = request_exception
+                    if self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
+                        self._time_synchronizer.clear_time_offset_ms_samples()
+                        await self._update_time_synchronizer()
+                    else:
+                        raise
+
+            # Failed even after the last retry
+            raise last_exception
+
+        rest_response_cache = self._get_rest_response_cache()
+        if (rest_response_cache is not None
+                and rest_response_cache.ttl(path_url) is not None
+                and method == RESTMethod.GET
+                and not is_auth_required
+                and not return_err
+                and data is None):
+            return await rest_response_cache.get_or_request(
+                endpoint=path_url, url=url, params=params, request=send_request)
+        return await send_request()
+
+    def _get_rest_response_cache(self) -> Optional[RESTResponseCache]:
+        # Created on first use, once the connector is fully initialized
+        if self._rest_response_cache_enabled and self._rest_response_cache is None:
+            self._rest_response_cache = RESTResponseCache(
+                cache_path=os.path.join(data_path(), "rest_cache", type(self).__name__),
+                ttls=self.rest_response_cache_ttls)
+        return self._rest_response_cache
 
     async def _status_polling_loop_fetch_updates(self):
         """
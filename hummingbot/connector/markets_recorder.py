@@ -5,7 +5,7 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -15,7 +15,7 @@ from hummingbot.client.config.client_config_map import MarketDataCollectionConfi
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.event_forwarder import BufferedEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
@@ -84,34 +84,24 @@ class MarketsRecorder:
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
 
-        self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
-        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
-        self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
-        self._fail_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fail_order)
-        self._complete_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_complete_order)
-        self._expire_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_expire_order)
-        self._funding_payment_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_complete_funding_payment)
-        self._update_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_update_range_position)
-        self._close_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_close_position)
-
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.OrderFailure, self._fail_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_order_forwarder),
-            (MarketEvent.OrderExpired, self._expire_order_forwarder),
-            (MarketEvent.FundingPaymentCompleted, self._funding_payment_forwarder),
-            (MarketEvent.RangePositionLiquidityAdded, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionLiquidityRemoved, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionFeeCollected, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionClosed, self._close_range_position_forwarder),
-        ]
+        self._event_handlers: Dict[MarketEvent, Callable[[int, ConnectorBase, Any], None]] = {
+            MarketEvent.BuyOrderCreated: self._did_create_order,
+            MarketEvent.SellOrderCreated: self._did_create_order,
+            MarketEvent.OrderFilled: self._did_fill_order,
+            MarketEvent.OrderCancelled: self._did_cancel_order,
+            MarketEvent.OrderFailure: self._did_fail_order,
+            MarketEvent.BuyOrderCompleted: self._did_complete_order,
+            MarketEvent.SellOrderCompleted: self._did_complete_order,
+            MarketEvent.OrderExpired: self._did_expire_order,
+            MarketEvent.FundingPaymentCompleted: self._did_complete_funding_payment,
+            MarketEvent.RangePositionLiquidityAdded: self._did_update_range_position,
+            MarketEvent.RangePositionLiquidityRemoved: self._did_update_range_position,
+            MarketEvent.RangePositionFeeCollected: self._did_update_range_position,
+            MarketEvent.RangePositionClosed: self._did_close_position,
+        }
+        # A single buffered forwarder for all the events, so that they are recorded in the order they were triggered
+        # (e.g. an order creation before its fills), without blocking the connector code paths triggering them
+        self._event_forwarder: BufferedEventForwarder = BufferedEventForwarder(self._did_trigger_event, self._ev_loop)
 
     def _start_market_data_recording(self):
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
@@ -130,6 +120,7 @@ class MarketsRecorder:
                                     best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
                                     order_book = market.get_order_book(trading_pair)
                                     depth = self._market_data_collection_config.market_data_collection_depth + 1
+                                    bids_array, asks_array = order_book.snapshot_arrays(depth)
                                     market_data = MarketData(
                                         timestamp=self.db_timestamp,
                                         exchange=exchange,
@@ -138,8 +129,10 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": [[price, amount, int(update_id)]
+                                                    for price, amount, update_id in bids_array.tolist()],
+                                            "ask": [[price, amount, int(update_id)]
+                                                    for price, amount, update_id in asks_array.tolist()]}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -167,15 +160,16 @@ class MarketsRecorder:
 
     def start(self):
         for market in self._markets:
-            for event_pair in self._event_pairs:
-                market.add_listener(event_pair[0], event_pair[1])
+            for event in self._event_handlers.keys():
+                market.add_listener(event, self._event_forwarder)
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
 
     def stop(self):
         for market in self._markets:
-            for event_pair in self._event_pairs:
-                market.remove_listener(event_pair[0], event_pair[1])
+            for event in self._event_handlers.keys():
+                market.remove_listener(event, self._event_forwarder)
+        self._event_forwarder.flush()
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
 
@@ -239,6 +233,9 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _did_trigger_event(self, event_tag: int, market: ConnectorBase, evt: Any):
+        self._event_handlers[self.market_event_tag_map[event_tag]](event_tag, market, evt)
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
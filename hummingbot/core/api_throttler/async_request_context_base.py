@@ -2,12 +2,15 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_REQUEST_PRIORITY, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
 from hummingbot.logger.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.core.api_throttler.priority_scheduler import PriorityRequestScheduler
+
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
@@ -15,7 +18,6 @@ MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
-    It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -28,67 +30,99 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 limit_windows: Dict[str, RateLimitWindow],
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
-                 lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
+                 scheduler: Optional["PriorityRequestScheduler"] = None,
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param limit_windows: Shared sliding windows of the capacity used on each rate limit, by limit ID
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
-        :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param safety_margin_pct: Percentage of the rate limit periods added as a safety margin
+        :param retry_interval: Not used anymore, waiting requests are woken up when the capacity they need is freed
+        :param priority: The priority lane of this API request
+        :param scheduler: Scheduler giving the capacity out to the waiting requests by priority. Without it, waiting
+            requests take the capacity as soon as it is freed, in no particular order
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._limit_windows: Dict[str, RateLimitWindow] = limit_windows
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
-        self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._scheduler: Optional["PriorityRequestScheduler"] = scheduler
+        self._acquired_at: Optional[float] = None
+
+    @property
+    def rate_limit(self) -> Optional[RateLimit]:
+        return self._rate_limit
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    @property
+    def acquired_at(self) -> Optional[float]:
+        """
+        :return: the time the request was logged in the rate limits windows, None until the capacity is acquired
+        """
+        return self._acquired_at
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        now = self._time()
+        for window in self._limit_windows.values():
+            window.flush(now)
+
+    @property
+    @abstractmethod
+    def windows(self) -> List[RateLimitWindow]:
+        """
+        :return: the windows of all the rate limits of the request
+        """
+        raise NotImplementedError
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def wait_time(self) -> float:
+        """
+        :return: the time until all the rate limits of the request have capacity for it, 0 if they already have
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def log_task(self):
+        """
+        Logs the request in the windows of all its rate limits
+        """
+        raise NotImplementedError
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-
-            # Log its related limits into the tasks log as individual tasks
-            for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+        if self._scheduler is not None:
+            await self._scheduler.acquire(self)
+            return
+        # The capacity check and the logging of the request run without awaiting in between, no lock is needed
+        while not self.within_capacity():
+            await asyncio.sleep(self.wait_time())
+        self.log_task()
 
     async def __aenter__(self):
         await self.acquire()
+        return self
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
+
+    def _time(self) -> float:
+        return time.time()
@@ -1,13 +1,24 @@
-import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_REQUEST_PRIORITY,
+    RateLimit,
+    RateLimitUsageHeader,
+    RequestPriority,
+)
+from hummingbot.core.api_throttler.priority_scheduler import (
+    PRIORITY_AGING_INTERVAL,
+    LaneWaitStats,
+    PriorityRequestScheduler,
+)
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -30,7 +41,9 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_aging_interval: float = PRIORITY_AGING_INTERVAL,
+                 usage_headers: Optional[List[RateLimitUsageHeader]] = None,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -39,22 +52,25 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_aging_interval: A request waiting for capacity is promoted by one priority lane for every
+            period of this length (in seconds) it has waited, so that low priority requests are not starved
+        :param usage_headers: Response headers in which the exchange reports the capacity used on the rate limits. The
+            capacity used seen by the throttler is aligned with them (see process_response_headers)
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
         self.limits_pct: Decimal = share_percentage / 100
 
-        self.set_rate_limits(rate_limits)
-
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
-
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
-        self._lock = asyncio.Lock()
+        # Sliding windows of the capacity used on each rate limit, by limit ID
+        self._limit_windows: Dict[str, RateLimitWindow] = {}
+        self._scheduler = PriorityRequestScheduler(aging_interval=priority_aging_interval)
+        self._usage_headers: List[RateLimitUsageHeader] = usage_headers or []
+
+        self.set_rate_limits(rate_limits)
 
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
@@ -66,6 +82,72 @@ class AsyncThrottlerBase(ABC):
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
 
+        # The windows are updated in place: the requests already logged still count against the new limits, and the
+        # requests waiting for capacity see the new limits
+        for limit_id in set(self._limit_windows.keys()) - set(self._id_to_limit_map.keys()):
+            del self._limit_windows[limit_id]
+        for rate_limit in self._rate_limits:
+            window: Optional[RateLimitWindow] = self._limit_windows.get(rate_limit.limit_id)
+            if window is None:
+                self._limit_windows[rate_limit.limit_id] = RateLimitWindow(rate_limit, self._safety_margin_pct)
+            else:
+                window.set_rate_limit(rate_limit, self._safety_margin_pct)
+
+    @property
+    def priority_lane_stats(self) -> Dict[RequestPriority, LaneWaitStats]:
+        """
+        :return: the wait time statistics of the requests, by priority lane
+        """
+        return self._scheduler.lane_stats
+
+    def process_response_headers(self,
+                                 headers: Optional[Mapping[str, str]],
+                                 request_context: AsyncRequestContextBase):
+        """
+        Aligns the capacity used on the rate limits with the usage reported by the exchange in the headers of the
+        response to a request. The static rate limits and the safety margin are conservative: this lets the throttler
+        use the capacity the exchange actually has left, and back off early when another process uses the same key.
+        :param headers: the headers of the response
+        :param request_context: the throttler context the request was sent in
+        """
+        if len(self._usage_headers) == 0 or headers is None or request_context.acquired_at is None:
+            return
+        for usage_header in self._usage_headers:
+            value = headers.get(usage_header.header)
+            limit_id = usage_header.limit_id or (None if request_context.rate_limit is None
+                                                 else request_context.rate_limit.limit_id)
+            window: Optional[RateLimitWindow] = self._limit_windows.get(limit_id)
+            if value is None or window is None:
+                continue
+            try:
+                reported_capacity = int(float(value))
+            except ValueError:
+                self.logger().debug(f"Invalid value for the rate limit usage header {usage_header.header}: {value}")
+                continue
+            if usage_header.reports_remaining:
+                reported_capacity = int(window.rate_limit.limit) - reported_capacity
+            self.reconcile_usage(limit_id=limit_id,
+                                 sent_at=request_context.acquired_at,
+                                 reported_capacity_used=max(0, reported_capacity))
+
+    def reconcile_usage(self, limit_id: str, sent_at: float, reported_capacity_used: int):
+        """
+        Aligns the capacity used on a rate limit with the usage reported by the exchange for a request sent at
+        `sent_at` (see RateLimitWindow.reconcile). The waiting requests are served if capacity was freed.
+        """
+        window: Optional[RateLimitWindow] = self._limit_windows.get(limit_id)
+        if window is not None:
+            window.reconcile(now=time.time(), sent_at=sent_at, reported_capacity_used=reported_capacity_used)
+            self._scheduler.dispatch()
+
+    def merge_usage(self, limit_id: str, requests: List[Tuple[float, int]]):
+        """
+        Adds requests logged elsewhere (timestamps and weights) to the capacity used on a rate limit
+        """
+        window: Optional[RateLimitWindow] = self._limit_windows.get(limit_id)
+        if window is not None:
+            window.merge(now=time.time(), requests=requests)
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
@@ -86,5 +168,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: RequestPriority = DEFAULT_REQUEST_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,20 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(Enum):
+    """
+    Priority lanes of the API requests. When requests wait for the capacity of a rate limit, it is given out to the
+    lanes in this order (the lower the value, the higher the priority).
+    """
+    CANCEL = 1
+    CREATE = 2
+    PRIVATE_QUERY = 3
+    PUBLIC_DATA = 4
+
+
+DEFAULT_REQUEST_PRIORITY = RequestPriority.PRIVATE_QUERY
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -50,7 +65,11 @@ class RateLimit:
 
 
 @dataclass
-class TaskLog:
-    timestamp: float
-    rate_limit: RateLimit
-    weight: int
+class RateLimitUsageHeader:
+    """
+    Response header in which the exchange reports the capacity used on a rate limit (or the capacity remaining when
+    `reports_remaining` is set). Without a limit_id, the header refers to the rate limit of the request itself.
+    """
+    header: str
+    limit_id: Optional[str] = None
+    reports_remaining: bool = False
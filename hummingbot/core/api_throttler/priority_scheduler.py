@@ -0,0 +1,176 @@
+import asyncio
+import itertools
+import math
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
+
+if TYPE_CHECKING:
+    from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+
+# A waiting request is promoted by one priority lane for every period of this length (in seconds) it has waited
+PRIORITY_AGING_INTERVAL = 1.0
+
+
+class LaneWaitStats:
+    """
+    Wait time statistics of the requests of a priority lane.
+    """
+
+    def __init__(self):
+        self._requests = 0
+        self._delayed_requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def delayed_requests(self) -> int:
+        return self._delayed_requests
+
+    @property
+    def total_wait(self) -> float:
+        return self._total_wait
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    @property
+    def mean_wait(self) -> float:
+        return self._total_wait / self._requests if self._requests > 0 else 0.0
+
+    def add(self, wait: float):
+        self._requests += 1
+        if wait > 0:
+            self._delayed_requests += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "delayed_requests": self._delayed_requests,
+            "mean_wait": self.mean_wait,
+            "max_wait": self._max_wait,
+        }
+
+
+class _Waiter:
+    __slots__ = ("context", "windows", "rank", "enqueued_at", "sequence", "future")
+
+    def __init__(self,
+                 context: "AsyncRequestContextBase",
+                 enqueued_at: float,
+                 sequence: int,
+                 future: asyncio.Future):
+        self.context = context
+        self.windows: List[RateLimitWindow] = context.windows
+        self.rank: int = context.priority.value
+        self.enqueued_at = enqueued_at
+        self.sequence = sequence
+        self.future = future
+
+
+class PriorityRequestScheduler:
+    """
+    Gives the capacity of the rate limits out to the waiting requests by priority lane.
+
+    A request takes the capacity right away only if no other request waits on any of its rate limits. Otherwise it is
+    queued, and each time capacity is freed the waiting requests are served from the highest priority lane down, first
+    come first served within a lane. A request that cannot be served blocks the lower priority requests sharing any of
+    its rate limits, so that they do not use up the capacity it waits for. Requests on unrelated rate limits are not
+    affected.
+
+    To prevent starvation, a waiting request is promoted by one lane for every `aging_interval` seconds it has waited.
+    """
+
+    def __init__(self, aging_interval: float = PRIORITY_AGING_INTERVAL):
+        self._aging_interval = aging_interval
+        self._waiters: List[_Waiter] = []
+        self._waiting_windows: Counter = Counter()
+        self._sequence = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._lane_stats: Dict[RequestPriority, LaneWaitStats] = {priority: LaneWaitStats()
+                                                                  for priority in RequestPriority}
+
+    @property
+    def lane_stats(self) -> Dict[RequestPriority, LaneWaitStats]:
+        return self._lane_stats
+
+    @property
+    def waiting_requests(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, context: "AsyncRequestContextBase"):
+        if (not any(window in self._waiting_windows for window in context.windows)
+                and context.within_capacity()):
+            context.log_task()
+            self._lane_stats[context.priority].add(0.0)
+            return
+
+        waiter = _Waiter(context=context,
+                         enqueued_at=self._time(),
+                         sequence=next(self._sequence),
+                         future=asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        self._waiting_windows.update(waiter.windows)
+        self.dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if self._remove_waiter(waiter):
+                # The request might have been blocking others
+                self.dispatch()
+            raise
+        self._lane_stats[context.priority].add(self._time() - waiter.enqueued_at)
+
+    def dispatch(self):
+        """
+        Serves the waiting requests the capacity allows. Call it when capacity is freed outside of the scheduler.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+
+        now = self._time()
+        blocked_windows: Set[RateLimitWindow] = set()
+        next_wake_up = math.inf
+        for waiter in sorted(self._waiters, key=lambda w: self._waiter_key(w, now)):
+            if waiter.future.done():
+                self._remove_waiter(waiter)
+            elif any(window in blocked_windows for window in waiter.windows):
+                continue
+            elif waiter.context.within_capacity():
+                waiter.context.log_task()
+                self._remove_waiter(waiter)
+                waiter.future.set_result(None)
+            else:
+                blocked_windows.update(waiter.windows)
+                next_wake_up = min(next_wake_up, waiter.context.wait_time())
+
+        if len(self._waiters) > 0 and next_wake_up < math.inf:
+            self._wake_up_handle = asyncio.get_event_loop().call_later(next_wake_up, self.dispatch)
+
+    def _waiter_key(self, waiter: _Waiter, now: float):
+        promotions = int((now - waiter.enqueued_at) / self._aging_interval)
+        return max(0, waiter.rank - promotions), waiter.enqueued_at, waiter.sequence
+
+    def _remove_waiter(self, waiter: _Waiter) -> bool:
+        if waiter not in self._waiters:
+            return False
+        self._waiters.remove(waiter)
+        self._waiting_windows.subtract(waiter.windows)
+        for window in waiter.windows:
+            if self._waiting_windows[window] <= 0:
+                del self._waiting_windows[window]
+        return True
+
+    def _time(self) -> float:
+        return time.time()
@@ -0,0 +1,136 @@
+from collections import deque
+from typing import Deque, Iterable, List, Tuple
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Epoch timestamps have a float resolution below the microsecond. Entries are kept in the window up to this long after
+# their expiry, so that float rounding never lets a request through before the rate limit period has elapsed.
+TIMESTAMP_TOLERANCE = 1e-6
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity used on a rate limit: the timestamps and weights of the requests logged within the
+    rate limit period (extended by the safety margin), in chronological order, and their running total.
+
+    Expired requests are dropped from the front of the window, so checking the capacity is O(1) amortized.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self._timestamps: Deque[float] = deque()
+        self._weights: Deque[int] = deque()
+        self._capacity_used: int = 0
+        self.set_rate_limit(rate_limit, safety_margin_pct)
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def length(self) -> float:
+        return self._length
+
+    def set_rate_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        Replaces the rate limit, the requests already logged count against the new one.
+        """
+        self._rate_limit = rate_limit
+        self._length = rate_limit.time_interval * (1 + safety_margin_pct)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def flush(self, now: float):
+        """
+        Removes the requests logged before the window
+        """
+        expiry = now - self._length - TIMESTAMP_TOLERANCE
+        timestamps = self._timestamps
+        while len(timestamps) > 0 and timestamps[0] < expiry:
+            timestamps.popleft()
+            self._capacity_used -= self._weights.popleft()
+
+    def capacity_used(self, now: float) -> int:
+        self.flush(now)
+        return self._capacity_used
+
+    def has_capacity(self, now: float, weight: int) -> bool:
+        self.flush(now)
+        return self._capacity_used + weight <= self._rate_limit.limit
+
+    def wait_time(self, now: float, weight: int) -> float:
+        """
+        :return: the time until enough requests leave the window for a new request of the given weight to fit, 0 if it
+            fits already
+        """
+        self.flush(now)
+        capacity_to_free = self._capacity_used + weight - self._rate_limit.limit
+        if capacity_to_free <= 0:
+            return 0.0
+        freed_capacity = 0
+        for timestamp, logged_weight in zip(self._timestamps, self._weights):
+            freed_capacity += logged_weight
+            if freed_capacity >= capacity_to_free:
+                return timestamp + self._length + TIMESTAMP_TOLERANCE - now
+        # The request is heavier than the limit, check again once the window is empty
+        return self._length
+
+    def logged_requests(self, now: float) -> List[Tuple[float, int]]:
+        """
+        :return: the timestamps and weights of the requests in the window, in chronological order
+        """
+        self.flush(now)
+        return list(zip(self._timestamps, self._weights))
+
+    def merge(self, now: float, requests: Iterable[Tuple[float, int]]):
+        """
+        Adds requests logged elsewhere (e.g. by another process) to the window, keeping it in chronological order
+        """
+        merged = sorted(self.logged_requests(now) + [(timestamp, weight) for timestamp, weight in requests])
+        self._timestamps = deque(timestamp for timestamp, _ in merged)
+        self._weights = deque(weight for _, weight in merged)
+        self._capacity_used = sum(self._weights)
+        self.flush(now)
+
+    def log(self, timestamp: float, weight: int):
+        """
+        Logs a request. Requests must be logged in chronological order.
+        """
+        self._timestamps.append(timestamp)
+        self._weights.append(weight)
+        self._capacity_used += weight
+
+    def reconcile(self, now: float, sent_at: float, reported_capacity_used: int):
+        """
+        Aligns the window with the capacity used reported by the exchange in the response to a request sent at
+        `sent_at`. The difference with the capacity used by the requests logged up to `sent_at` is added as a request
+        logged at `sent_at`, or removed from the oldest requests. The requests logged after `sent_at` are not accounted
+        in the report and are left untouched.
+        """
+        self.flush(now)
+        later_timestamps: List[float] = []
+        later_weights: List[int] = []
+        while len(self._timestamps) > 0 and self._timestamps[-1] > sent_at:
+            later_timestamps.append(self._timestamps.pop())
+            later_weights.append(self._weights.pop())
+        later_capacity_used = sum(later_weights)
+
+        difference = reported_capacity_used - (self._capacity_used - later_capacity_used)
+        if difference > 0:
+            self._timestamps.append(sent_at)
+            self._weights.append(difference)
+            self._capacity_used += difference
+        else:
+            capacity_to_free = -difference
+            while capacity_to_free > 0 and len(self._timestamps) > 0:
+                freed_capacity = min(self._weights[0], capacity_to_free)
+                if freed_capacity == self._weights[0]:
+                    self._timestamps.popleft()
+                    self._weights.popleft()
+                else:
+                    self._weights[0] -= freed_capacity
+                self._capacity_used -= freed_capacity
+                capacity_to_free -= freed_capacity
+
+        self._timestamps.extend(reversed(later_timestamps))
+        self._weights.extend(reversed(later_weights))
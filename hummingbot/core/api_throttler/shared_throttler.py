@@ -0,0 +1,379 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_REQUEST_PRIORITY, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.priority_scheduler import PRIORITY_AGING_INTERVAL
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Attempts to connect to the broker (electing a new one if needed), before falling back to local throttling
+BROKER_CONNECTION_ATTEMPTS = 20
+BROKER_CONNECTION_RETRY_INTERVAL = 0.1
+# Time during which the throttler uses local throttling, after failing to connect to the broker
+LOCAL_FALLBACK_DURATION = 10.0
+
+st_logger = None
+
+
+def shared_throttler_socket_path(group: str, connector_name: str, domain: str, rate_limits: List[RateLimit]) -> str:
+    """
+    :return: the path of the UNIX socket of the broker sharing the rate limits of a connector within a group of bots.
+        The path includes the domain and a digest of the rate limits, so that only the bots using the same limits on
+        the same exchange share a broker.
+    """
+    limits = sorted([rate_limit.limit_id,
+                     rate_limit.limit,
+                     rate_limit.time_interval,
+                     rate_limit.weight,
+                     sorted([linked_limit.limit_id, linked_limit.weight] for linked_limit in rate_limit.linked_limits)]
+                    for rate_limit in rate_limits)
+    limits_digest = hashlib.sha256(json.dumps(limits).encode()).hexdigest()[:12]
+    key = "_".join(part for part in (group, connector_name, domain, limits_digest) if part)
+    return os.path.join(tempfile.gettempdir(), f"hummingbot_throttler_{key}.sock")
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message).encode() + b"\n"
+
+
+class SharedThrottlerBroker:
+    """
+    Gives the capacity of a set of rate limits out to the throttlers of several processes of the same host, through a
+    UNIX socket. The capacity is given out by an AsyncThrottler, by priority lane and first come first served across
+    all the processes, so they share the budget without a static split.
+
+    The protocol uses one JSON message per line:
+    - {"op": "acquire", "id": <int>, "limit_id": <str>, "priority": <str>}, answered with {"id": <int>} once granted
+    - {"op": "cancel", "id": <int>} cancels a pending acquire
+    - {"op": "reconcile", "limit_id": <str>, "sent_at": <float>, "used": <int>} reports the usage seen by the exchange
+    - {"op": "merge", "requests": {<limit_id>: [[<timestamp>, <weight>], ...]}} adds requests logged elsewhere, sent by
+      the throttlers reconnecting after the previous broker exited
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 socket_path: str,
+                 priority_aging_interval: float = PRIORITY_AGING_INTERVAL):
+        self._socket_path = socket_path
+        self._throttler = AsyncThrottler(rate_limits=rate_limits, priority_aging_interval=priority_aging_interval)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global st_logger
+        if st_logger is None:
+            st_logger = logging.getLogger(__name__)
+        return st_logger
+
+    @property
+    def throttler(self) -> AsyncThrottler:
+        return self._throttler
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Left behind by a broker that exited
+            os.unlink(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self._socket_path)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        pending_acquires: Dict[int, asyncio.Task] = {}
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if len(line) == 0:
+                    break
+                message = json.loads(line)
+                operation = message["op"]
+                if operation == "acquire":
+                    pending_acquires[message["id"]] = safe_ensure_future(
+                        self._acquire(message, writer, pending_acquires))
+                elif operation == "cancel":
+                    task = pending_acquires.pop(message["id"], None)
+                    if task is not None:
+                        task.cancel()
+                elif operation == "reconcile":
+                    self._throttler.reconcile_usage(limit_id=message["limit_id"],
+                                                    sent_at=message["sent_at"],
+                                                    reported_capacity_used=message["used"])
+                elif operation == "merge":
+                    for limit_id, requests in message["requests"].items():
+                        self._throttler.merge_usage(limit_id=limit_id,
+                                                    requests=[(timestamp, weight) for timestamp, weight in requests])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error in a shared throttler broker connection.", exc_info=True)
+        finally:
+            # The capacity still waited for by an exited process is not needed anymore
+            for task in pending_acquires.values():
+                task.cancel()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _acquire(self, message: Dict[str, Any], writer: asyncio.StreamWriter,
+                       pending_acquires: Dict[int, asyncio.Task]):
+        try:
+            async with self._throttler.execute_task(limit_id=message["limit_id"],
+                                                    priority=RequestPriority[message["priority"]]):
+                pass
+            if not writer.is_closing():
+                writer.write(_encode({"id": message["id"]}))
+        finally:
+            pending_acquires.pop(message["id"], None)
+
+
+class SharedRequestContext(AsyncRequestContext):
+    """
+    Async context requesting the capacity from the broker of the group. The request is also logged in the local
+    windows, which keep track of the capacity used by this process.
+    """
+
+    def __init__(self, *args, throttler: "SharedAsyncThrottler", limit_id: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._throttler = throttler
+        self._limit_id = limit_id
+
+    async def acquire(self):
+        if self._rate_limit is None:
+            await super().acquire()
+            return
+        start = self._time()
+        try:
+            await self._throttler.acquire_shared_capacity(limit_id=self._limit_id, priority=self._priority)
+        except ConnectionError:
+            await super().acquire()
+            return
+        self.log_task()
+        self._throttler.priority_lane_stats[self._priority].add(self._time() - start)
+
+    def log_task(self):
+        super().log_task()
+        self._throttler.log_own_request(
+            timestamp=self._acquired_at,
+            limits=[(window.rate_limit.limit_id, weight) for window, weight in self._windows_and_weights])
+
+
+class SharedAsyncThrottler(AsyncThrottlerBase):
+    """
+    Throttler sharing the capacity of the rate limits with the throttlers of other processes of the same host, e.g.
+    bots trading with the same API keys. The throttlers of a group use the same socket path. The first one to need
+    capacity becomes the broker of the group (see SharedThrottlerBroker), elected through a lock on a file next to the
+    socket, and the others request capacity from it. When the broker process exits, the remaining throttlers elect a
+    new one and send it the requests they sent themselves, so that the recent usage is not forgotten. If no broker can
+    be reached, or the platform does not support the file locks electing it, the throttler falls back to local
+    throttling.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 socket_path: str,
+                 priority_aging_interval: float = PRIORITY_AGING_INTERVAL,
+                 **kwargs):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param socket_path: Path of the UNIX socket of the broker of the group
+        :param priority_aging_interval: See AsyncThrottlerBase
+        """
+        super().__init__(rate_limits, priority_aging_interval=priority_aging_interval, **kwargs)
+        self._socket_path = socket_path
+        self._priority_aging_interval = priority_aging_interval
+        self._broker: Optional[SharedThrottlerBroker] = None
+        self._lock_file: Optional[IO] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._connection_lock: Optional[asyncio.Lock] = None
+        self._has_been_connected = False
+        self._local_fallback_until = 0.0
+        self._pending_acquires: Dict[int, asyncio.Future] = {}
+        self._request_ids = itertools.count()
+        # Requests sent by this process, without the account wide usage reconciled from the exchange reports, which
+        # every process of the group knows about
+        self._own_request_windows: Dict[str, RateLimitWindow] = {}
+
+    @property
+    def is_broker(self) -> bool:
+        return self._broker is not None
+
+    def execute_task(self, limit_id: str, priority: RequestPriority = DEFAULT_REQUEST_PRIORITY) -> SharedRequestContext:
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SharedRequestContext(
+            limit_windows=self._limit_windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            priority=priority,
+            scheduler=self._scheduler,
+            throttler=self,
+            limit_id=limit_id,
+        )
+
+    async def acquire_shared_capacity(self, limit_id: str, priority: RequestPriority):
+        """
+        Waits until the broker grants the capacity for a request. Raises ConnectionError if no broker can be reached.
+        """
+        while True:
+            writer = await self._ensure_connection()
+            request_id = next(self._request_ids)
+            future = asyncio.get_event_loop().create_future()
+            self._pending_acquires[request_id] = future
+            try:
+                writer.write(_encode({"op": "acquire", "id": request_id, "limit_id": limit_id, "priority": priority.name}))
+                await future
+                return
+            except ConnectionError:
+                # The broker exited, request the capacity from the next one
+                continue
+            except asyncio.CancelledError:
+                if not writer.is_closing():
+                    writer.write(_encode({"op": "cancel", "id": request_id}))
+                raise
+            finally:
+                self._pending_acquires.pop(request_id, None)
+
+    def log_own_request(self, timestamp: float, limits: List[Tuple[str, int]]):
+        """
+        Logs a request sent by this process, to be merged into the usage of the next broker of the group
+        """
+        for limit_id, weight in limits:
+            window = self._own_request_windows.get(limit_id)
+            if window is None:
+                window = RateLimitWindow(self._id_to_limit_map[limit_id], self._safety_margin_pct)
+                self._own_request_windows[limit_id] = window
+            window.log(timestamp, weight)
+
+    def reconcile_usage(self, limit_id: str, sent_at: float, reported_capacity_used: int):
+        super().reconcile_usage(limit_id=limit_id, sent_at=sent_at, reported_capacity_used=reported_capacity_used)
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.write(_encode({"op": "reconcile",
+                                        "limit_id": limit_id,
+                                        "sent_at": sent_at,
+                                        "used": reported_capacity_used}))
+
+    async def close(self):
+        """
+        Disconnects from the broker, and stops it if this throttler is the broker of the group
+        """
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._broker is not None:
+            await self._broker.stop()
+            self._broker = None
+        if self._lock_file is not None:
+            import fcntl
+
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def _ensure_connection(self) -> asyncio.StreamWriter:
+        if self._writer is not None and not self._writer.is_closing():
+            return self._writer
+        if self._connection_lock is None:
+            self._connection_lock = asyncio.Lock()
+        async with self._connection_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return self._writer
+            if time.time() < self._local_fallback_until:
+                raise ConnectionError("The shared throttler broker is not reachable.")
+            if not self._broker_election_supported():
+                self._local_fallback_until = float("inf")
+                SharedThrottlerBroker.logger().warning(
+                    "Sharing the rate limits between processes is not supported on this platform, using local rate "
+                    "limits.")
+                raise ConnectionError("The shared throttler is not supported on this platform.")
+            for _ in range(BROKER_CONNECTION_ATTEMPTS):
+                if self._broker is None and self._acquire_broker_lock():
+                    self._broker = SharedThrottlerBroker(rate_limits=self._rate_limits,
+                                                         socket_path=self._socket_path,
+                                                         priority_aging_interval=self._priority_aging_interval)
+                    await self._broker.start()
+                try:
+                    reader, writer = await asyncio.open_unix_connection(self._socket_path)
+                except (FileNotFoundError, ConnectionRefusedError):
+                    await asyncio.sleep(BROKER_CONNECTION_RETRY_INTERVAL)
+                    continue
+                if self._has_been_connected:
+                    # The previous broker exited, the new one does not know about the requests sent meanwhile
+                    now = time.time()
+                    writer.write(_encode({"op": "merge",
+                                          "requests": {limit_id: window.logged_requests(now)
+                                                       for limit_id, window in self._own_request_windows.items()}}))
+                self._has_been_connected = True
+                self._writer = writer
+                self._read_task = safe_ensure_future(self._read_responses(reader, writer))
+                return writer
+            self._local_fallback_until = time.time() + LOCAL_FALLBACK_DURATION
+            SharedThrottlerBroker.logger().warning(
+                f"Could not connect to the shared throttler broker at {self._socket_path}, using local rate limits "
+                f"for the next {LOCAL_FALLBACK_DURATION:g} seconds.")
+        raise ConnectionError(f"Could not connect to the shared throttler broker at {self._socket_path}.")
+
+    @staticmethod
+    def _broker_election_supported() -> bool:
+        # The broker is elected through a file lock, not available on Windows
+        try:
+            import fcntl  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _acquire_broker_lock(self) -> bool:
+        import fcntl
+
+        lock_file = open(f"{self._socket_path}.lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    async def _read_responses(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if len(line) == 0:
+                    break
+                future = self._pending_acquires.get(json.loads(line)["id"])
+                if future is not None and not future.done():
+                    future.set_result(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            SharedThrottlerBroker.logger().error("Unexpected error reading from the shared throttler broker.",
+                                                 exc_info=True)
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            writer.close()
+            for future in self._pending_acquires.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("The connection to the shared throttler broker was lost."))
@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_tick_interval
+        object _tick_requested
+        double _last_tick_time
+        list _tick_triggers
+        list _readiness_triggers
+        list _readiness_tasks
+        long long _triggered_ticks
+        long long _merged_tick_requests
+        object _tick_profiler
@@ -3,11 +3,17 @@
 import asyncio
 import logging
 import time
-from typing import List
+from enum import Enum
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.tick_profiler import TickProfiler
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +27,18 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_tick_interval: float = 0.1):
         """
-        :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param clock_mode: real time mode, event driven mode or back testing mode
+        :param tick_size: time interval of each tick. In event driven mode, the longest interval between two ticks
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_tick_interval: (event driven mode only) shortest interval between two ticks
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +48,15 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_tick_interval = min_tick_interval
+        self._tick_requested = asyncio.Event()
+        self._last_tick_time = 0.0
+        self._tick_triggers = []
+        self._readiness_triggers = []
+        self._readiness_tasks = []
+        self._triggered_ticks = 0
+        self._merged_tick_requests = 0
+        self._tick_profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +78,96 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def min_tick_interval(self) -> float:
+        return self._min_tick_interval
+
+    @property
+    def triggered_ticks(self) -> int:
+        """
+        Number of ticks run ahead of the tick size cadence because a trigger fired.
+        """
+        return self._triggered_ticks
+
+    @property
+    def merged_tick_requests(self) -> int:
+        """
+        Number of tick requests merged into a tick that was already pending.
+        """
+        return self._merged_tick_requests
+
+    @property
+    def tick_profiler(self) -> Optional[TickProfiler]:
+        """
+        The tick durations, overrunning and missed ticks and scheduling drift recorded since the profiling was enabled,
+        None when it is disabled.
+        """
+        return self._tick_profiler
+
+    def enable_tick_profiling(self):
+        if self._tick_profiler is None:
+            self._tick_profiler = TickProfiler(self._tick_size)
+
+    def disable_tick_profiling(self):
+        self._tick_profiler = None
+
+    def request_tick(self):
+        """
+        Wakes the clock up for an early tick in event driven mode, no sooner than min_tick_interval after the last
+        one. All the requests arriving before that tick runs are merged into it.
+        """
+        if self._clock_mode is not ClockMode.EVENT_DRIVEN:
+            return
+        if self._tick_requested.is_set():
+            self._merged_tick_requests += 1
+        else:
+            self._tick_requested.set()
+
+    def add_tick_trigger(self, publisher: PubSub, event_tag: Enum):
+        """
+        Requests a tick every time the publisher triggers the event. Adding the same trigger again has no effect.
+        """
+        for trigger in self._tick_triggers:
+            if trigger[0] is publisher and trigger[1] == event_tag:
+                return
+        forwarder = EventForwarder(lambda _: self.request_tick())
+        publisher.add_listener(event_tag, forwarder)
+        # The publisher only keeps weak references to its listeners
+        self._tick_triggers.append((publisher, event_tag, forwarder))
+
+    def remove_tick_trigger(self, publisher: PubSub, event_tag: Enum):
+        for trigger in list(self._tick_triggers):
+            if trigger[0] is publisher and trigger[1] == event_tag:
+                publisher.remove_listener(event_tag, trigger[2])
+                self._tick_triggers.remove(trigger)
+
+    def add_readiness_trigger(self, iterator: Any):
+        """
+        Requests a tick as soon as the iterator (usually a connector) becomes ready. When it has order books, their
+        best price updates become tick triggers from then on. The iterator is no longer watched once it is ready.
+        """
+        self._readiness_triggers.append(iterator)
+        if self._started and self._clock_mode is ClockMode.EVENT_DRIVEN:
+            self._readiness_tasks.append(safe_ensure_future(self._wait_for_readiness(iterator)))
+
+    def add_connector_triggers(self, connector: Any):
+        """
+        Registers the usual triggers of a connector: its order fills, the moment it becomes ready, and the best price
+        updates of its order books.
+        """
+        self.add_tick_trigger(connector, MarketEvent.OrderFilled)
+        self.add_readiness_trigger(connector)
+
+    async def _wait_for_readiness(self, iterator: Any):
+        while not iterator.ready:
+            await asyncio.sleep(self._min_tick_interval)
+        order_books: Dict[str, PubSub] = getattr(iterator, "order_books", {})
+        for order_book in order_books.values():
+            self.add_tick_trigger(order_book, OrderBookEvent.BestPriceUpdateEvent)
+        if iterator in self._readiness_triggers:
+            self._readiness_triggers.remove(iterator)
+        self.request_tick()
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +201,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start = 0
+            double iterator_start = 0
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -100,6 +213,9 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        if self._clock_mode is ClockMode.EVENT_DRIVEN:
+            self._readiness_tasks = [safe_ensure_future(self._wait_for_readiness(iterator))
+                                     for iterator in self._readiness_triggers]
 
         try:
             while True:
@@ -109,12 +225,21 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if self._clock_mode is ClockMode.EVENT_DRIVEN:
+                    next_tick_time = await self._wait_for_next_tick(next_tick_time)
+                else:
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                profiler = self._tick_profiler
+                if profiler is not None:
+                    profiler.record_wake_up(next_tick_time, time.time())
+                    tick_start = time.perf_counter()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +247,45 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+                if profiler is not None:
+                    profiler.record_tick(time.perf_counter() - tick_start)
         finally:
+            for task in self._readiness_tasks:
+                task.cancel()
+            self._readiness_tasks = []
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _wait_for_next_tick(self, next_tick_time: float) -> float:
+        """
+        Waits for a tick request or, at the latest, for the next tick of the tick size cadence.
+
+        :return: the timestamp of the tick to run
+        """
+        try:
+            await asyncio.wait_for(self._tick_requested.wait(), timeout=max(next_tick_time - time.time(), 0))
+        except asyncio.TimeoutError:
+            self._tick_requested.clear()
+            self._last_tick_time = next_tick_time
+            return next_tick_time
+
+        # Keep the ticks spaced, the requests arriving meanwhile are merged into this tick
+        earliest_tick_time = self._last_tick_time + self._min_tick_interval
+        if time.time() < earliest_tick_time:
+            await asyncio.sleep(earliest_tick_time - time.time())
+        self._tick_requested.clear()
+        self._triggered_ticks += 1
+        self._last_tick_time = time.time()
+        return self._last_tick_time
+
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tick_start = 0
+            double iterator_start = 0
 
         if not self._started:
             for ci in self._child_iterators:
@@ -139,14 +296,23 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
+                profiler = self._tick_profiler
+                if profiler is not None:
+                    tick_start = time.perf_counter()
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+                if profiler is not None:
+                    profiler.record_tick(time.perf_counter() - tick_start)
         except StopIteration:
             return
         finally:
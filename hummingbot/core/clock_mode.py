@@ -6,3 +6,5 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    # Real time, ticking early when a registered trigger fires, and at least every tick size otherwise
+    EVENT_DRIVEN = 3
@@ -0,0 +1,289 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <cmath>
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->root = -1;
+    this->seed = 2463534242u;
+}
+
+uint32_t OrderBookDepthIndex::nextPriority() {
+    // xorshift32, the priorities only need to be well spread, not unpredictable.
+    this->seed ^= this->seed << 13;
+    this->seed ^= this->seed >> 17;
+    this->seed ^= this->seed << 5;
+    return this->seed;
+}
+
+int32_t OrderBookDepthIndex::newNode(double price, double amount) {
+    int32_t node;
+    if (!this->freeNodes.empty()) {
+        node = this->freeNodes.back();
+        this->freeNodes.pop_back();
+    } else {
+        node = (int32_t) this->nodes.size();
+        this->nodes.push_back(Node());
+    }
+    Node &n = this->nodes[node];
+    n.price = price;
+    n.amount = amount;
+    n.baseSum = amount;
+    n.quoteSum = amount * price;
+    n.priority = this->nextPriority();
+    n.left = n.right = -1;
+    return node;
+}
+
+void OrderBookDepthIndex::freeTree(int32_t node) {
+    if (node == -1) {
+        return;
+    }
+    this->freeTree(this->nodes[node].left);
+    this->freeTree(this->nodes[node].right);
+    this->freeNodes.push_back(node);
+}
+
+void OrderBookDepthIndex::pull(int32_t node) {
+    Node &n = this->nodes[node];
+    n.baseSum = n.amount;
+    n.quoteSum = n.amount * n.price;
+    if (n.left != -1) {
+        n.baseSum += this->nodes[n.left].baseSum;
+        n.quoteSum += this->nodes[n.left].quoteSum;
+    }
+    if (n.right != -1) {
+        n.baseSum += this->nodes[n.right].baseSum;
+        n.quoteSum += this->nodes[n.right].quoteSum;
+    }
+}
+
+void OrderBookDepthIndex::pullTree(int32_t node) {
+    if (node == -1) {
+        return;
+    }
+    this->pullTree(this->nodes[node].left);
+    this->pullTree(this->nodes[node].right);
+    this->pull(node);
+}
+
+void OrderBookDepthIndex::split(int32_t node, double price, bool inclusive, int32_t &left, int32_t &right) {
+    // Splits the tree into the levels below price (or at and below price if inclusive) and the rest.
+    if (node == -1) {
+        left = right = -1;
+        return;
+    }
+    int32_t subLeft, subRight;
+    Node &n = this->nodes[node];
+    if (inclusive ? n.price <= price : n.price < price) {
+        this->split(n.right, price, inclusive, subLeft, subRight);
+        n.right = subLeft;
+        this->pull(node);
+        left = node;
+        right = subRight;
+    } else {
+        this->split(n.left, price, inclusive, subLeft, subRight);
+        n.left = subRight;
+        this->pull(node);
+        left = subLeft;
+        right = node;
+    }
+}
+
+int32_t OrderBookDepthIndex::merge(int32_t left, int32_t right) {
+    // All the prices in left must be lower than the prices in right.
+    if (left == -1) {
+        return right;
+    }
+    if (right == -1) {
+        return left;
+    }
+    if (this->nodes[left].priority > this->nodes[right].priority) {
+        int32_t merged = this->merge(this->nodes[left].right, right);
+        this->nodes[left].right = merged;
+        this->pull(left);
+        return left;
+    }
+    int32_t merged = this->merge(left, this->nodes[right].left);
+    this->nodes[right].left = merged;
+    this->pull(right);
+    return right;
+}
+
+void OrderBookDepthIndex::clear() {
+    this->nodes.clear();
+    this->freeNodes.clear();
+    this->root = -1;
+}
+
+void OrderBookDepthIndex::rebuild(const std::set<OrderBookEntry> &book) {
+    // Builds the treap from the sorted book in O(n), keeping the rightmost path on a stack.
+    std::vector<int32_t> rightPath;
+    this->clear();
+    this->nodes.reserve(book.size());
+    for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it) {
+        int32_t node = this->newNode(it->getPrice(), it->getAmount());
+        int32_t lastPopped = -1;
+        while (!rightPath.empty() && this->nodes[rightPath.back()].priority < this->nodes[node].priority) {
+            lastPopped = rightPath.back();
+            rightPath.pop_back();
+        }
+        this->nodes[node].left = lastPopped;
+        if (!rightPath.empty()) {
+            this->nodes[rightPath.back()].right = node;
+        }
+        rightPath.push_back(node);
+    }
+    this->root = rightPath.empty() ? -1 : rightPath.front();
+    this->pullTree(this->root);
+}
+
+void OrderBookDepthIndex::setLevel(const double &price, const double &amount) {
+    int32_t below, rest, level, above;
+    this->split(this->root, price, false, below, rest);
+    this->split(rest, price, true, level, above);
+    this->freeTree(level);
+    level = amount > 0 ? this->newNode(price, amount) : -1;
+    this->root = this->merge(this->merge(below, level), above);
+}
+
+void OrderBookDepthIndex::eraseBelow(const double &price) {
+    int32_t below, rest;
+    this->split(this->root, price, false, below, rest);
+    this->freeTree(below);
+    this->root = rest;
+}
+
+void OrderBookDepthIndex::eraseAbove(const double &price) {
+    int32_t rest, above;
+    this->split(this->root, price, true, rest, above);
+    this->freeTree(above);
+    this->root = rest;
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->nodes.size() - this->freeNodes.size();
+}
+
+double OrderBookDepthIndex::getTotalBase() const {
+    return this->root == -1 ? 0 : this->nodes[this->root].baseSum;
+}
+
+double OrderBookDepthIndex::getTotalQuote() const {
+    return this->root == -1 ? 0 : this->nodes[this->root].quoteSum;
+}
+
+bool OrderBookDepthIndex::findLevel(const int &isBuy, const bool &quote, const double &target,
+                                    double &price, double &amount, double &baseBefore, double &quoteBefore) const {
+    // Finds the first level, in walking order, at which the cumulative base (or quote) volume reaches target.
+    // baseBefore and quoteBefore receive the cumulative volumes of the levels walked before it.
+    int32_t node = this->root;
+    baseBefore = quoteBefore = 0;
+    while (node != -1) {
+        const Node &n = this->nodes[node];
+        int32_t first = isBuy ? n.left : n.right;
+        int32_t second = isBuy ? n.right : n.left;
+        double firstBase = first == -1 ? 0 : this->nodes[first].baseSum;
+        double firstQuote = first == -1 ? 0 : this->nodes[first].quoteSum;
+        double walked = quote ? quoteBefore : baseBefore;
+        if (first != -1 && walked + (quote ? firstQuote : firstBase) >= target) {
+            node = first;
+            continue;
+        }
+        baseBefore += firstBase;
+        quoteBefore += firstQuote;
+        walked = quote ? quoteBefore : baseBefore;
+        if (walked + (quote ? n.amount * n.price : n.amount) >= target) {
+            price = n.price;
+            amount = n.amount;
+            return true;
+        }
+        baseBefore += n.amount;
+        quoteBefore += n.amount * n.price;
+        node = second;
+    }
+    return false;
+}
+
+void OrderBookDepthIndex::sumToPrice(const int &isBuy, const double &limitPrice,
+                                     double &lastPrice, double &baseSum, double &quoteSum) const {
+    // Sums the levels walked before reaching a price worse than limitPrice.
+    int32_t node = this->root;
+    baseSum = quoteSum = 0;
+    lastPrice = nan("");
+    while (node != -1) {
+        const Node &n = this->nodes[node];
+        int32_t walkedFirst = isBuy ? n.left : n.right;
+        if (isBuy ? n.price <= limitPrice : n.price >= limitPrice) {
+            if (walkedFirst != -1) {
+                baseSum += this->nodes[walkedFirst].baseSum;
+                quoteSum += this->nodes[walkedFirst].quoteSum;
+            }
+            baseSum += n.amount;
+            quoteSum += n.amount * n.price;
+            lastPrice = n.price;
+            node = isBuy ? n.right : n.left;
+        } else {
+            node = walkedFirst;
+        }
+    }
+}
+
+void OrderBookDepthIndex::getPriceForVolume(const int &isBuy, const double &volume,
+                                            double &resultPrice, double &resultVolume) const {
+    double price, amount, baseBefore, quoteBefore;
+    if (this->findLevel(isBuy, false, volume, price, amount, baseBefore, quoteBefore)) {
+        resultPrice = price;
+        resultVolume = std::min(baseBefore + amount, volume);
+    } else {
+        resultPrice = nan("");
+        resultVolume = std::min(baseBefore, volume);
+    }
+}
+
+void OrderBookDepthIndex::getVwapForVolume(const int &isBuy, const double &volume,
+                                           double &resultVwap, double &resultVolume) const {
+    double price, amount, baseBefore, quoteBefore;
+    if (this->findLevel(isBuy, false, volume, price, amount, baseBefore, quoteBefore)) {
+        const double incrementalAmount = volume - baseBefore;
+        const double totalVolume = baseBefore + incrementalAmount;
+        resultVwap = (quoteBefore + incrementalAmount * price) / totalVolume;
+        resultVolume = std::min(totalVolume, volume);
+    } else {
+        resultVwap = nan("");
+        resultVolume = std::min(baseBefore, volume);
+    }
+}
+
+void OrderBookDepthIndex::getPriceForQuoteVolume(const int &isBuy, const double &quoteVolume,
+                                                 double &resultPrice, double &resultVolume) const {
+    double price, amount, baseBefore, quoteBefore;
+    if (this->findLevel(isBuy, true, quoteVolume, price, amount, baseBefore, quoteBefore)) {
+        resultPrice = price;
+        resultVolume = std::min(quoteBefore + amount * price, quoteVolume);
+    } else {
+        resultPrice = nan("");
+        resultVolume = std::min(quoteBefore, quoteVolume);
+    }
+}
+
+void OrderBookDepthIndex::getQuoteVolumeForBaseAmount(const int &isBuy, const double &baseAmount,
+                                                      double &resultQuoteVolume) const {
+    double price, amount, baseBefore, quoteBefore;
+    if (this->findLevel(isBuy, false, baseAmount, price, amount, baseBefore, quoteBefore)) {
+        resultQuoteVolume = quoteBefore + (baseAmount - baseBefore) * price;
+    } else {
+        resultQuoteVolume = quoteBefore;
+    }
+}
+
+void OrderBookDepthIndex::getVolumeForPrice(const int &isBuy, const double &price,
+                                            double &resultPrice, double &resultVolume) const {
+    double quoteSum;
+    this->sumToPrice(isBuy, price, resultPrice, resultVolume, quoteSum);
+}
+
+void OrderBookDepthIndex::getQuoteVolumeForPrice(const int &isBuy, const double &price,
+                                                 double &resultPrice, double &resultVolume) const {
+    double baseSum;
+    this->sumToPrice(isBuy, price, resultPrice, baseSum, resultVolume);
+}
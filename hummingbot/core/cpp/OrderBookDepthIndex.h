@@ -0,0 +1,68 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stdint.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Cumulative base/quote depth index over one side of an order book.
+//
+// The levels are kept in a treap keyed by price, where every node also stores the base amount and quote volume of
+// its subtree. Updates and volume queries run in O(log n), walking from the lowest price (isBuy, i.e. the ask book)
+// or from the highest price (bid book). Nodes live in a contiguous pool and are recycled through a free list.
+class OrderBookDepthIndex {
+    struct Node {
+        double price;
+        double amount;
+        double baseSum;
+        double quoteSum;
+        uint32_t priority;
+        int32_t left;
+        int32_t right;
+    };
+
+    std::vector<Node> nodes;
+    std::vector<int32_t> freeNodes;
+    int32_t root;
+    uint32_t seed;
+
+    uint32_t nextPriority();
+    int32_t newNode(double price, double amount);
+    void freeTree(int32_t node);
+    void pull(int32_t node);
+    void pullTree(int32_t node);
+    void split(int32_t node, double price, bool inclusive, int32_t &left, int32_t &right);
+    int32_t merge(int32_t left, int32_t right);
+    bool findLevel(const int &isBuy, const bool &quote, const double &target,
+                   double &price, double &amount, double &baseBefore, double &quoteBefore) const;
+    void sumToPrice(const int &isBuy, const double &limitPrice,
+                    double &lastPrice, double &baseSum, double &quoteSum) const;
+
+    public:
+        OrderBookDepthIndex();
+
+        void clear();
+        void rebuild(const std::set<OrderBookEntry> &book);
+        void setLevel(const double &price, const double &amount);
+        void eraseBelow(const double &price);
+        void eraseAbove(const double &price);
+        size_t size() const;
+        double getTotalBase() const;
+        double getTotalQuote() const;
+
+        void getPriceForVolume(const int &isBuy, const double &volume,
+                               double &resultPrice, double &resultVolume) const;
+        void getVwapForVolume(const int &isBuy, const double &volume,
+                              double &resultVwap, double &resultVolume) const;
+        void getPriceForQuoteVolume(const int &isBuy, const double &quoteVolume,
+                                    double &resultPrice, double &resultVolume) const;
+        void getQuoteVolumeForBaseAmount(const int &isBuy, const double &baseAmount,
+                                         double &resultQuoteVolume) const;
+        void getVolumeForPrice(const int &isBuy, const double &price,
+                               double &resultPrice, double &resultVolume) const;
+        void getQuoteVolumeForPrice(const int &isBuy, const double &price,
+                                    double &resultPrice, double &resultVolume) const;
+};
+
+#endif
@@ -0,0 +1,90 @@
+#ifndef _ORDER_BOOK_DEPTH_WALK_H
+#define _ORDER_BOOK_DEPTH_WALK_H
+
+// Depth walks shared by the order book implementations. Iterator walks the levels of one side in walking order (from
+// the best price outwards) and must point to OrderBookEntry-like objects providing getPrice() and getAmount().
+
+template <typename Iterator>
+void walkPriceForVolume(Iterator it, Iterator end, const double &volume,
+                        double &resultPrice, double &cumulativeVolume) {
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount();
+        if (cumulativeVolume >= volume) {
+            resultPrice = it->getPrice();
+            break;
+        }
+    }
+}
+
+template <typename Iterator>
+void walkVwapForVolume(Iterator it, Iterator end, const double &volume,
+                       double &resultVwap, double &totalVolume) {
+    double totalCost = 0;
+    for (; it != end; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        totalCost += amount * price;
+        totalVolume += amount;
+        if (totalVolume >= volume) {
+            // Only take the part of the last level that is needed to fill the volume.
+            totalCost -= amount * price;
+            totalVolume -= amount;
+            const double incrementalAmount = volume - totalVolume;
+            totalCost += incrementalAmount * price;
+            totalVolume += incrementalAmount;
+            resultVwap = totalCost / totalVolume;
+            break;
+        }
+    }
+}
+
+template <typename Iterator>
+void walkPriceForQuoteVolume(Iterator it, Iterator end, const double &quoteVolume,
+                             double &resultPrice, double &cumulativeVolume) {
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount() * it->getPrice();
+        if (cumulativeVolume >= quoteVolume) {
+            resultPrice = it->getPrice();
+            break;
+        }
+    }
+}
+
+template <typename Iterator>
+void walkQuoteVolumeForBaseAmount(Iterator it, Iterator end, const double &baseAmount,
+                                  double &cumulativeVolume) {
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        double rowAmount = it->getAmount();
+        if (rowAmount + cumulativeBaseAmount >= baseAmount) {
+            rowAmount = baseAmount - cumulativeBaseAmount;
+        }
+        cumulativeBaseAmount += rowAmount;
+        cumulativeVolume += rowAmount * it->getPrice();
+        if (cumulativeBaseAmount >= baseAmount) {
+            break;
+        }
+    }
+}
+
+template <typename Iterator, typename BeyondPrice>
+void walkVolumeForPrice(Iterator it, Iterator end, const double &price, const bool &quote,
+                        BeyondPrice beyondPrice, double &resultPrice, double &cumulativeVolume) {
+    for (; it != end; ++it) {
+        if (beyondPrice(it->getPrice(), price)) {
+            break;
+        }
+        cumulativeVolume += quote ? it->getAmount() * it->getPrice() : it->getAmount();
+        resultPrice = it->getPrice();
+    }
+}
+
+inline bool aboveLimit(double levelPrice, double limitPrice) {
+    return levelPrice > limitPrice;
+}
+
+inline bool belowLimit(double levelPrice, double limitPrice) {
+    return levelPrice < limitPrice;
+}
+
+#endif
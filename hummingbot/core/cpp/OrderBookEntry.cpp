@@ -1,5 +1,8 @@
 #include "OrderBookEntry.h"
+#include "OrderBookDepthWalk.h"
 #include <iostream>
+#include <algorithm>
+#include <cmath>
 
 OrderBookEntry::OrderBookEntry() {
     this->price = this->amount = 0;
@@ -90,3 +93,71 @@ double OrderBookEntry::getAmount() const {
 int64_t OrderBookEntry::getUpdateId() const {
     return this->updateId;
 }
+
+void getPriceForVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &volume,
+                       double &resultPrice, double &resultVolume) {
+    double cumulativeVolume = 0;
+    resultPrice = nan("");
+    if (isBuy) {
+        walkPriceForVolume(book.begin(), book.end(), volume, resultPrice, cumulativeVolume);
+    } else {
+        walkPriceForVolume(book.rbegin(), book.rend(), volume, resultPrice, cumulativeVolume);
+    }
+    resultVolume = std::min(cumulativeVolume, volume);
+}
+
+void getVwapForVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &volume,
+                      double &resultVwap, double &resultVolume) {
+    double totalVolume = 0;
+    resultVwap = nan("");
+    if (isBuy) {
+        walkVwapForVolume(book.begin(), book.end(), volume, resultVwap, totalVolume);
+    } else {
+        walkVwapForVolume(book.rbegin(), book.rend(), volume, resultVwap, totalVolume);
+    }
+    resultVolume = std::min(totalVolume, volume);
+}
+
+void getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &quoteVolume,
+                            double &resultPrice, double &resultVolume) {
+    double cumulativeVolume = 0;
+    resultPrice = nan("");
+    if (isBuy) {
+        walkPriceForQuoteVolume(book.begin(), book.end(), quoteVolume, resultPrice, cumulativeVolume);
+    } else {
+        walkPriceForQuoteVolume(book.rbegin(), book.rend(), quoteVolume, resultPrice, cumulativeVolume);
+    }
+    resultVolume = std::min(cumulativeVolume, quoteVolume);
+}
+
+void getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, const int &isBuy, const double &baseAmount,
+                                 double &resultQuoteVolume) {
+    resultQuoteVolume = 0;
+    if (isBuy) {
+        walkQuoteVolumeForBaseAmount(book.begin(), book.end(), baseAmount, resultQuoteVolume);
+    } else {
+        walkQuoteVolumeForBaseAmount(book.rbegin(), book.rend(), baseAmount, resultQuoteVolume);
+    }
+}
+
+void getVolumeForPrice(const std::set<OrderBookEntry> &book, const int &isBuy, const double &price,
+                       double &resultPrice, double &resultVolume) {
+    resultPrice = nan("");
+    resultVolume = 0;
+    if (isBuy) {
+        walkVolumeForPrice(book.begin(), book.end(), price, false, aboveLimit, resultPrice, resultVolume);
+    } else {
+        walkVolumeForPrice(book.rbegin(), book.rend(), price, false, belowLimit, resultPrice, resultVolume);
+    }
+}
+
+void getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, const int &isBuy, const double &price,
+                            double &resultPrice, double &resultVolume) {
+    resultPrice = nan("");
+    resultVolume = 0;
+    if (isBuy) {
+        walkVolumeForPrice(book.begin(), book.end(), price, true, aboveLimit, resultPrice, resultVolume);
+    } else {
+        walkVolumeForPrice(book.rbegin(), book.rend(), price, true, belowLimit, resultPrice, resultVolume);
+    }
+}
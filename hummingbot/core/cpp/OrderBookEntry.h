@@ -25,4 +25,19 @@ class OrderBookEntry {
         int64_t getUpdateId() const;
 };
 
+// Depth walks over one side of the book. A buy walks the ask book from the lowest price upwards, a sell walks the
+// bid book from the highest price downwards. Results are written to the output references, no allocation is done.
+void getPriceForVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &volume,
+                       double &resultPrice, double &resultVolume);
+void getVwapForVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &volume,
+                      double &resultVwap, double &resultVolume);
+void getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, const int &isBuy, const double &quoteVolume,
+                            double &resultPrice, double &resultVolume);
+void getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, const int &isBuy, const double &baseAmount,
+                                 double &resultQuoteVolume);
+void getVolumeForPrice(const std::set<OrderBookEntry> &book, const int &isBuy, const double &price,
+                       double &resultPrice, double &resultVolume);
+void getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, const int &isBuy, const double &price,
+                            double &resultPrice, double &resultVolume);
+
 #endif
@@ -0,0 +1,371 @@
+#include "TickLadder.h"
+#include "OrderBookDepthWalk.h"
+#include <algorithm>
+#include <cmath>
+
+TickLadder::const_iterator::const_iterator() {
+    this->ladder = NULL;
+    this->index = -1;
+}
+
+TickLadder::const_iterator::const_iterator(const TickLadder *ladder, int64_t index,
+                                           OverflowLevels::const_iterator overflowIt) {
+    this->ladder = ladder;
+    this->index = index;
+    this->overflowIt = overflowIt;
+}
+
+TickLadder::const_iterator &TickLadder::const_iterator::operator++() {
+    // The window is walked first, then the overflow from its first level.
+    if (this->index != this->ladder->windowEnd()) {
+        this->index = this->ladder->nextIndex(this->index);
+    } else {
+        ++this->overflowIt;
+    }
+    return *this;
+}
+
+bool TickLadder::const_iterator::operator!=(const const_iterator &other) const {
+    return this->index != other.index || this->overflowIt != other.overflowIt;
+}
+
+bool TickLadder::const_iterator::operator==(const const_iterator &other) const {
+    return this->index == other.index && this->overflowIt == other.overflowIt;
+}
+
+const OrderBookEntry &TickLadder::const_iterator::operator*() const {
+    if (this->index != this->ladder->windowEnd()) {
+        return this->ladder->slots[this->index];
+    }
+    return *this->overflowIt;
+}
+
+const OrderBookEntry *TickLadder::const_iterator::operator->() const {
+    return &**this;
+}
+
+bool TickLadder::WalkingOrder::operator()(const OrderBookEntry &a, const OrderBookEntry &b) const {
+    return this->descending ? b < a : a < b;
+}
+
+TickLadder::TickLadder() : overflow(WalkingOrder{false}) {
+    this->tickSize = 1;
+    this->baseTick = 0;
+    this->bestIndex = -1;
+    this->margin = 0;
+    this->levelCount = 0;
+    this->descending = false;
+    this->anchored = false;
+}
+
+void TickLadder::configure(const double &tickSize, const int64_t &windowTicks, const int &descending) {
+    this->tickSize = tickSize;
+    this->descending = descending != 0;
+    // Room left between the best price and the window edge, so that an improving price rarely shifts the window.
+    this->margin = windowTicks / 8;
+    this->slots.assign(windowTicks, OrderBookEntry());
+    this->overflow = OverflowLevels(WalkingOrder{this->descending});
+    this->bestIndex = -1;
+    this->levelCount = 0;
+    this->anchored = false;
+}
+
+void TickLadder::clear() {
+    std::fill(this->slots.begin(), this->slots.end(), OrderBookEntry());
+    this->overflow.clear();
+    this->bestIndex = -1;
+    this->levelCount = 0;
+    this->anchored = false;
+}
+
+int64_t TickLadder::windowSize() const {
+    return (int64_t) this->slots.size();
+}
+
+int64_t TickLadder::windowEnd() const {
+    // End sentinel of the window walk.
+    return this->descending ? -1 : this->windowSize();
+}
+
+int64_t TickLadder::nextIndex(int64_t index) const {
+    // Next occupied slot in walking order, or the end sentinel (-1 for bids, windowSize() for asks).
+    const int64_t step = this->descending ? -1 : 1;
+    const int64_t end = this->windowEnd();
+    index += step;
+    while (index != end && this->slots[index].getAmount() <= 0) {
+        index += step;
+    }
+    return index;
+}
+
+bool TickLadder::isBetter(int64_t index, int64_t otherIndex) const {
+    return this->descending ? index > otherIndex : index < otherIndex;
+}
+
+int64_t TickLadder::tickOf(const double &price) const {
+    return (int64_t) llround(price / this->tickSize);
+}
+
+bool TickLadder::isOnGrid(const double &price) const {
+    return isOnTickGrid(price, this->tickSize);
+}
+
+void TickLadder::anchorAt(int64_t tick) {
+    // Places tick as the best price, margin slots away from the window edge on the improving side.
+    this->baseTick = this->descending ? tick - (this->windowSize() - 1 - this->margin) : tick - this->margin;
+    this->anchored = true;
+}
+
+void TickLadder::shiftTo(int64_t newBaseTick) {
+    // The window only moves towards the best price when a better price arrives, so the levels leaving it are always
+    // deeper than the ones it keeps, and go to the overflow.
+    const int64_t delta = newBaseTick - this->baseTick;
+    const int64_t window = this->windowSize();
+    if (delta == 0) {
+        return;
+    }
+    const int64_t leavingBegin = delta >= window || -delta >= window ? 0 : (delta > 0 ? 0 : window + delta);
+    const int64_t leavingEnd = delta >= window || -delta >= window ? window : (delta > 0 ? delta : window);
+    for (int64_t i = leavingBegin; i < leavingEnd; ++i) {
+        if (this->slots[i].getAmount() > 0) {
+            this->overflow.insert(this->slots[i]);
+            this->slots[i] = OrderBookEntry();
+            this->levelCount--;
+        }
+    }
+    if (delta > 0 && delta < window) {
+        std::copy(this->slots.begin() + delta, this->slots.end(), this->slots.begin());
+        std::fill(this->slots.end() - delta, this->slots.end(), OrderBookEntry());
+    } else if (delta < 0 && -delta < window) {
+        std::copy_backward(this->slots.begin(), this->slots.end() + delta, this->slots.end());
+        std::fill(this->slots.begin(), this->slots.begin() - delta, OrderBookEntry());
+    }
+    this->baseTick = newBaseTick;
+    if (this->bestIndex != -1) {
+        this->bestIndex -= delta;
+        if (this->bestIndex < 0 || this->bestIndex >= window || this->slots[this->bestIndex].getAmount() <= 0) {
+            this->bestIndex = this->nextIndex(this->descending ? window : -1);
+        }
+    }
+    if (this->levelCount == 0 || this->bestIndex == this->windowEnd()) {
+        this->bestIndex = -1;
+    }
+    this->pullOverflowLevels();
+}
+
+void TickLadder::setOverflowLevel(const OrderBookEntry &entry) {
+    // std::set::insert() keeps the existing entry, the level is replaced instead.
+    this->overflow.erase(entry);
+    if (entry.getAmount() > 0) {
+        this->overflow.insert(entry);
+    }
+}
+
+void TickLadder::pullOverflowLevels() {
+    // Moves the overflow levels the window covers back into it. They are the first ones in walking order.
+    while (!this->overflow.empty()) {
+        const int64_t index = this->tickOf(this->overflow.begin()->getPrice()) - this->baseTick;
+        if (index < 0 || index >= this->windowSize()) {
+            break;
+        }
+        this->slots[index] = *this->overflow.begin();
+        this->overflow.erase(this->overflow.begin());
+        this->levelCount++;
+        if (this->bestIndex == -1 || this->isBetter(index, this->bestIndex)) {
+            this->bestIndex = index;
+        }
+    }
+}
+
+void TickLadder::setLevel(const OrderBookEntry &entry) {
+    const double amount = entry.getAmount();
+    const int64_t tick = this->tickOf(entry.getPrice());
+    const int64_t window = this->windowSize();
+    if (!this->anchored) {
+        if (amount <= 0) {
+            return;
+        }
+        this->anchorAt(tick);
+    }
+
+    int64_t index = tick - this->baseTick;
+    if (index < 0 || index >= window) {
+        if (this->descending ? index < 0 : index >= window) {
+            // Deeper than the window can hold.
+            this->setOverflowLevel(entry);
+            return;
+        }
+        if (amount <= 0) {
+            return;
+        }
+        this->shiftTo(this->descending ? tick - (window - 1 - this->margin) : tick - this->margin);
+        index = tick - this->baseTick;
+    }
+
+    OrderBookEntry &slot = this->slots[index];
+    const bool occupied = slot.getAmount() > 0;
+    if (amount > 0) {
+        slot = entry;
+        if (!occupied) {
+            this->levelCount++;
+        }
+        if (this->bestIndex == -1 || this->isBetter(index, this->bestIndex)) {
+            this->bestIndex = index;
+        }
+    } else if (occupied) {
+        if (index == this->bestIndex) {
+            this->popBest();
+        } else {
+            slot = OrderBookEntry();
+            this->levelCount--;
+        }
+    }
+
+    // Slide the window back when the best price has drifted deep into it. Only empty slots are discarded.
+    if (this->bestIndex != -1) {
+        if (!this->descending && this->bestIndex > window / 2) {
+            this->shiftTo(this->baseTick + this->bestIndex - this->margin);
+        } else if (this->descending && this->bestIndex < window / 2) {
+            this->shiftTo(this->baseTick + this->bestIndex - (window - 1 - this->margin));
+        }
+    }
+}
+
+void TickLadder::reset(const double &bestPrice) {
+    this->clear();
+    this->anchorAt(this->tickOf(bestPrice));
+}
+
+void TickLadder::insertLevel(const OrderBookEntry &entry) {
+    // Snapshot insertion, the first entry for a price wins like std::set::insert().
+    if (entry.getAmount() <= 0) {
+        return;
+    }
+    if (this->anchored) {
+        const int64_t index = this->tickOf(entry.getPrice()) - this->baseTick;
+        if (index >= 0 && index < this->windowSize() && this->slots[index].getAmount() > 0) {
+            return;
+        }
+        if (this->overflow.count(entry) > 0) {
+            return;
+        }
+    }
+    this->setLevel(entry);
+}
+
+void TickLadder::popBest() {
+    if (this->bestIndex == -1) {
+        return;
+    }
+    this->slots[this->bestIndex] = OrderBookEntry();
+    this->levelCount--;
+    this->bestIndex = this->nextIndex(this->bestIndex);
+    if (this->bestIndex == this->windowEnd()) {
+        this->bestIndex = -1;
+        if (!this->overflow.empty()) {
+            // The window is empty, it moves to the best overflow level.
+            this->anchorAt(this->tickOf(this->overflow.begin()->getPrice()));
+            this->pullOverflowLevels();
+        }
+    }
+}
+
+const OrderBookEntry &TickLadder::best() const {
+    return this->slots[this->bestIndex];
+}
+
+bool TickLadder::empty() const {
+    return this->bestIndex == -1;
+}
+
+size_t TickLadder::size() const {
+    return this->levelCount + this->overflow.size();
+}
+
+size_t TickLadder::getOverflowLevels() const {
+    return this->overflow.size();
+}
+
+double TickLadder::getTickSize() const {
+    return this->tickSize;
+}
+
+TickLadder::const_iterator TickLadder::begin() const {
+    // The overflow is only used once the window holds levels, an empty window means an empty ladder.
+    if (this->bestIndex == -1) {
+        return this->end();
+    }
+    return const_iterator(this, this->bestIndex, this->overflow.begin());
+}
+
+TickLadder::const_iterator TickLadder::end() const {
+    return const_iterator(this, this->windowEnd(), this->overflow.end());
+}
+
+void TickLadder::getPriceForVolume(const double &volume, double &resultPrice, double &resultVolume) const {
+    double cumulativeVolume = 0;
+    resultPrice = nan("");
+    walkPriceForVolume(this->begin(), this->end(), volume, resultPrice, cumulativeVolume);
+    resultVolume = std::min(cumulativeVolume, volume);
+}
+
+void TickLadder::getVwapForVolume(const double &volume, double &resultVwap, double &resultVolume) const {
+    double totalVolume = 0;
+    resultVwap = nan("");
+    walkVwapForVolume(this->begin(), this->end(), volume, resultVwap, totalVolume);
+    resultVolume = std::min(totalVolume, volume);
+}
+
+void TickLadder::getPriceForQuoteVolume(const double &quoteVolume, double &resultPrice, double &resultVolume) const {
+    double cumulativeVolume = 0;
+    resultPrice = nan("");
+    walkPriceForQuoteVolume(this->begin(), this->end(), quoteVolume, resultPrice, cumulativeVolume);
+    resultVolume = std::min(cumulativeVolume, quoteVolume);
+}
+
+void TickLadder::getQuoteVolumeForBaseAmount(const double &baseAmount, double &resultQuoteVolume) const {
+    resultQuoteVolume = 0;
+    walkQuoteVolumeForBaseAmount(this->begin(), this->end(), baseAmount, resultQuoteVolume);
+}
+
+void TickLadder::getVolumeForPrice(const double &price, double &resultPrice, double &resultVolume) const {
+    resultPrice = nan("");
+    resultVolume = 0;
+    walkVolumeForPrice(this->begin(), this->end(), price, false,
+                       this->descending ? belowLimit : aboveLimit, resultPrice, resultVolume);
+}
+
+void TickLadder::getQuoteVolumeForPrice(const double &price, double &resultPrice, double &resultVolume) const {
+    resultPrice = nan("");
+    resultVolume = 0;
+    walkVolumeForPrice(this->begin(), this->end(), price, true,
+                       this->descending ? belowLimit : aboveLimit, resultPrice, resultVolume);
+}
+
+bool isOnTickGrid(const double &price, const double &tickSize) {
+    // The tolerance only absorbs the rounding of the division, so that 30000.001 is not on a 1.0 grid.
+    const double ticks = price / tickSize;
+    return std::fabs(ticks - std::round(ticks)) <= 1e-9 + std::fabs(ticks) * 1e-12;
+}
+
+void truncateOverlapLevels(TickLadder &bidLadder, TickLadder &askLadder, const int &dex) {
+    // Same resolution rules as truncateOverlapEntries() in OrderBookEntry.cpp.
+    while (!bidLadder.empty() && !askLadder.empty()) {
+        const OrderBookEntry &topBid = bidLadder.best();
+        const OrderBookEntry &topAsk = askLadder.best();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            bidWins = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (bidWins) {
+            askLadder.popBest();
+        } else {
+            bidLadder.popBest();
+        }
+    }
+}
@@ -0,0 +1,86 @@
+#ifndef _TICK_LADDER_H
+#define _TICK_LADDER_H
+
+#include <stdint.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// One side of a tick indexed order book.
+//
+// Levels are stored in a contiguous array indexed by price tick, covering a window of windowTicks ticks that slides
+// with the best price. An empty slot has a zero amount. Levels deeper than the window are kept in an ordered set, the
+// overflow, and moved back into the window when it slides towards them. Iteration walks from the best price outwards:
+// upwards for asks, downwards for bids, through the window and then through the overflow.
+class TickLadder {
+    // Orders the overflow levels in walking order.
+    struct WalkingOrder {
+        bool descending;
+        bool operator()(const OrderBookEntry &a, const OrderBookEntry &b) const;
+    };
+    typedef std::set<OrderBookEntry, WalkingOrder> OverflowLevels;
+
+    std::vector<OrderBookEntry> slots;
+    OverflowLevels overflow;
+    double tickSize;
+    int64_t baseTick;
+    int64_t bestIndex;
+    int64_t margin;
+    size_t levelCount;
+    bool descending;
+    bool anchored;
+
+    int64_t windowSize() const;
+    int64_t windowEnd() const;
+    int64_t nextIndex(int64_t index) const;
+    bool isBetter(int64_t index, int64_t otherIndex) const;
+    void anchorAt(int64_t tick);
+    void shiftTo(int64_t newBaseTick);
+    void setOverflowLevel(const OrderBookEntry &entry);
+    void pullOverflowLevels();
+
+    public:
+        class const_iterator {
+            const TickLadder *ladder;
+            int64_t index;
+            OverflowLevels::const_iterator overflowIt;
+
+            public:
+                const_iterator();
+                const_iterator(const TickLadder *ladder, int64_t index, OverflowLevels::const_iterator overflowIt);
+                const_iterator &operator++();
+                bool operator!=(const const_iterator &other) const;
+                bool operator==(const const_iterator &other) const;
+                const OrderBookEntry &operator*() const;
+                const OrderBookEntry *operator->() const;
+        };
+
+        TickLadder();
+        void configure(const double &tickSize, const int64_t &windowTicks, const int &descending);
+        void clear();
+        void reset(const double &bestPrice);
+        int64_t tickOf(const double &price) const;
+        bool isOnGrid(const double &price) const;
+        void setLevel(const OrderBookEntry &entry);
+        void insertLevel(const OrderBookEntry &entry);
+        void popBest();
+        const OrderBookEntry &best() const;
+        bool empty() const;
+        size_t size() const;
+        size_t getOverflowLevels() const;
+        double getTickSize() const;
+        const_iterator begin() const;
+        const_iterator end() const;
+
+        void getPriceForVolume(const double &volume, double &resultPrice, double &resultVolume) const;
+        void getVwapForVolume(const double &volume, double &resultVwap, double &resultVolume) const;
+        void getPriceForQuoteVolume(const double &quoteVolume, double &resultPrice, double &resultVolume) const;
+        void getQuoteVolumeForBaseAmount(const double &baseAmount, double &resultQuoteVolume) const;
+        void getVolumeForPrice(const double &price, double &resultPrice, double &resultVolume) const;
+        void getQuoteVolumeForPrice(const double &price, double &resultPrice, double &resultVolume) const;
+};
+
+bool isOnTickGrid(const double &price, const double &tickSize);
+void truncateOverlapLevels(TickLadder &bidLadder, TickLadder &askLadder, const int &dex);
+
+#endif
@@ -0,0 +1,29 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        void clear()
+        void rebuild(const set[OrderBookEntry] &book)
+        void setLevel(const double &price, const double &amount)
+        void eraseBelow(const double &price)
+        void eraseAbove(const double &price)
+        size_t size() const
+        double getTotalBase() const
+        double getTotalQuote() const
+        void getPriceForVolume(const bint &is_buy, const double &volume,
+                               double &result_price, double &result_volume) const
+        void getVwapForVolume(const bint &is_buy, const double &volume,
+                              double &result_vwap, double &result_volume) const
+        void getPriceForQuoteVolume(const bint &is_buy, const double &quote_volume,
+                                    double &result_price, double &result_volume) const
+        void getQuoteVolumeForBaseAmount(const bint &is_buy, const double &base_amount,
+                                         double &result_quote_volume) const
+        void getVolumeForPrice(const bint &is_buy, const double &price,
+                               double &result_price, double &result_volume) const
+        void getQuoteVolumeForPrice(const bint &is_buy, const double &price,
+                                    double &result_price, double &result_volume) const
@@ -14,3 +14,15 @@ cdef extern from "../cpp/OrderBookEntry.h":
         int64_t getUpdateId() const
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book, const bint &dex)
+    void getPriceForVolume(const set[OrderBookEntry] &book, const bint &is_buy, const double &volume,
+                           double &result_price, double &result_volume)
+    void getVwapForVolume(const set[OrderBookEntry] &book, const bint &is_buy, const double &volume,
+                          double &result_vwap, double &result_volume)
+    void getPriceForQuoteVolume(const set[OrderBookEntry] &book, const bint &is_buy, const double &quote_volume,
+                                double &result_price, double &result_volume)
+    void getQuoteVolumeForBaseAmount(const set[OrderBookEntry] &book, const bint &is_buy, const double &base_amount,
+                                     double &result_quote_volume)
+    void getVolumeForPrice(const set[OrderBookEntry] &book, const bint &is_buy, const double &price,
+                           double &result_price, double &result_volume)
+    void getQuoteVolumeForPrice(const set[OrderBookEntry] &book, const bint &is_buy, const double &price,
+                                double &result_price, double &result_volume)
@@ -0,0 +1,39 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/TickLadder.h":
+    cdef cppclass TickLadder:
+        cppclass const_iterator:
+            const_iterator operator++()
+            bint operator!=(const_iterator)
+            bint operator==(const_iterator)
+            const OrderBookEntry &operator*()
+
+        TickLadder()
+        void configure(const double &tick_size, const int64_t &window_ticks, const bint &descending)
+        void clear()
+        void reset(const double &best_price)
+        int64_t tickOf(const double &price) const
+        bint isOnGrid(const double &price) const
+        void setLevel(const OrderBookEntry &entry)
+        void insertLevel(const OrderBookEntry &entry)
+        void popBest()
+        const OrderBookEntry &best() const
+        bint empty() const
+        size_t size() const
+        size_t getOverflowLevels() const
+        double getTickSize() const
+        const_iterator begin() const
+        const_iterator end() const
+        void getPriceForVolume(const double &volume, double &result_price, double &result_volume) const
+        void getVwapForVolume(const double &volume, double &result_vwap, double &result_volume) const
+        void getPriceForQuoteVolume(const double &quote_volume, double &result_price, double &result_volume) const
+        void getQuoteVolumeForBaseAmount(const double &base_amount, double &result_quote_volume) const
+        void getVolumeForPrice(const double &price, double &result_price, double &result_volume) const
+        void getQuoteVolumeForPrice(const double &price, double &result_price, double &result_volume) const
+
+    bint isOnTickGrid(const double &price, const double &tick_size)
+    void truncateOverlapLevels(TickLadder &bid_ladder, TickLadder &ask_ladder, const bint &dex)
@@ -0,0 +1,184 @@
+import asyncio
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class QueueOverflowPolicy(Enum):
+    BLOCK = "block"
+    COALESCE = "coalesce"
+    DROP_AND_RESNAPSHOT = "drop_and_resnapshot"
+
+
+def merge_diff_messages(older: OrderBookMessage, newer: OrderBookMessage) -> OrderBookMessage:
+    """
+    Merges two diff messages of the same trading pair into one. For each price level the newer update wins, and the
+    merged message covers the update IDs of both. The merged message only has a first update ID when both messages
+    have one.
+    """
+    bids = {row.price: row.amount for row in older.bids}
+    bids.update((row.price, row.amount) for row in newer.bids)
+    asks = {row.price: row.amount for row in older.asks}
+    asks.update((row.price, row.amount) for row in newer.asks)
+    content = {
+        "trading_pair": newer.trading_pair,
+        "update_id": max(older.update_id, newer.update_id),
+        "bids": [[price, amount] for price, amount in bids.items()],
+        "asks": [[price, amount] for price, amount in asks.items()],
+    }
+    if older.has_first_update_id and newer.has_first_update_id:
+        content["first_update_id"] = min(older.first_update_id, newer.first_update_id)
+    return OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=newer.timestamp)
+
+
+class BoundedMessageQueue(asyncio.Queue):
+    """
+    asyncio.Queue with a maximum size, and a policy applied to the messages that arrive while the queue is full:
+
+    - BLOCK: put() waits until there is room, the data source readers use it so that a full queue stops the reading of
+      the websocket. Messages added with put_nowait() by producers that can not wait are kept beyond the bound and
+      counted in overflowed_messages.
+    - COALESCE: a diff message is merged into the last queued diff of the same trading pair, unless another message
+      of the trading pair (like a snapshot) is queued after that diff. Other messages, or diffs without a queued diff
+      to merge into, are kept as with BLOCK.
+    - DROP_AND_RESNAPSHOT: the queued diffs of the trading pair are dropped together with the new diff, and on_drop
+      is called with the trading pair so that its order book gets rebuilt from a new snapshot. Raw exchange messages
+      can not be attributed to a trading pair, all of them are dropped and on_drop is called with None.
+
+    Items can also be (routing time, message) tuples, the policies then look at the message.
+    """
+
+    def __init__(self,
+                 max_size: int = 0,
+                 overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+                 on_drop: Optional[Callable[[Optional[str]], None]] = None):
+        """
+        :param max_size: maximum number of queued messages, 0 means no bound
+        :param overflow_policy: what to do with the messages arriving while the queue is full
+        :param on_drop: called with the trading pair (None when unknown) after its messages have been dropped
+        """
+        # The bound is enforced here instead of by asyncio.Queue, which would reject put_nowait() calls
+        super().__init__()
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._on_drop = on_drop
+        self._room_available = asyncio.Event()
+        self._max_depth = 0
+        self._overflowed_messages = 0
+        self._coalesced_messages = 0
+        self._dropped_messages = 0
+        self._accepting_overflow = False
+
+    @property
+    def maxsize(self) -> int:
+        return self._max_size
+
+    @property
+    def overflow_policy(self) -> QueueOverflowPolicy:
+        return self._overflow_policy
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def overflowed_messages(self) -> int:
+        return self._overflowed_messages
+
+    @property
+    def coalesced_messages(self) -> int:
+        return self._coalesced_messages
+
+    @property
+    def dropped_messages(self) -> int:
+        return self._dropped_messages
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "depth": self.qsize(),
+            "max_depth": self._max_depth,
+            "overflowed_messages": self._overflowed_messages,
+            "coalesced_messages": self._coalesced_messages,
+            "dropped_messages": self._dropped_messages,
+        }
+
+    def full(self) -> bool:
+        return 0 < self._max_size <= self.qsize() and not self._accepting_overflow
+
+    async def put(self, item: Any):
+        while self._overflow_policy is QueueOverflowPolicy.BLOCK and self.full():
+            self._room_available.clear()
+            await self._room_available.wait()
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            self._on_overflow(item)
+        else:
+            super().put_nowait(item)
+        self._max_depth = max(self._max_depth, self.qsize())
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        self._room_available.set()
+        return item
+
+    def _on_overflow(self, item: Any):
+        message = self._message(item)
+        is_order_book_message = isinstance(message, OrderBookMessage)
+        is_diff = is_order_book_message and message.type is OrderBookMessageType.DIFF
+        if self._overflow_policy is QueueOverflowPolicy.COALESCE and is_diff and self._coalesce(item, message):
+            self._coalesced_messages += 1
+        elif self._overflow_policy is QueueOverflowPolicy.DROP_AND_RESNAPSHOT and is_diff:
+            self._drop(lambda queued: self._is_diff_for(queued, message.trading_pair))
+            self._dropped_messages += 1
+            self._on_drop and self._on_drop(message.trading_pair)
+        elif self._overflow_policy is QueueOverflowPolicy.DROP_AND_RESNAPSHOT and not is_order_book_message:
+            self._drop(lambda queued: True)
+            self._dropped_messages += 1
+            self._on_drop and self._on_drop(None)
+        else:
+            self._overflowed_messages += 1
+            self._accepting_overflow = True
+            try:
+                super().put_nowait(item)
+            finally:
+                self._accepting_overflow = False
+
+    def _coalesce(self, item: Any, message: OrderBookMessage) -> bool:
+        for index in range(len(self._queue) - 1, -1, -1):
+            queued_item = self._queue[index]
+            queued_message = self._message(queued_item)
+            if self._is_diff_for(queued_message, message.trading_pair):
+                merged = merge_diff_messages(queued_message, message)
+                self._queue[index] = merged if queued_item is queued_message else (queued_item[0], merged)
+                return True
+            if isinstance(queued_message, OrderBookMessage) and queued_message.trading_pair == message.trading_pair:
+                # Merging into an older diff would apply the new diff before this message
+                return False
+        return False
+
+    def _drop(self, condition: Callable[[Any], bool]):
+        kept = [queued_item for queued_item in self._queue if not condition(self._message(queued_item))]
+        dropped_count = len(self._queue) - len(kept)
+        self._queue.clear()
+        self._queue.extend(kept)
+        for _ in range(dropped_count):
+            self.task_done()
+        self._dropped_messages += dropped_count
+        self._room_available.set()
+
+    @staticmethod
+    def _is_diff_for(message: Any, trading_pair: str) -> bool:
+        return (isinstance(message, OrderBookMessage)
+                and message.type is OrderBookMessageType.DIFF
+                and message.trading_pair == trading_pair)
+
+    @staticmethod
+    def _message(item: Any) -> Any:
+        # OrderBookMessage is itself a named tuple
+        if isinstance(item, tuple) and not isinstance(item, OrderBookMessage):
+            return item[-1]
+        return item
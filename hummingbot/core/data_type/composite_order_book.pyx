@@ -9,8 +9,11 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -175,6 +178,20 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef Py_ssize_t c_fill_snapshot_array(self, bint is_bid, double[:, :] array, Py_ssize_t depth):
+        cdef:
+            Py_ssize_t row = 0
+        if depth == 0:
+            return 0
+        for entry in (self.bid_entries() if is_bid else self.ask_entries()):
+            array[row, 0] = entry.price
+            array[row, 1] = entry.amount
+            array[row, 2] = entry.update_id
+            row += 1
+            if row == depth:
+                break
+        return row
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -192,3 +209,94 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    # The depth queries below walk the composite entries, so that the recorded fills are taken out of the book. The
+    # base class walks the C++ sets directly, which would ignore them.
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+            if total_volume >= volume:
+                total_cost -= order_book_row.amount * order_book_row.price
+                total_volume -= order_book_row.amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * order_book_row.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            row_amount = order_book_row.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * order_book_row.price
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (is_buy and order_book_row.price > price) or (not is_buy and order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            if (is_buy and order_book_row.price > price) or (not is_buy and order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
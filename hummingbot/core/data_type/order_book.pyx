@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 import bisect
 import logging
 import time
@@ -20,12 +20,21 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
-from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.OrderBookEntry cimport (
+    getPriceForQuoteVolume,
+    getPriceForVolume,
+    getQuoteVolumeForBaseAmount,
+    getQuoteVolumeForPrice,
+    getVolumeForPrice,
+    getVwapForVolume,
+    truncateOverlapEntries,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookBestPriceEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -34,10 +43,34 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+cdef int64_t BEST_PRICE_EVENT_TAG = OrderBookEvent.BestPriceUpdateEvent.value
+
+
+cdef inline bint same_price(double price, double other_price):
+    return price == other_price or (price != price and other_price != other_price)
+
+
+cdef int64_t numpy_entries(np.ndarray[np.float64_t, ndim=2] array, vector[OrderBookEntry] *entries):
+    """
+    Appends the [price, amount, update_id] rows of the array to entries.
+
+    :return: the highest update ID of the rows
+    """
+    cdef:
+        Py_ssize_t row
+        int64_t row_update_id
+        int64_t last_update_id = 0
+    deref(entries).reserve(deref(entries).size() + array.shape[0])
+    for row in range(array.shape[0]):
+        row_update_id = <int64_t>array[row, 2]
+        deref(entries).push_back(OrderBookEntry(array[row, 0], array[row, 1], row_update_id))
+        last_update_id = max(last_update_id, row_update_id)
+    return last_update_id
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_BEST_PRICE_EVENT_TAG = OrderBookEvent.BestPriceUpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -46,7 +79,12 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
+        """
+        :param dex: whether the book comes from a decentralized exchange, changes how crossed entries are resolved
+        :param depth_index: keeps a cumulative depth index on each side, so that the volume and VWAP queries run in
+        O(log n) instead of walking the book. It makes each diff slightly more expensive to apply.
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +93,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +104,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -80,6 +121,12 @@ cdef class OrderBook(PubSub):
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
 
+        if self._depth_index_enabled:
+            for bid in bids:
+                self._bid_depth_index.setLevel(bid.getPrice(), bid.getAmount())
+            for ask in asks:
+                self._ask_depth_index.setLevel(ask.getPrice(), ask.getAmount())
+
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
@@ -93,13 +140,27 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        if self._depth_index_enabled:
+            # Drop the levels removed from the books by the overlap truncation.
+            if self._bid_book.empty():
+                self._bid_depth_index.clear()
+            else:
+                self._bid_depth_index.eraseAbove(top_bid.getPrice())
+            if self._ask_book.empty():
+                self._ask_depth_index.clear()
+            else:
+                self._ask_depth_index.eraseBelow(top_ask.getPrice())
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -133,8 +194,26 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        if self._depth_index_enabled:
+            self.c_rebuild_depth_index()
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+
+    cdef c_rebuild_depth_index(self):
+        self._bid_depth_index.rebuild(self._bid_book)
+        self._ask_depth_index.rebuild(self._ask_book)
+
+    cdef c_notify_best_price_update(self, double previous_best_bid, double previous_best_ask):
+        """
+        Triggers a best price update event when the top of the book moved. Nothing is built when no one listens.
+        """
+        if self._events.find(BEST_PRICE_EVENT_TAG) == self._events.end():
+            return
+        if same_price(previous_best_bid, self._best_bid) and same_price(previous_best_ask, self._best_ask):
+            return
+        self.c_trigger_event(BEST_PRICE_EVENT_TAG, OrderBookBestPriceEvent(self._best_bid, self._best_ask))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +240,18 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    def enable_depth_index(self):
+        """
+        Builds the cumulative depth index from the current content of the book and keeps it updated from now on.
+        """
+        if not self._depth_index_enabled:
+            self._depth_index_enabled = True
+            self.c_rebuild_depth_index()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -171,12 +262,73 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.snapshot_arrays()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def snapshot_arrays(self,
+                        depth: Optional[int] = None,
+                        bids_array: Optional[np.ndarray] = None,
+                        asks_array: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the top levels of each side into float64 arrays with the [price, amount, update_id] columns, best price
+        first, straight from the order book entries.
+
+        Callers taking a snapshot on every tick can pass their own buffers, which are filled in place so that no new
+        array is allocated. The returned arrays are then views on the first rows of those buffers.
+
+        :param depth: maximum number of levels per side. Defaults to the whole book, or to the buffer sizes when
+        buffers are given
+        :param bids_array: optional float64 buffer with 3 columns to fill with the bids
+        :param asks_array: optional float64 buffer with 3 columns to fill with the asks
+        :return: the bids and asks arrays
+        """
+        if depth is not None and depth < 0:
+            raise ValueError(f"The snapshot depth must not be negative ({depth}).")
+        bids_array = self._snapshot_buffer(True, depth, bids_array)
+        asks_array = self._snapshot_buffer(False, depth, asks_array)
+        bids_count = self.c_fill_snapshot_array(True, bids_array, bids_array.shape[0] if depth is None else depth)
+        asks_count = self.c_fill_snapshot_array(False, asks_array, asks_array.shape[0] if depth is None else depth)
+        return bids_array[:bids_count], asks_array[:asks_count]
+
+    def _snapshot_buffer(self, is_bid: bool, depth: Optional[int], array: Optional[np.ndarray]) -> np.ndarray:
+        if array is None:
+            rows = self.c_level_count(is_bid)
+            return np.empty((rows if depth is None else min(depth, rows), 3), dtype=np.float64)
+        if array.dtype != np.float64 or array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError(f"Snapshot buffers must be float64 arrays of shape (n, 3), got {array.dtype} {array.shape}.")
+        if depth is not None and depth > array.shape[0]:
+            raise ValueError(f"The snapshot buffer has {array.shape[0]} rows, {depth} levels were requested.")
+        return array
+
+    cdef size_t c_level_count(self, bint is_bid):
+        return self._bid_book.size() if is_bid else self._ask_book.size()
+
+    cdef Py_ssize_t c_fill_snapshot_array(self, bint is_bid, double[:, :] array, Py_ssize_t depth):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            Py_ssize_t row = 0
+
+        while row < depth:
+            if is_bid:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            array[row, 0] = entry.getPrice()
+            array[row, 1] = entry.getAmount()
+            array[row, 2] = entry.getUpdateId()
+            row += 1
+        return row
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -208,59 +360,73 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The diff update ID is update_id when given, the highest update ID of the rows otherwise.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        All columns are of double type. A negative update_id means the highest update ID of the rows.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(numpy_entries(bids_array, &cpp_bids), numpy_entries(asks_array, &cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The snapshot update ID is update_id when given, the highest update ID of the rows otherwise.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        All columns are of double type. A negative update_id means the highest update ID of the rows.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(numpy_entries(bids_array, &cpp_bids), numpy_entries(asks_array, &cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, straight from its arrays when the rows were parsed by the connector into a
+        NumpyOrderBookMessage.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, straight from its arrays when the rows were parsed by the connector into a
+        NumpyOrderBookMessage.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -320,142 +486,74 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getPriceForVolume(is_buy, volume, result_price, result_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+            getPriceForVolume(deref(book), is_buy, volume, result_price, result_volume)
+        return OrderBookQueryResult(NaN, volume, result_price, result_volume)
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
-            double total_volume = 0
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getVwapForVolume(is_buy, volume, result_vwap, result_volume)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+            getVwapForVolume(deref(book), is_buy, volume, result_vwap, result_volume)
+        return OrderBookQueryResult(NaN, volume, result_vwap, result_volume)
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getPriceForQuoteVolume(is_buy, quote_volume, result_price, result_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+            getPriceForQuoteVolume(deref(book), is_buy, quote_volume, result_price, result_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result_price, result_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_quote_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getQuoteVolumeForBaseAmount(is_buy, base_amount, result_quote_volume)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-
-        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+            getQuoteVolumeForBaseAmount(deref(book), is_buy, base_amount, result_quote_volume)
+        return OrderBookQueryResult(NaN, base_amount, NaN, result_quote_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getVolumeForPrice(is_buy, price, result_price, result_volume)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            getVolumeForPrice(deref(book), is_buy, price, result_price, result_volume)
+        return OrderBookQueryResult(price, NaN, result_price, result_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getQuoteVolumeForPrice(is_buy, price, result_price, result_volume)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            getQuoteVolumeForPrice(deref(book), is_buy, price, result_price, result_volume)
+        return OrderBookQueryResult(price, NaN, result_price, result_volume)
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -478,6 +576,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
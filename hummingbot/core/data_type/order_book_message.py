@@ -3,6 +3,8 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -68,6 +70,10 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
 
+    @property
+    def has_first_update_id(self) -> bool:
+        return self.type is OrderBookMessageType.DIFF and "first_update_id" in self.content
+
     @property
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
@@ -95,3 +101,51 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class NumpyOrderBookMessage(OrderBookMessage):
+    """
+    Snapshot or diff message whose bids and asks are parsed only once, when the message is created, into float64
+    arrays with the [price, amount, update_id] columns consumed by OrderBook.apply_numpy_diffs() and
+    OrderBook.apply_numpy_snapshot().
+
+    The content "bids" and "asks" can be any sequence of [price, amount, ...] rows with the same number of columns,
+    the extra columns are ignored.
+    """
+
+    def __new__(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        content = dict(content)
+        content["bids"] = cls._rows_array(content["bids"], content["update_id"])
+        content["asks"] = cls._rows_array(content["asks"], content["update_id"])
+        return super(NumpyOrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+
+    @staticmethod
+    def _rows_array(rows, update_id: int) -> np.ndarray:
+        array = np.empty((len(rows), 3), dtype=np.float64)
+        if len(rows) > 0:
+            array[:, :2] = np.asarray(rows, dtype=np.float64)[:, :2]
+        array[:, 2] = update_id
+        return array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self.content["bids"]
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self.content["asks"]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount in self.content["asks"][:, :2].tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount in self.content["bids"][:, :2].tolist()]
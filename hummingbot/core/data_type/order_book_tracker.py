@@ -2,17 +2,20 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
+from hummingbot.core.data_type.bounded_message_queue import BoundedMessageQueue, QueueOverflowPolicy
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +24,73 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class DiffCoalescingStats:
+    """
+    Counters of the diff coalescing mode for one trading pair.
+    """
+    applies: int = 0
+    merged_messages: int = 0
+    last_merged_messages: int = 0
+    max_merged_messages: int = 0
+
+    @property
+    def average_merged_messages(self) -> float:
+        return self.merged_messages / self.applies if self.applies > 0 else 0.0
+
+
+@dataclass
+class OrderBookShardStats:
+    """
+    Counters of one dispatcher shard. The latency is measured from the moment a message is routed to the shard until
+    it has been applied to its order book.
+    """
+    processed_messages: int = 0
+    total_latency: float = 0.0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    pending_messages: int = 0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.processed_messages if self.processed_messages > 0 else 0.0
+
+
+class OrderBookShardRouter:
+    """
+    Queue like object handed to the data source instead of the diff and snapshot streams in dispatcher mode. Each
+    message is put straight into the queue of the shard that owns its trading pair, together with the time it was
+    routed at.
+    """
+
+    def __init__(self, shard_queues: List[asyncio.Queue], shard_assignments: Dict[str, int]):
+        self._shard_queues = shard_queues
+        self._shard_assignments = shard_assignments
+
+    def shard_for(self, trading_pair: str) -> int:
+        shard = self._shard_assignments.get(trading_pair)
+        if shard is None:
+            shard = len(self._shard_assignments) % len(self._shard_queues)
+            self._shard_assignments[trading_pair] = shard
+        return shard
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._shard_queues[self.shard_for(message.trading_pair)].put_nowait((time.perf_counter(), message))
+
+    async def put(self, message: OrderBookMessage):
+        await self._shard_queues[self.shard_for(message.trading_pair)].put((time.perf_counter(), message))
+
+    def qsize(self) -> int:
+        return sum(queue.qsize() for queue in self._shard_queues)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_BUFFER_SIZE: int = 1000
+    INIT_ORDER_BOOK_RETRY_DELAY: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,18 +99,65 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False,
+                 dispatcher_shards: int = 0,
+                 queue_max_size: int = 0,
+                 queue_overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+                 detect_sequence_gaps: bool = False):
+        """
+        :param coalesce_diffs: when True, every diff waiting in a trading pair queue is merged by price level (the
+        last update of a level wins) and applied to the order book at once, instead of one diff message at a time
+        :param dispatcher_shards: when greater than 0, the trading pairs are split in that many shards, each one
+        served by a single worker that applies the diff and snapshot messages of its pairs, instead of routing them
+        to a queue and a tracking task per trading pair. Diffs are not coalesced in this mode
+        :param queue_max_size: maximum number of messages in each of the tracker queues and of the data source raw
+        message queues, 0 means no bound
+        :param queue_overflow_policy: what to do with the messages arriving to a full queue, see BoundedMessageQueue
+        :param detect_sequence_gaps: when True, every diff message carrying a first update ID must start right after
+        the last update applied to its order book. Only for data sources whose diffs carry consecutive update IDs, see
+        OrderBookTrackerDataSource.supports_sequence_gap_detection. On a gap the trading pair is resynced: its diffs are buffered
+        while a new snapshot is requested, and replayed on top of it. Those trading pairs are then left out of the
+        data source periodic full order book resets
+        """
         self._domain: Optional[str] = domain
+        self._queue_max_size: int = queue_max_size
+        self._queue_overflow_policy: QueueOverflowPolicy = queue_overflow_policy
+        self._order_book_lags: Dict[str, float] = {}
+        self._resnapshot_tasks: Dict[str, asyncio.Task] = {}
+        self._detect_sequence_gaps: bool = detect_sequence_gaps
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._sequence_gaps: Dict[str, int] = defaultdict(int)
+        self._sequence_checked_trading_pairs: Set[str] = set()
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._diff_coalescing_stats: Dict[str, DiffCoalescingStats] = defaultdict(DiffCoalescingStats)
+        self._dispatcher_shards: int = dispatcher_shards
+        self._shard_queues: List[asyncio.Queue] = [
+            self._create_message_queue(on_drop=self._on_messages_dropped) for _ in range(dispatcher_shards)]
+        self._shard_stats: List[OrderBookShardStats] = [OrderBookShardStats() for _ in range(dispatcher_shards)]
+        self._shard_router: Optional[OrderBookShardRouter] = (
+            OrderBookShardRouter(
+                shard_queues=self._shard_queues,
+                shard_assignments={trading_pair: index % dispatcher_shards
+                                   for index, trading_pair in enumerate(trading_pairs)})
+            if dispatcher_shards > 0
+            else None)
+        self._shard_tasks: List[asyncio.Task] = []
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
-        self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: asyncio.Queue = self._create_message_queue(on_drop=self._on_messages_dropped)
+        self._order_book_snapshot_stream: asyncio.Queue = self._create_message_queue()
+        self._order_book_trade_stream: asyncio.Queue = self._create_message_queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
@@ -56,6 +171,10 @@ class OrderBookTracker:
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
 
+        if queue_max_size > 0:
+            self._data_source.configure_message_queues(
+                max_size=queue_max_size, overflow_policy=queue_overflow_policy, on_drop=self._on_messages_dropped)
+
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
@@ -68,6 +187,88 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is already built, while the others may still be bootstrapping.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
+    @property
+    def coalesce_diffs(self) -> bool:
+        return self._coalesce_diffs
+
+    @property
+    def diff_coalescing_stats(self) -> Dict[str, DiffCoalescingStats]:
+        """
+        Per trading pair counters of how many diff messages were merged into each order book update.
+        """
+        return self._diff_coalescing_stats
+
+    @property
+    def dispatcher_shards(self) -> int:
+        return self._dispatcher_shards
+
+    @property
+    def shard_stats(self) -> List[OrderBookShardStats]:
+        """
+        Message counts and routing to apply latencies of each dispatcher shard.
+        """
+        for shard_stats, shard_queue in zip(self._shard_stats, self._shard_queues):
+            shard_stats.pending_messages = shard_queue.qsize()
+        return self._shard_stats
+
+    @property
+    def queue_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Current depth, highest depth and overflow counters of every queue, by queue name.
+        """
+        queues: Dict[str, asyncio.Queue] = {
+            "order_book_diff_stream": self._order_book_diff_stream,
+            "order_book_snapshot_stream": self._order_book_snapshot_stream,
+            "order_book_trade_stream": self._order_book_trade_stream,
+        }
+        if isinstance(self._data_source, OrderBookTrackerDataSource):
+            queues.update((f"data_source_{key}", queue) for key, queue in self._data_source.message_queues.items())
+        queues.update(self._tracking_message_queues)
+        queues.update((f"shard_{shard}", queue) for shard, queue in enumerate(self._shard_queues))
+        return {
+            name: queue.stats if isinstance(queue, BoundedMessageQueue) else {"depth": queue.qsize()}
+            for name, queue in queues.items()
+        }
+
+    @property
+    def order_book_lags(self) -> Dict[str, float]:
+        """
+        Per trading pair, seconds between the exchange timestamp of the last applied diff and the moment it was
+        applied to the order book.
+        """
+        return self._order_book_lags
+
+    @property
+    def detect_sequence_gaps(self) -> bool:
+        return self._detect_sequence_gaps
+
+    @property
+    def sequence_gaps(self) -> Dict[str, int]:
+        """
+        Per trading pair, number of gaps found in the update IDs of the diff messages.
+        """
+        return self._sequence_gaps
+
+    @property
+    def resyncing_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs waiting for a new snapshot, their diff messages being buffered meanwhile.
+        """
+        return list(self._resync_buffers)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,24 +284,31 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        # In dispatcher mode the data source puts the messages straight into the shard queues
+        diff_stream = self._shard_router or self._order_book_diff_stream
+        snapshot_stream = self._shard_router or self._order_book_snapshot_stream
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_stream)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(self._ev_loop, snapshot_stream)
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
+        if self._shard_router is None:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
+        else:
+            self._shard_tasks = [safe_ensure_future(self._dispatch_shard_messages(shard))
+                                 for shard in range(self._dispatcher_shards)]
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -133,11 +341,20 @@ class OrderBookTracker:
             self._update_last_trade_prices_task = None
         if self._order_book_stream_listener_task is not None:
             self._order_book_stream_listener_task.cancel()
+        for task in self._resnapshot_tasks.values():
+            task.cancel()
+        self._resnapshot_tasks.clear()
+        self._resync_buffers.clear()
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._shard_tasks:
+            task.cancel()
+        self._shard_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -175,16 +392,49 @@ class OrderBookTracker:
     async def _init_order_books(self):
         """
         Initialize order books
+
+        The snapshots for all trading pairs are requested concurrently, the rate of requests being limited by the
+        data source throttler. Each order book starts being tracked, and is marked as ready, as soon as it is built.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        initialized_count = 0
+
+        async def init_order_book(trading_pair: str):
+            nonlocal initialized_count
+            await self._init_order_book(trading_pair)
+            initialized_count += 1
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        while True:
+            try:
+                self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._last_update_ids[trading_pair] = self._order_books[trading_pair].snapshot_uid
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.INIT_ORDER_BOOK_RETRY_DELAY:.0f} seconds.")
+                await self._sleep(delay=self.INIT_ORDER_BOOK_RETRY_DELAY)
+        if self._shard_router is None:
+            self._tracking_message_queues[trading_pair] = self._create_message_queue(
+                on_drop=self._on_messages_dropped)
+            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        else:
+            # The shard worker only sees the messages arriving from now on, apply the ones received while the
+            # snapshot was being requested
+            saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+            while len(saved_messages) > 0:
+                self._apply_order_book_message(trading_pair, saved_messages.popleft())
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -198,6 +448,7 @@ class OrderBookTracker:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                self._data_source.record_trading_pair_message(trading_pair)
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
@@ -238,7 +489,6 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -260,21 +510,30 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        # Non diff message found while merging diffs, processed on the next iteration
+        deferred_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if deferred_message is not None:
+                    message, deferred_message = deferred_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs:
+                        merged_messages, deferred_message = self._apply_coalesced_diffs(trading_pair, message)
+                        diff_messages_accepted += merged_messages
+                    elif self._accept_diff(trading_pair, message):
+                        order_book.apply_diff_message(message)
+                        past_diffs_window.append(message)
+                        diff_messages_accepted += 1
+                        self._record_order_book_lag(trading_pair, message)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -283,8 +542,7 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._restore_order_book(trading_pair, message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,11 +553,235 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _dispatch_shard_messages(self, shard: int):
+        """
+        Applies the diff and snapshot messages of all the trading pairs owned by the shard, in the order they arrive.
+        """
+        shard_queue: asyncio.Queue = self._shard_queues[shard]
+        shard_stats: OrderBookShardStats = self._shard_stats[shard]
+        last_message_timestamp: float = time.time()
+
+        while True:
+            try:
+                routing_time, message = await shard_queue.get()
+                trading_pair: str = message.trading_pair
+                if message.type is OrderBookMessageType.DIFF:
+                    self._data_source.record_trading_pair_message(trading_pair)
+
+                if not self.is_order_book_ready(trading_pair):
+                    # Save messages received before snapshots are ready
+                    if message.type is OrderBookMessageType.DIFF:
+                        self._saved_message_queues[trading_pair].append(message)
+                    continue
+                self._apply_order_book_message(trading_pair, message)
+
+                latency = time.perf_counter() - routing_time
+                shard_stats.processed_messages += 1
+                shard_stats.total_latency += latency
+                shard_stats.last_latency = latency
+                shard_stats.max_latency = max(shard_stats.max_latency, latency)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Shard {shard} processed {shard_stats.processed_messages} order book "
+                                        f"messages, average latency {shard_stats.average_latency * 1e3:.3f} ms.")
+                last_message_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error dispatching order book messages for shard {shard}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error dispatching order book messages. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _apply_order_book_message(self, trading_pair: str, message: OrderBookMessage):
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        if message.type is OrderBookMessageType.DIFF:
+            # Check the order book's initial update ID. If it's larger, don't bother.
+            if order_book.snapshot_uid > message.update_id or not self._accept_diff(trading_pair, message):
+                return
+            order_book.apply_diff_message(message)
+            past_diffs_window.append(message)
+            self._record_order_book_lag(trading_pair, message)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            self._restore_order_book(trading_pair, message)
+
+    def _accept_diff(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        """
+        Checks that the diff message continues the update IDs sequence of its order book. When it does not, the
+        trading pair starts a resync, and the message is buffered with the ones that follow until a new snapshot
+        arrives.
+
+        :return: True when the diff has to be applied to the order book
+        """
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.get(trading_pair)
+        if resync_buffer is not None:
+            resync_buffer.append(message)
+            return False
+
+        last_update_id: Optional[int] = self._last_update_ids.get(trading_pair)
+        if self._detect_sequence_gaps and message.has_first_update_id and last_update_id is not None:
+            if message.first_update_id > last_update_id + 1:
+                self._sequence_gaps[trading_pair] += 1
+                self.logger().warning(
+                    f"Gap in the order book updates of {trading_pair}: expected update {last_update_id + 1}, "
+                    f"received updates {message.first_update_id} to {message.update_id}. Resyncing the order book.")
+                self._start_resync(trading_pair)
+                self._resync_buffers[trading_pair].append(message)
+                return False
+            if trading_pair not in self._sequence_checked_trading_pairs:
+                # Gaps are caught as they happen, the periodic full resets are not needed for this order book
+                self._sequence_checked_trading_pairs.add(trading_pair)
+                self._data_source.add_sequence_checked_trading_pair(trading_pair)
+
+        if last_update_id is None or message.update_id > last_update_id:
+            self._last_update_ids[trading_pair] = message.update_id
+        return True
+
+    def _start_resync(self, trading_pair: str):
+        if trading_pair in self._order_books and trading_pair not in self._resync_buffers:
+            self._resync_buffers[trading_pair] = deque(maxlen=self.RESYNC_BUFFER_SIZE)
+            self._request_resnapshot(trading_pair)
+
+    def _restore_order_book(self, trading_pair: str, snapshot: OrderBookMessage):
+        """
+        Rebuilds the order book from the snapshot message. When the trading pair is being resynced, the buffered
+        diffs newer than the snapshot are replayed on top of it, provided they continue its update IDs sequence.
+        Otherwise the last diffs applied are replayed.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.pop(trading_pair, None)
+
+        if resync_buffer is None:
+            order_book.restore_from_snapshot_and_diffs(snapshot, list(past_diffs_window))
+            self._last_update_ids[trading_pair] = max(
+                snapshot.update_id, self._last_update_ids.get(trading_pair, snapshot.update_id))
+            return
+
+        replay_diffs: List[OrderBookMessage] = []
+        last_update_id: int = snapshot.update_id
+        for position, diff in enumerate(resync_buffer):
+            if diff.update_id <= last_update_id:
+                continue
+            if self._detect_sequence_gaps and diff.has_first_update_id and diff.first_update_id > last_update_id + 1:
+                # The snapshot is older than the buffered diffs, or some diffs are missing. Keep buffering and ask
+                # for a newer snapshot.
+                self._resync_buffers[trading_pair] = deque(
+                    list(resync_buffer)[position:], maxlen=self.RESYNC_BUFFER_SIZE)
+                self._request_resnapshot(trading_pair)
+                return
+            replay_diffs.append(diff)
+            last_update_id = diff.update_id
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, replay_diffs)
+        past_diffs_window.extend(replay_diffs)
+        self._last_update_ids[trading_pair] = last_update_id
+        if len(replay_diffs) > 0:
+            self._record_order_book_lag(trading_pair, replay_diffs[-1])
+        self.logger().info(f"Resynced the order book of {trading_pair} at update {last_update_id}.")
+
+    def _record_order_book_lag(self, trading_pair: str, message: OrderBookMessage):
+        if message.timestamp is not None:
+            self._order_book_lags[trading_pair] = time.time() - message.timestamp
+
+    def _create_message_queue(self, on_drop: Optional[Callable[[Optional[str]], None]] = None) -> BoundedMessageQueue:
+        return BoundedMessageQueue(
+            max_size=self._queue_max_size, overflow_policy=self._queue_overflow_policy, on_drop=on_drop)
+
+    def _on_messages_dropped(self, trading_pair: Optional[str]):
+        """
+        Rebuilds the order books whose diff messages were dropped from a new snapshot. All of them when the dropped
+        messages could not be attributed to a trading pair.
+        """
+        trading_pairs = list(self._order_books) if trading_pair is None else [trading_pair]
+        for trading_pair in trading_pairs:
+            self._start_resync(trading_pair)
+
+    def _request_resnapshot(self, trading_pair: str):
+        if trading_pair in self._order_books and trading_pair not in self._resnapshot_tasks:
+            self._resnapshot_tasks[trading_pair] = safe_ensure_future(self._resnapshot(trading_pair))
+
+    async def _resnapshot(self, trading_pair: str):
+        try:
+            while True:
+                try:
+                    # The snapshot follows the same path as the ones sent by the exchange
+                    await self._data_source.request_order_book_snapshot(
+                        trading_pair=trading_pair, output=self._shard_router or self._order_book_snapshot_stream)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error requesting a new order book snapshot for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error requesting a new order book snapshot for {trading_pair}. "
+                                        f"Retrying after {self.INIT_ORDER_BOOK_RETRY_DELAY:.0f} seconds.")
+                    await self._sleep(delay=self.INIT_ORDER_BOOK_RETRY_DELAY)
+        finally:
+            self._resnapshot_tasks.pop(trading_pair, None)
+
+    def _apply_coalesced_diffs(self,
+                               trading_pair: str,
+                               first_message: OrderBookMessage) -> Tuple[int, Optional[OrderBookMessage]]:
+        """
+        Drains the diff messages waiting for the trading pair, merges them by price level and applies the result to
+        the order book in a single update. The update ID applied is the highest one among the merged messages.
+
+        :return: the number of diff messages merged, and the first non diff message found while draining, if any
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        update_id: int = first_message.update_id
+        merged_messages: int = 0
+        message: Optional[OrderBookMessage] = first_message
+        last_diff_message: OrderBookMessage = first_message
+
+        while message is not None and message.type is OrderBookMessageType.DIFF:
+            if self._accept_diff(trading_pair, message):
+                for row in message.bids:
+                    bids[row.price] = row
+                for row in message.asks:
+                    asks[row.price] = row
+                update_id = max(update_id, message.update_id)
+                past_diffs_window.append(message)
+                merged_messages += 1
+                last_diff_message = message
+            message = self._next_waiting_message(trading_pair)
+
+        if merged_messages == 0:
+            # All the diffs were buffered for a resync
+            return merged_messages, message
+        order_book.apply_diffs(list(bids.values()), list(asks.values()), update_id)
+        self._record_order_book_lag(trading_pair, last_diff_message)
+
+        stats: DiffCoalescingStats = self._diff_coalescing_stats[trading_pair]
+        stats.applies += 1
+        stats.merged_messages += merged_messages
+        stats.last_merged_messages = merged_messages
+        stats.max_merged_messages = max(stats.max_merged_messages, merged_messages)
+        return merged_messages, message
+
+    def _next_waiting_message(self, trading_pair: str) -> Optional[OrderBookMessage]:
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        if len(saved_messages) > 0:
+            return saved_messages.popleft()
+        try:
+            return self._tracking_message_queues[trading_pair].get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
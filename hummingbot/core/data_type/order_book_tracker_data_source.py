@@ -3,16 +3,23 @@ import logging
 import time
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
+from hummingbot.core.data_type.bounded_message_queue import BoundedMessageQueue, QueueOverflowPolicy
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.stream_message_deduplicator import StreamMessageDeduplicator
+from hummingbot.core.data_type.subscription_shards import balanced_subscription_shards, subscription_shards_count
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    HOT_STANDBY_CONNECTIONS = 2
+    # Maximum number of trading pairs subscribed through one websocket connection, 0 means no limit
+    MAX_TRADING_PAIRS_PER_CONNECTION = 0
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -22,8 +29,12 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._snapshot_messages_queue_key = "order_book_snapshot"
 
         self._trading_pairs: List[str] = trading_pairs
+        self._sequence_checked_trading_pairs: Set[str] = set()
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._hot_standby_deduplicator: Optional[StreamMessageDeduplicator] = None
+        self._subscription_connections: int = 1
+        self._trading_pair_message_counts: Dict[str, int] = defaultdict(int)
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +50,99 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def message_queues(self) -> Dict[str, asyncio.Queue]:
+        return self._message_queue
+
+    def configure_message_queues(self,
+                                 max_size: int,
+                                 overflow_policy: QueueOverflowPolicy,
+                                 on_drop: Optional[Callable[[Optional[str]], None]] = None):
+        """
+        Bounds the queues storing the raw messages received from the exchange.
+
+        :param max_size: maximum number of messages in each queue, 0 means no bound
+        :param overflow_policy: what to do with the messages arriving to a full queue, see BoundedMessageQueue
+        :param on_drop: called when order book diffs have been dropped, dropped trades and snapshots need no action
+        """
+        def create_queue(key: Optional[str] = None) -> BoundedMessageQueue:
+            return BoundedMessageQueue(
+                max_size=max_size,
+                overflow_policy=overflow_policy,
+                on_drop=on_drop if key == self._diff_messages_queue_key else None)
+
+        message_queues = defaultdict(create_queue)
+        for key in self._get_messages_queue_keys():
+            message_queues[key] = create_queue(key)
+        # Keep the messages already received
+        for key, queue in self._message_queue.items():
+            while not queue.empty():
+                message_queues[key].put_nowait(queue.get_nowait())
+        self._message_queue = message_queues
+
+    def add_sequence_checked_trading_pair(self, trading_pair: str):
+        """
+        Leaves the trading pair out of the periodic full order book resets. Used by the order book tracker once it
+        checks the update IDs continuity of the pair diff messages, and resyncs the order book by itself on a gap.
+
+        :param trading_pair: the trading pair whose order book is checked
+        """
+        self._sequence_checked_trading_pairs.add(trading_pair)
+
+    @property
+    def supports_sequence_gap_detection(self) -> bool:
+        """
+        Whether every diff message of the data source carries the first update ID it covers, and the update IDs of a
+        trading pair are consecutive, so that the order book tracker can detect the missing updates.
+        """
+        return False
+
+    @property
+    def supports_hot_standby(self) -> bool:
+        """
+        Whether the data source can keep hot standby websocket connections. Subclasses implementing
+        `_message_sequence` for the diff and trade messages return True.
+        """
+        return False
+
+    def enable_hot_standby(self):
+        """
+        Keeps `HOT_STANDBY_CONNECTIONS` websocket connections subscribed to the same channels, instead of a single one.
+        The first copy of each message is queued and the others are discarded, so when a connection drops the
+        messages keep flowing through the other ones while it reconnects, without a gap in the order book diffs.
+        """
+        if not self.supports_hot_standby:
+            raise NotImplementedError(f"{type(self).__name__} does not support hot standby connections.")
+        self._hot_standby_deduplicator = StreamMessageDeduplicator()
+
+    @property
+    def supports_subscription_sharding(self) -> bool:
+        """
+        Whether the data source can spread the trading pairs subscriptions across several websocket connections.
+        Subclasses implementing `_subscribe_trading_pairs` return True.
+        """
+        return False
+
+    def configure_subscription_sharding(self, connections: int):
+        """
+        Spreads the trading pairs subscriptions across `connections` websocket connections (more if required by
+        `MAX_TRADING_PAIRS_PER_CONNECTION`), so that each connection decodes the messages of fewer trading pairs.
+        The trading pairs are balanced by the rate of their order book messages, measured between reconnections.
+        Hot standby connections are not used for sharded subscriptions.
+        """
+        if not self.supports_subscription_sharding:
+            raise NotImplementedError(f"{type(self).__name__} does not support subscription sharding.")
+        self._subscription_connections = connections
+
+    def record_trading_pair_message(self, trading_pair: str):
+        """
+        Counts the order book messages of the trading pair, used to balance the sharded subscriptions. Called by the
+        order book tracker for every diff message.
+
+        :param trading_pair: the trading pair of the message
+        """
+        self._trading_pair_message_counts[trading_pair] += 1
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -64,14 +168,25 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
-        exchange. Each message is stored in its own queue.
+        exchange. Each message is stored in its own queue. With hot standby enabled, the messages are received through
+        several connections, each one reconnecting on its own. With sharded subscriptions, each connection is
+        subscribed to a part of the trading pairs.
         """
+        if self._subscription_shards_count() > 1:
+            await self._listen_for_sharded_subscriptions()
+        elif self._hot_standby_deduplicator is not None:
+            await safe_gather(*[self._listen_for_subscriptions_on_connection()
+                                for _ in range(self.HOT_STANDBY_CONNECTIONS)])
+        else:
+            await self._listen_for_subscriptions_on_connection()
+
+    async def _listen_for_subscriptions_on_connection(self):
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -90,6 +205,44 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_sharded_subscriptions(self):
+        while True:
+            websocket_assistants: List[WSAssistant] = []
+            listening_tasks: List[asyncio.Task] = []
+            try:
+                # The trading pairs are rebalanced every time the connections are established
+                shards = balanced_subscription_shards(
+                    trading_pairs=self._trading_pairs,
+                    shards_count=self._subscription_shards_count(),
+                    max_trading_pairs_per_shard=self.MAX_TRADING_PAIRS_PER_CONNECTION,
+                    message_counts=self._trading_pair_message_counts)
+                self._trading_pair_message_counts.clear()
+                for trading_pairs in shards:
+                    ws: WSAssistant = await self._connected_websocket_assistant()
+                    websocket_assistants.append(ws)
+                    await self._subscribe_trading_pairs(ws=ws, trading_pairs=trading_pairs)
+                self.logger().info(f"Subscribed to {len(self._trading_pairs)} trading pairs through "
+                                   f"{len(shards)} connections.")
+                listening_tasks = [asyncio.ensure_future(self._process_websocket_messages(websocket_assistant=ws))
+                                   for ws in websocket_assistants]
+                done, _ = await asyncio.wait(listening_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to order book streams. Retrying in 5 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                for task in listening_tasks:
+                    task.cancel()
+                for ws in websocket_assistants or [None]:
+                    await self._on_order_stream_interruption(websocket_assistant=ws)
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -114,7 +267,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         Reads the order snapshot events queue. For each event it creates a snapshot message instance and adds it to the
         output queue.
         This method also request the full order book content from the exchange using HTTP requests if it does not
-        receive events during one hour.
+        receive events during one hour, for the trading pairs whose diff update IDs are not checked by the tracker.
 
         :param ev_loop: the event loop the method will run in
         :param output: a queue to add the created snapshot messages
@@ -152,11 +305,22 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             except Exception:
                 self.logger().exception("Unexpected error when processing public trade updates from exchange")
 
+    async def request_order_book_snapshot(self, trading_pair: str, output: asyncio.Queue):
+        """
+        Requests the full order book content for the trading pair and adds the snapshot message to the output queue
+
+        :param trading_pair: the trading pair of the order book
+        :param output: a queue to add the snapshot message
+        """
+        snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
+        await output.put(snapshot)
+
     async def _request_order_book_snapshots(self, output: asyncio.Queue):
         for trading_pair in self._trading_pairs:
+            if trading_pair in self._sequence_checked_trading_pairs:
+                continue
             try:
-                snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
-                output.put_nowait(snapshot)
+                await self.request_order_book_snapshot(trading_pair=trading_pair, output=output)
             except Exception:
                 self.logger().exception(f"Unexpected error fetching order book snapshot for {trading_pair}.")
                 raise
@@ -207,6 +371,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of some trading pairs through the provided websocket
+        connection. Used to shard the subscriptions across several connections.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -217,6 +391,32 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def _message_sequence(self, channel: str, event_message: Dict[str, Any]) -> Optional[Tuple[Hashable, int]]:
+        """
+        Identifies the stream of a message and its position in the stream (its update id or trade id). Used to keep
+        only the first copy of the messages received through the hot standby connections.
+
+        :param channel: the message channel
+        :param event_message: the event received through the websocket connection
+
+        :return: the stream and the sequence number of the message, or None if the message is not part of a stream
+        """
+        return None
+
+    def _channel_originating_raw_message(self, raw_message: str) -> Optional[str]:
+        """
+        Identifies the channel of a text message before it is decoded, with a cheap scan of the raw frame. Messages
+        routed to a queue are decoded when they are queued, while the messages for other channels are discarded without
+        being decoded.
+        Returns None by default, so that the channel is identified by `_channel_originating_message` from the decoded
+        message. Subclasses handling high volume streams can reimplement it.
+
+        :param raw_message: the text frame received through the websocket connection
+
+        :return: the message channel, or None if it has to be identified from the decoded message
+        """
+        return None
+
     async def _process_message_for_unknown_channel(
         self, event_message: Dict[str, Any], websocket_assistant: WSAssistant
     ):
@@ -230,18 +430,42 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        valid_channels = self._get_messages_queue_keys()
         async for ws_response in websocket_assistant.iter_messages():
+            raw_message: Optional[str] = ws_response.raw
+            if raw_message is not None:
+                channel: Optional[str] = self._channel_originating_raw_message(raw_message=raw_message)
+                if channel is not None:
+                    if channel in valid_channels:
+                        await self._queue_message(channel=channel, event_message=ws_response.data)
+                    continue
             data: Dict[str, Any] = ws_response.data
             if data is not None:  # data will be None when the websocket is disconnected
                 channel: str = self._channel_originating_message(event_message=data)
-                valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
-                    self._message_queue[channel].put_nowait(data)
+                    await self._queue_message(channel=channel, event_message=data)
                 else:
                     await self._process_message_for_unknown_channel(
                         event_message=data, websocket_assistant=websocket_assistant
                     )
 
+    def _subscription_shards_count(self) -> int:
+        if not self.supports_subscription_sharding:
+            return 1
+        return subscription_shards_count(
+            trading_pairs_count=len(self._trading_pairs),
+            connections=self._subscription_connections,
+            max_trading_pairs_per_connection=self.MAX_TRADING_PAIRS_PER_CONNECTION)
+
+    async def _queue_message(self, channel: str, event_message: Dict[str, Any]):
+        if self._hot_standby_deduplicator is not None:
+            sequence = self._message_sequence(channel=channel, event_message=event_message)
+            if sequence is not None and not self._hot_standby_deduplicator.accept_sequence(*sequence):
+                # Already received through another connection
+                return
+        # Waits for room in a bounded queue with the BLOCK policy, which stops reading the websocket meanwhile
+        await self._message_queue[channel].put(event_message)
+
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
 
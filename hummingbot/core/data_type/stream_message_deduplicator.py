@@ -0,0 +1,47 @@
+from collections import deque
+from typing import Deque, Dict, Hashable, Set
+
+
+class StreamMessageDeduplicator:
+    """Keeps the first copy of the messages received through several connections subscribed to the same streams.
+
+    Used by the data sources running hot standby websocket connections, so that the messages are processed once
+    whichever connection delivers them first, and the streams keep flowing when one of the connections drops.
+
+    Messages carrying a sequence number (an update id, a trade id) are accepted only when their number is above the
+    last one accepted for their stream, so the connection lagging behind can not replay nor reorder a stream. Messages
+    without a sequence are identified by a key, and the keys of the last `max_keys` accepted messages are remembered.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self._last_sequences: Dict[Hashable, int] = {}
+        self._max_keys = max_keys
+        self._accepted_keys: Set[Hashable] = set()
+        self._accepted_keys_order: Deque[Hashable] = deque()
+
+    def accept_sequence(self, stream: Hashable, sequence: int) -> bool:
+        """
+        :param stream: the stream the message belongs to, for instance the channel and the trading pair
+        :param sequence: the sequence number of the message in its stream
+
+        :return: True if the message was not received yet, and is newer than the messages accepted for the stream
+        """
+        last_sequence = self._last_sequences.get(stream)
+        accepted = last_sequence is None or sequence > last_sequence
+        if accepted:
+            self._last_sequences[stream] = sequence
+        return accepted
+
+    def accept_key(self, key: Hashable) -> bool:
+        """
+        :param key: the key identifying the message
+
+        :return: True if no message with the same key was accepted yet
+        """
+        if key in self._accepted_keys:
+            return False
+        self._accepted_keys.add(key)
+        self._accepted_keys_order.append(key)
+        if len(self._accepted_keys_order) > self._max_keys:
+            self._accepted_keys.discard(self._accepted_keys_order.popleft())
+        return True
@@ -0,0 +1,52 @@
+import math
+from typing import List, Mapping, Optional
+
+
+def subscription_shards_count(trading_pairs_count: int, connections: int, max_trading_pairs_per_connection: int) -> int:
+    """
+    :param trading_pairs_count: number of trading pairs to subscribe to
+    :param connections: number of connections requested
+    :param max_trading_pairs_per_connection: maximum number of trading pairs per connection, 0 means no limit
+
+    :return: the number of connections to spread the subscriptions across
+    """
+    if max_trading_pairs_per_connection > 0:
+        connections = max(connections, math.ceil(trading_pairs_count / max_trading_pairs_per_connection))
+    return max(1, min(connections, trading_pairs_count))
+
+
+def balanced_subscription_shards(
+    trading_pairs: List[str],
+    shards_count: int,
+    max_trading_pairs_per_shard: int = 0,
+    message_counts: Optional[Mapping[str, int]] = None,
+) -> List[List[str]]:
+    """
+    Spreads the trading pairs across the shards, balancing the number of messages each shard receives.
+
+    The busiest trading pairs are assigned first, each one to the shard with the fewest messages so far that still has
+    room for it. Without message counts, the shards get the same number of trading pairs.
+
+    :param trading_pairs: the trading pairs to spread
+    :param shards_count: the number of shards
+    :param max_trading_pairs_per_shard: maximum number of trading pairs per shard, 0 means no limit
+    :param message_counts: number of messages received for each trading pair over the same period
+
+    :return: the trading pairs of each shard, in the order of `trading_pairs`
+    """
+    message_counts = message_counts or {}
+    shards: List[List[str]] = [[] for _ in range(shards_count)]
+    shard_loads: List[int] = [0] * shards_count
+    positions = {trading_pair: position for position, trading_pair in enumerate(trading_pairs)}
+
+    for trading_pair in sorted(trading_pairs, key=lambda pair: (-message_counts.get(pair, 0), positions[pair])):
+        available_shards = [index for index in range(shards_count)
+                            if max_trading_pairs_per_shard <= 0 or len(shards[index]) < max_trading_pairs_per_shard]
+        if not available_shards:
+            raise ValueError(f"{len(trading_pairs)} trading pairs do not fit in {shards_count} shards of "
+                             f"{max_trading_pairs_per_shard} trading pairs.")
+        index = min(available_shards, key=lambda shard_index: (shard_loads[shard_index], len(shards[shard_index])))
+        shards[index].append(trading_pair)
+        shard_loads[index] += message_counts.get(trading_pair, 0)
+
+    return [sorted(shard, key=positions.get) for shard in shards]
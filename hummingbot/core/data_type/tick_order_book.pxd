@@ -0,0 +1,30 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.TickLadder cimport TickLadder
+
+
+cdef class TickOrderBook(OrderBook):
+    cdef TickLadder _bid_ladder
+    cdef TickLadder _ask_ladder
+    cdef double _tick_size
+    cdef int64_t _window_ticks
+
+    cdef c_configure_ladders(self, double tick_size)
+    cdef c_regrid(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks)
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef size_t c_level_count(self, bint is_bid)
+    cdef Py_ssize_t c_fill_snapshot_array(self, bint is_bid, double[:, :] array, Py_ssize_t depth)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
@@ -0,0 +1,340 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/TickLadder.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
+from typing import Iterator, Optional
+
+from cython.operator cimport address as ref, dereference as deref, preincrement as inc
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookDepthIndex cimport OrderBookDepthIndex
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.TickLadder cimport TickLadder, isOnTickGrid, truncateOverlapLevels
+
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+DEFAULT_WINDOW_TICKS = 4096
+MAX_TICK_DECIMALS = 12
+
+
+cdef double _infer_tick_size(vector[OrderBookEntry] &entries):
+    """
+    Finds the coarsest decimal tick size (1, 0.1, 0.01, ...) on which all the entry prices lie.
+    """
+    cdef:
+        double tick_size = 1
+        bint all_on_grid
+    for decimals in range(MAX_TICK_DECIMALS + 1):
+        tick_size = 10.0 ** -decimals
+        all_on_grid = True
+        for entry in entries:
+            if not isOnTickGrid(entry.getPrice(), tick_size):
+                all_on_grid = False
+                break
+        if all_on_grid:
+            break
+    return tick_size
+
+
+cdef _append_ladder_entries(TickLadder &ladder, vector[OrderBookEntry] &entries):
+    cdef:
+        TickLadder.const_iterator it = ladder.begin()
+    while it != ladder.end():
+        entries.push_back(deref(it))
+        inc(it)
+
+
+cdef _rebuild_ladder_depth_index(OrderBookDepthIndex &depth_index, TickLadder &ladder):
+    cdef:
+        TickLadder.const_iterator it = ladder.begin()
+    depth_index.clear()
+    while it != ladder.end():
+        depth_index.setLevel(deref(it).getPrice(), deref(it).getAmount())
+        inc(it)
+
+
+cdef class TickOrderBook(OrderBook):
+    """
+    Order book storing each side in a contiguous array indexed by price tick, instead of a std::set per side.
+
+    Applying a diff is a direct array write instead of a tree insertion, which suits diff heavy feeds. Each side keeps
+    a window of window_ticks ticks that slides with the best price; levels deeper than the window are kept in an
+    ordered set per side (counted in overflow_levels), so the book holds the same levels as OrderBook whatever the
+    window. When tick_size is not given, the coarsest decimal tick that fits the prices seen is used, and the book is
+    regridded if a finer price shows up later. An off-grid price can force a very fine tick, whose window covers a
+    narrow price range and leaves most levels in the overflow, so the tick size from the trading rules should be given
+    when it is known.
+
+    The cumulative depth index of OrderBook is kept from the diffs, and rebuilt from the ladders after snapshots.
+
+    Connectors select it through their data source, e.g.
+    data_source.order_book_create_function = lambda: TickOrderBook()
+    """
+
+    def __init__(self,
+                 tick_size: Optional[float] = None,
+                 window_ticks: int = DEFAULT_WINDOW_TICKS,
+                 dex=False,
+                 depth_index=False):
+        super().__init__(dex=dex, depth_index=depth_index)
+        self._tick_size = 0
+        self._window_ticks = window_ticks
+        if tick_size is not None:
+            self.c_configure_ladders(tick_size)
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    @property
+    def window_ticks(self) -> int:
+        return self._window_ticks
+
+    @property
+    def overflow_levels(self) -> int:
+        """
+        Number of levels currently kept outside of the sliding windows.
+        """
+        return self._bid_ladder.getOverflowLevels() + self._ask_ladder.getOverflowLevels()
+
+    cdef c_rebuild_depth_index(self):
+        _rebuild_ladder_depth_index(self._bid_depth_index, self._bid_ladder)
+        _rebuild_ladder_depth_index(self._ask_depth_index, self._ask_ladder)
+
+    cdef c_configure_ladders(self, double tick_size):
+        self._tick_size = tick_size
+        self._bid_ladder.configure(tick_size, self._window_ticks, True)
+        self._ask_ladder.configure(tick_size, self._window_ticks, False)
+
+    cdef c_regrid(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks):
+        """
+        Moves the book to the coarsest tick size on which both its current levels and the new entries lie.
+        """
+        cdef:
+            vector[OrderBookEntry] current_bids
+            vector[OrderBookEntry] current_asks
+            vector[OrderBookEntry] all_entries
+
+        _append_ladder_entries(self._bid_ladder, current_bids)
+        _append_ladder_entries(self._ask_ladder, current_asks)
+        all_entries.insert(all_entries.end(), current_bids.begin(), current_bids.end())
+        all_entries.insert(all_entries.end(), current_asks.begin(), current_asks.end())
+        all_entries.insert(all_entries.end(), bids.begin(), bids.end())
+        all_entries.insert(all_entries.end(), asks.begin(), asks.end())
+
+        self.c_configure_ladders(_infer_tick_size(all_entries))
+        if not current_bids.empty():
+            self._bid_ladder.reset(current_bids.front().getPrice())
+            for entry in current_bids:
+                self._bid_ladder.insertLevel(entry)
+        if not current_asks.empty():
+            self._ask_ladder.reset(current_asks.front().getPrice())
+            for entry in current_asks:
+                self._ask_ladder.insertLevel(entry)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            bint needs_regrid = self._tick_size == 0
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        for entry in bids:
+            needs_regrid = needs_regrid or not self._bid_ladder.isOnGrid(entry.getPrice())
+        for entry in asks:
+            needs_regrid = needs_regrid or not self._ask_ladder.isOnGrid(entry.getPrice())
+        if needs_regrid:
+            self.c_regrid(bids, asks)
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            self._bid_ladder.setLevel(bid)
+        for ask in asks:
+            self._ask_ladder.setLevel(ask)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see TickLadder.cpp
+        truncateOverlapLevels(self._bid_ladder, self._ask_ladder, self._dex)
+
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_ladder.empty():
+            self._best_bid = self._bid_ladder.best().getPrice()
+        if not self._ask_ladder.empty():
+            self._best_ask = self._ask_ladder.best().getPrice()
+
+        if self._depth_index_enabled:
+            for bid in bids:
+                self._bid_depth_index.setLevel(bid.getPrice(), bid.getAmount())
+            for ask in asks:
+                self._ask_depth_index.setLevel(ask.getPrice(), ask.getAmount())
+            # Drop the levels removed from the ladders by the overlap truncation.
+            if self._bid_ladder.empty():
+                self._bid_depth_index.clear()
+            else:
+                self._bid_depth_index.eraseAbove(self._best_bid)
+            if self._ask_ladder.empty():
+                self._ask_depth_index.clear()
+            else:
+                self._ask_depth_index.eraseBelow(self._best_ask)
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double best_bid_price = NaN
+            double best_ask_price = NaN
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            bint needs_regrid = self._tick_size == 0
+
+        for bid in bids:
+            needs_regrid = needs_regrid or not self._bid_ladder.isOnGrid(bid.getPrice())
+            if bid.getAmount() > 0 and not (bid.getPrice() <= best_bid_price):
+                best_bid_price = bid.getPrice()
+        for ask in asks:
+            needs_regrid = needs_regrid or not self._ask_ladder.isOnGrid(ask.getPrice())
+            if ask.getAmount() > 0 and not (ask.getPrice() >= best_ask_price):
+                best_ask_price = ask.getPrice()
+
+        # Start with an empty order book, anchored at the best prices, and then insert all entries.
+        self._bid_ladder.clear()
+        self._ask_ladder.clear()
+        if needs_regrid:
+            self.c_regrid(bids, asks)
+        if best_bid_price == best_bid_price:
+            self._bid_ladder.reset(best_bid_price)
+        if best_ask_price == best_ask_price:
+            self._ask_ladder.reset(best_ask_price)
+        for bid in bids:
+            self._bid_ladder.insertLevel(bid)
+        for ask in asks:
+            self._ask_ladder.insertLevel(ask)
+
+        if self._dex:
+            truncateOverlapLevels(self._bid_ladder, self._ask_ladder, self._dex)
+
+        # Record the current best prices, for faster c_get_price() calls.
+        self._best_bid = self._bid_ladder.best().getPrice() if not self._bid_ladder.empty() else NaN
+        self._best_ask = self._ask_ladder.best().getPrice() if not self._ask_ladder.empty() else NaN
+
+        if self._depth_index_enabled:
+            self.c_rebuild_depth_index()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            TickLadder.const_iterator it = self._bid_ladder.begin()
+            OrderBookEntry entry
+        while it != self._bid_ladder.end():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            TickLadder.const_iterator it = self._ask_ladder.begin()
+            OrderBookEntry entry
+        while it != self._ask_ladder.end():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+
+    cdef size_t c_level_count(self, bint is_bid):
+        return self._bid_ladder.size() if is_bid else self._ask_ladder.size()
+
+    cdef Py_ssize_t c_fill_snapshot_array(self, bint is_bid, double[:, :] array, Py_ssize_t depth):
+        cdef:
+            TickLadder *ladder = ref(self._bid_ladder) if is_bid else ref(self._ask_ladder)
+            TickLadder.const_iterator it = deref(ladder).begin()
+            OrderBookEntry entry
+            Py_ssize_t row = 0
+        while row < depth and it != deref(ladder).end():
+            entry = deref(it)
+            array[row, 0] = entry.getPrice()
+            array[row, 1] = entry.getAmount()
+            array[row, 2] = entry.getUpdateId()
+            inc(it)
+            row += 1
+        return row
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+        if deref(ladder).empty():
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_price = NaN
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getPriceForVolume(is_buy, volume, result_price, result_volume)
+        else:
+            deref(ladder).getPriceForVolume(volume, result_price, result_volume)
+        return OrderBookQueryResult(NaN, volume, result_price, result_volume)
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_vwap = NaN
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getVwapForVolume(is_buy, volume, result_vwap, result_volume)
+        else:
+            deref(ladder).getVwapForVolume(volume, result_vwap, result_volume)
+        return OrderBookQueryResult(NaN, volume, result_vwap, result_volume)
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_price = NaN
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getPriceForQuoteVolume(is_buy, quote_volume, result_price, result_volume)
+        else:
+            deref(ladder).getPriceForQuoteVolume(quote_volume, result_price, result_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result_price, result_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_quote_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getQuoteVolumeForBaseAmount(is_buy, base_amount, result_quote_volume)
+        else:
+            deref(ladder).getQuoteVolumeForBaseAmount(base_amount, result_quote_volume)
+        return OrderBookQueryResult(NaN, base_amount, NaN, result_quote_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_price = NaN
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getVolumeForPrice(is_buy, price, result_price, result_volume)
+        else:
+            deref(ladder).getVolumeForPrice(price, result_price, result_volume)
+        return OrderBookQueryResult(price, NaN, result_price, result_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            TickLadder *ladder = ref(self._ask_ladder) if is_buy else ref(self._bid_ladder)
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            double result_price = NaN
+            double result_volume = 0
+        if self._depth_index_enabled:
+            deref(depth_index).getQuoteVolumeForPrice(is_buy, price, result_price, result_volume)
+        else:
+            deref(ladder).getQuoteVolumeForPrice(price, result_price, result_volume)
+        return OrderBookQueryResult(price, NaN, result_price, result_volume)
@@ -1,7 +1,8 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
+from hummingbot.core.data_type.bounded_message_queue import BoundedMessageQueue
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
@@ -16,8 +17,13 @@ class UserStreamTracker:
             cls._ust_logger = logging.getLogger(__name__)
         return cls._ust_logger
 
-    def __init__(self, data_source: UserStreamTrackerDataSource):
-        self._user_stream: asyncio.Queue = asyncio.Queue()
+    def __init__(self, data_source: UserStreamTrackerDataSource, queue_max_size: int = 0):
+        """
+        :param queue_max_size: maximum number of messages in the user stream queue, 0 means no bound. User stream
+        messages are never dropped nor merged: when the queue is full the data source waits for room before reading
+        the next message from the exchange
+        """
+        self._user_stream: asyncio.Queue = BoundedMessageQueue(max_size=queue_max_size)
         self._data_source = data_source
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
 
@@ -38,3 +44,7 @@ class UserStreamTracker:
     @property
     def user_stream(self) -> asyncio.Queue:
         return self._user_stream
+
+    @property
+    def queue_stats(self) -> Dict[str, int]:
+        return self._user_stream.stats
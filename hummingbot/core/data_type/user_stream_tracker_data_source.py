@@ -2,18 +2,23 @@ import asyncio
 import logging
 import time
 from abc import ABCMeta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
+from hummingbot.core.data_type.stream_message_deduplicator import StreamMessageDeduplicator
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
 class UserStreamTrackerDataSource(metaclass=ABCMeta):
+    HOT_STANDBY_CONNECTIONS = 2
 
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self):
         self._ws_assistant: Optional[WSAssistant] = None
+        self._hot_standby_deduplicator: Optional[StreamMessageDeduplicator] = None
+        self._hot_standby_ws_assistants: List[WSAssistant] = []
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -28,18 +33,43 @@ class UserStreamTrackerDataSource(metaclass=ABCMeta):
 
         :return: the timestamp of the last received message in seconds
         """
+        if self._hot_standby_ws_assistants:
+            return max(ws_assistant.last_recv_time for ws_assistant in self._hot_standby_ws_assistants)
         if self._ws_assistant:
             return self._ws_assistant.last_recv_time
         return 0
 
+    @property
+    def supports_hot_standby(self) -> bool:
+        """
+        Whether the data source can keep hot standby websocket connections. Subclasses whose connections can run side
+        by side, and implementing `_event_message_key`, return True.
+        """
+        return False
+
+    def enable_hot_standby(self):
+        """
+        Keeps `HOT_STANDBY_CONNECTIONS` websocket connections to the user stream, instead of a single one. The first
+        copy of each event is processed and the others are discarded, so when a connection drops the events keep
+        flowing through the other ones while it reconnects.
+        """
+        if not self.supports_hot_standby:
+            raise NotImplementedError(f"{type(self).__name__} does not support hot standby connections.")
+        self._hot_standby_deduplicator = StreamMessageDeduplicator()
+
     async def listen_for_user_stream(self, output: asyncio.Queue):
         """
         Connects to the user private channel in the exchange using a websocket connection. With the established
         connection listens to all balance events and order updates provided by the exchange, and stores them in the
-        output queue
+        output queue. With hot standby enabled, the events are received through several connections, each one
+        reconnecting on its own.
 
         :param output: the queue to use to store the received messages
         """
+        if self._hot_standby_deduplicator is not None:
+            await safe_gather(*[self._listen_for_user_stream_on_standby_connection(output=output)
+                                for _ in range(self.HOT_STANDBY_CONNECTIONS)])
+            return
         while True:
             try:
                 self._ws_assistant = await self._connected_websocket_assistant()
@@ -57,6 +87,27 @@ class UserStreamTrackerDataSource(metaclass=ABCMeta):
                 await self._on_user_stream_interruption(websocket_assistant=self._ws_assistant)
                 self._ws_assistant = None
 
+    async def _listen_for_user_stream_on_standby_connection(self, output: asyncio.Queue):
+        while True:
+            websocket_assistant: Optional[WSAssistant] = None
+            try:
+                websocket_assistant = await self._connected_websocket_assistant()
+                self._hot_standby_ws_assistants.append(websocket_assistant)
+                await self._subscribe_channels(websocket_assistant=websocket_assistant)
+                await self._send_ping(websocket_assistant=websocket_assistant)  # to update last_recv_timestamp
+                await self._process_websocket_messages(websocket_assistant=websocket_assistant, queue=output)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception("Unexpected error while listening to user stream. Retrying after 5 seconds...")
+                await self._sleep(1.0)
+            finally:
+                if websocket_assistant in self._hot_standby_ws_assistants:
+                    self._hot_standby_ws_assistants.remove(websocket_assistant)
+                await self._on_user_stream_interruption(websocket_assistant=websocket_assistant)
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         """
         Creates an instance of WSAssistant connected to the exchange
@@ -76,11 +127,28 @@ class UserStreamTrackerDataSource(metaclass=ABCMeta):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant, queue: asyncio.Queue):
         async for ws_response in websocket_assistant.iter_messages():
             data = ws_response.data
+            if self._hot_standby_deduplicator is not None and not self._is_first_copy(event_message=data):
+                # Already received through another connection
+                continue
             await self._process_event_message(event_message=data, queue=queue)
 
+    def _event_message_key(self, event_message: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Identifies an event, to keep only its first copy when it is received through the hot standby connections.
+
+        :param event_message: the event received through the websocket connection
+
+        :return: the key identifying the event, or None if the event is processed from every connection
+        """
+        return None
+
+    def _is_first_copy(self, event_message: Dict[str, Any]) -> bool:
+        key = self._event_message_key(event_message=event_message)
+        return key is None or self._hot_standby_deduplicator.accept_key(key)
+
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0:
-            queue.put_nowait(event_message)
+            await queue.put(event_message)
 
     async def _on_user_stream_interruption(self, websocket_assistant: Optional[WSAssistant]):
         websocket_assistant and await websocket_assistant.disconnect()
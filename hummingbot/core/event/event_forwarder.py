@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
-from typing import Callable
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Tuple
 
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
+from hummingbot.logger import HummingbotLogger
+
+bef_logger = None
 
 
 class EventForwarder(EventListener):
@@ -22,3 +28,82 @@ class SourceInfoEventForwarder(EventListener):
 
     def __call__(self, arg: any):
         self._to_function(self.current_event_tag, self.current_event_caller, arg)
+
+
+class BufferedEventForwarder(SourceInfoEventForwarder):
+    """
+    SourceInfoEventForwarder for slow listeners, like database or telemetry sinks, that takes the forwarded function off
+    the code path triggering the event. The events are queued and forwarded in order, in batches of up to
+    max_batch_size events, by callbacks scheduled on the event loop.
+
+    The queue is bounded: when max_queue_size events are already queued, the event trigger waits for the whole queue
+    to be forwarded, so that no event is lost and the order is kept.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global bef_logger
+        if bef_logger is None:
+            bef_logger = logging.getLogger(__name__)
+        return bef_logger
+
+    def __init__(self,
+                 to_function: Callable[[int, PubSub, any], None],
+                 ev_loop: Optional[asyncio.AbstractEventLoop] = None,
+                 max_queue_size: int = 10000,
+                 max_batch_size: int = 100):
+        super().__init__(to_function)
+        self._ev_loop: asyncio.AbstractEventLoop = ev_loop or asyncio.get_event_loop()
+        self._max_queue_size: int = max_queue_size
+        self._max_batch_size: int = max_batch_size
+        self._queue: Deque[Tuple[int, PubSub, Any]] = deque()
+        self._batch_scheduled: bool = False
+        self._max_depth: int = 0
+        self._overflows: int = 0
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def overflows(self) -> int:
+        """
+        Number of times the queue was full and the event trigger had to forward the queued events itself.
+        """
+        return self._overflows
+
+    def __call__(self, arg: any):
+        self._queue.append((self.current_event_tag, self.current_event_caller, arg))
+        self._max_depth = max(self._max_depth, len(self._queue))
+        if len(self._queue) > self._max_queue_size:
+            self._overflows += 1
+            self.flush()
+        elif not self._batch_scheduled:
+            self._batch_scheduled = True
+            # Events can be triggered from other threads, the batches always run in the event loop thread
+            self._ev_loop.call_soon_threadsafe(self._forward_batch)
+
+    def flush(self):
+        """
+        Forwards all the queued events right away.
+        """
+        while len(self._queue) > 0:
+            self._forward(*self._queue.popleft())
+
+    def _forward_batch(self):
+        self._batch_scheduled = False
+        for _ in range(min(self._max_batch_size, len(self._queue))):
+            self._forward(*self._queue.popleft())
+        if len(self._queue) > 0 and not self._batch_scheduled:
+            self._batch_scheduled = True
+            self._ev_loop.call_soon(self._forward_batch)
+
+    def _forward(self, event_tag: int, caller: PubSub, arg: Any):
+        try:
+            self._to_function(event_tag, caller, arg)
+        except Exception:
+            self.logger().error(f"Unexpected error while forwarding event {event_tag}.", exc_info=True)
@@ -38,6 +38,7 @@ class MarketEvent(Enum):
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
     OrderBookDataSourceUpdateEvent = 904
+    BestPriceUpdateEvent = 905
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -152,6 +153,11 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookBestPriceEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -17,6 +17,7 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        dict _dispatch_snapshots
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
@@ -24,4 +25,5 @@ cdef class PubSub:
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef tuple c_get_dispatch_snapshot(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
@@ -37,10 +37,14 @@ cdef class PubSub:
     1. c_add_listener():
        Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
        make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    2. c_remove_listener() and c_get_listeners():
+       Every time. This assumes they are called infrequently.
+    3. c_trigger_event():
+       Only when a dead listener was met while dispatching the event.
+
+    c_trigger_event() dispatches the event to a snapshot of the listener weak references of the event tag, a tuple
+    which is cached until the listeners of the event tag change. Triggering an event thus neither scans nor copies the
+    listener set.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +56,9 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._dispatch_snapshots = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -83,6 +90,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._dispatch_snapshots.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +108,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._dispatch_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,6 +127,8 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._dispatch_snapshots.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
@@ -143,23 +154,36 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
+    cdef tuple c_get_dispatch_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
-            EventListener typed_listener
+            tuple snapshot = self._dispatch_snapshots.get(event_tag)
+            EventsIterator it
+        if snapshot is not None:
+            return snapshot
+
+        it = self._events.find(event_tag)
         if it == self._events.end():
-            return
+            snapshot = ()
+        else:
+            snapshot = tuple([<object>pyref.get() for pyref in deref(it).second])
+        self._dispatch_snapshots[event_tag] = snapshot
+        return snapshot
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
+        cdef:
+            # It is extremely important that this is an immutable snapshot and not the listener set - because
+            # listeners are allowed to call c_remove_listener(), which would break the iteration over the set.
+            tuple snapshot = self.c_get_dispatch_snapshot(event_tag)
+            object listener
+            EventListener typed_listener
+            bint has_dead_listeners = False
+
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +191,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
@@ -0,0 +1,174 @@
+import math
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+# Upper bounds (in seconds) of the tick duration histogram buckets, the last bucket has no upper bound
+TICK_DURATION_BUCKETS: Tuple[float, ...] = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class TickDurationHistogram:
+    """
+    Histogram of the c_tick() durations of a time iterator, with logarithmic buckets.
+    """
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * (len(TICK_DURATION_BUCKETS) + 1)
+        self._count = 0
+        self._total_duration = 0.0
+        self._max_duration = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total_duration(self) -> float:
+        return self._total_duration
+
+    @property
+    def max_duration(self) -> float:
+        return self._max_duration
+
+    @property
+    def mean_duration(self) -> float:
+        return self._total_duration / self._count if self._count > 0 else 0.0
+
+    @property
+    def bucket_counts(self) -> Dict[str, int]:
+        labels = [f"<={bound:g}s" for bound in TICK_DURATION_BUCKETS] + [f">{TICK_DURATION_BUCKETS[-1]:g}s"]
+        return dict(zip(labels, self._bucket_counts))
+
+    def add(self, duration: float):
+        self._bucket_counts[bisect_left(TICK_DURATION_BUCKETS, duration)] += 1
+        self._count += 1
+        self._total_duration += duration
+        self._max_duration = max(self._max_duration, duration)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :return: the upper bound of the bucket holding the percentile (the max duration for the last bucket)
+        """
+        if self._count == 0:
+            return 0.0
+        rank = math.ceil(self._count * percentile / 100)
+        cumulative_count = 0
+        for index, bucket_count in enumerate(self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return TICK_DURATION_BUCKETS[index] if index < len(TICK_DURATION_BUCKETS) else self._max_duration
+        return self._max_duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "mean_duration": self.mean_duration,
+            "max_duration": self._max_duration,
+            "p99_duration": self.percentile(99),
+            "buckets": self.bucket_counts,
+        }
+
+
+class TickProfiler:
+    """
+    Records how the clock ticks are spent: the c_tick() duration histogram of each time iterator, the ticks whose
+    iterators took longer than the tick size (overrunning ticks), the ticks skipped because the clock woke up more than
+    a tick size late (missed ticks), and the scheduling drift between the planned and the actual wake-up times.
+
+    The histograms are kept per iterator instance, the iterators sharing a name are reported with a numbered label.
+    """
+
+    def __init__(self, tick_size: float):
+        self._tick_size = tick_size
+        # Keyed by the id of the iterator, which is kept along with its histogram so that the id is not reused
+        self._iterator_histograms: Dict[int, Tuple[Any, TickDurationHistogram]] = {}
+        self._tick_histogram = TickDurationHistogram()
+        self._overrunning_ticks = 0
+        self._missed_ticks = 0
+        self._wake_ups = 0
+        self._total_drift = 0.0
+        self._max_drift = 0.0
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        return getattr(iterator, "display_name", None) or type(iterator).__name__
+
+    @property
+    def overrunning_ticks(self) -> int:
+        return self._overrunning_ticks
+
+    @property
+    def missed_ticks(self) -> int:
+        return self._missed_ticks
+
+    @property
+    def mean_drift(self) -> float:
+        return self._total_drift / self._wake_ups if self._wake_ups > 0 else 0.0
+
+    @property
+    def max_drift(self) -> float:
+        return self._max_drift
+
+    @property
+    def iterator_histograms(self) -> Dict[str, TickDurationHistogram]:
+        """
+        :return: the histogram of each iterator, by label in the order the iterators first ticked
+        """
+        histograms: Dict[str, TickDurationHistogram] = {}
+        name_counts: Dict[str, int] = {}
+        for iterator, histogram in self._iterator_histograms.values():
+            name = self.iterator_name(iterator)
+            name_counts[name] = name_counts.get(name, 0) + 1
+            label = name if name_counts[name] == 1 else f"{name} ({name_counts[name]})"
+            histograms[label] = histogram
+        return histograms
+
+    @property
+    def tick_histogram(self) -> TickDurationHistogram:
+        return self._tick_histogram
+
+    def record_wake_up(self, scheduled_time: float, wake_up_time: float):
+        drift = wake_up_time - scheduled_time
+        self._wake_ups += 1
+        self._total_drift += drift
+        self._max_drift = max(self._max_drift, drift)
+        if drift >= self._tick_size:
+            self._missed_ticks += int(drift // self._tick_size)
+
+    def record_iterator_tick(self, iterator: Any, duration: float):
+        entry = self._iterator_histograms.get(id(iterator))
+        if entry is None:
+            entry = self._iterator_histograms[id(iterator)] = (iterator, TickDurationHistogram())
+        entry[1].add(duration)
+
+    def record_tick(self, duration: float):
+        self._tick_histogram.add(duration)
+        if duration > self._tick_size:
+            self._overrunning_ticks += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks": self._tick_histogram.count,
+            "overrunning_ticks": self._overrunning_ticks,
+            "missed_ticks": self._missed_ticks,
+            "mean_drift": self.mean_drift,
+            "max_drift": self._max_drift,
+            "tick": self._tick_histogram.to_dict(),
+            "iterators": {label: histogram.to_dict() for label, histogram in self.iterator_histograms.items()},
+        }
+
+    def format_status(self) -> str:
+        lines = ["\n  Clock tick profile:",
+                 f"    Ticks: {self._tick_histogram.count}, overrunning: {self._overrunning_ticks}, "
+                 f"missed: {self._missed_ticks}, "
+                 f"drift mean/max (ms): {self.mean_drift * 1e3:.3f}/{self._max_drift * 1e3:.3f}"]
+        rows = [[name,
+                 histogram.count,
+                 histogram.mean_duration * 1e3,
+                 histogram.percentile(99) * 1e3,
+                 histogram.max_duration * 1e3]
+                for name, histogram in [("All iterators", self._tick_histogram)] + list(self.iterator_histograms.items())]
+        df = pd.DataFrame(rows, columns=["Iterator", "Ticks", "Mean (ms)", "p99 (ms)", "Max (ms)"])
+        lines.extend(["    " + line for line in df.to_string(index=False, float_format="%.3f").split("\n")])
+        return "\n".join(lines)
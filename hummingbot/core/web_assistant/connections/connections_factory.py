@@ -1,7 +1,12 @@
-from typing import Optional
+import asyncio
+from typing import List, Optional
 
 import aiohttp
+from yarl import URL
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -12,28 +17,97 @@ class ConnectionsFactory:
     The purpose of the class is to isolate the general `web_assistant` infrastructure from the underlying library
     (in this case, `aiohttp`) to enable dependency change with minimal refactoring of the code.
 
+    All the connections share one client session, whose connection pool is configured with the `ConnectionPoolConfig`.
+
     Note: One future possibility is to enable injection of a specific connection factory implementation in the
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, pool_config: Optional[ConnectionPoolConfig] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._pool_config = pool_config or ConnectionPoolConfig()
+
+    @property
+    def pool_config(self) -> ConnectionPoolConfig:
+        return self._pool_config
+
+    def configure_pool(self, pool_config: ConnectionPoolConfig):
+        """
+        Changes the settings of the connection pool. They can only be changed before the first connection is created.
+        """
+        if self._shared_client is not None:
+            raise RuntimeError("The connection pool can not be configured once the connections are created.")
+        self._pool_config = pool_config
 
-    async def get_rest_connection(self) -> RESTConnection:
+    async def get_rest_connection(self, json_codec: JSONCodec = DEFAULT_JSON_CODEC) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=json_codec)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, json_codec: JSONCodec = DEFAULT_JSON_CODEC) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_codec=json_codec)
         return connection
 
+    async def prewarm(self,
+                      urls: List[str],
+                      connections_per_host: int,
+                      throttler: Optional[AsyncThrottlerBase] = None,
+                      throttler_limit_id: Optional[str] = None) -> int:
+        """
+        Opens connections to the hosts of the URLs ahead of the requests, so that the next requests do not pay the TCP
+        and TLS handshakes. The connections are opened with concurrent HEAD requests to the root of each host, and
+        stay in the pool until they are idle for longer than the keep-alive timeout.
+
+        :param urls: URLs of the endpoints the connections are for, only their hosts are used
+        :param connections_per_host: number of connections to open to each host
+        :param throttler: throttler each HEAD request waits for, as the exchanges count them in their rate limits
+        :param throttler_limit_id: rate limit the HEAD requests are counted in, required with a throttler
+
+        :return: the number of connections opened
+        """
+        if throttler is not None and throttler_limit_id is None:
+            raise ValueError("The rate limit of the prewarm requests is required to throttle them.")
+        shared_client = await self._get_shared_client()
+        origins = {URL(url).origin() for url in urls}
+        results = await asyncio.gather(
+            *[self._open_connection(shared_client, origin, throttler, throttler_limit_id)
+              for origin in origins
+              for _ in range(connections_per_host)],
+            return_exceptions=True)
+        return sum(1 for result in results if not isinstance(result, BaseException))
+
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_config.limit,
+                limit_per_host=self._pool_config.limit_per_host,
+                keepalive_timeout=self._pool_config.keepalive_timeout,
+                use_dns_cache=self._pool_config.use_dns_cache,
+                ttl_dns_cache=self._pool_config.ttl_dns_cache,
+                enable_cleanup_closed=self._pool_config.enable_cleanup_closed,
+            )
+            self._shared_client = aiohttp.ClientSession(connector=connector)
         return self._shared_client
+
+    @staticmethod
+    async def _open_connection(client: aiohttp.ClientSession,
+                               origin: URL,
+                               throttler: Optional[AsyncThrottlerBase],
+                               throttler_limit_id: Optional[str]):
+        if throttler is not None:
+            async with throttler.execute_task(limit_id=throttler_limit_id):
+                await ConnectionsFactory._send_head_request(client, origin)
+        else:
+            await ConnectionsFactory._send_head_request(client, origin)
+
+    @staticmethod
+    async def _send_head_request(client: aiohttp.ClientSession, origin: URL):
+        # Any response will do, the connection is returned to the pool once the response is read
+        async with client.head(origin, allow_redirects=False) as response:
+            await response.read()
@@ -4,7 +4,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
-import ujson
+
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
@@ -24,6 +25,23 @@ class RESTMethod(Enum):
         return self.value
 
 
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Settings of the HTTP connection pool shared by the REST and WebSocket connections of a web assistants factory.
+
+    The defaults are the `aiohttp` ones, except for the DNS cache, which is kept longer since the exchange hosts
+    rarely change. `keepalive_timeout` is the time an idle connection is kept open for the next request: keeping it
+    open longer saves the TCP and TLS handshakes of the requests sent after a quiet period, but it should stay below
+    the idle timeout of the exchange servers.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 300
+    enable_cleanup_closed: bool = False
+
+
 @dataclass
 class RESTRequest:
     method: RESTMethod
@@ -73,7 +91,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = DEFAULT_JSON_CODEC.dumps(self.data)
         elif self.data is not None:
             raise ValueError(
                 "The `data` field should be used only for POST requests. Use `params` instead."
@@ -87,8 +105,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: JSONCodec = DEFAULT_JSON_CODEC):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec
 
     @property
     def url(self) -> str:
@@ -111,9 +130,15 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json(content_type=None)
+        body = await self._aiohttp_response.read()
+        json_ = self._json_codec.loads(body) if body.strip() else None
         return json_
 
+    async def read(self) -> bytes:
+        """Returns the raw body, for callers that parse it lazily."""
+        body = await self._aiohttp_response.read()
+        return body
+
     async def text(self) -> str:
         text_ = await self._aiohttp_response.text()
         return text_
@@ -148,3 +173,42 @@ class WSPlainTextRequest(WSRequest):
 @dataclass
 class WSResponse:
     data: Any
+
+    @property
+    def raw(self) -> Optional[str]:
+        """The text frame the response data was decoded from, if it is available"""
+        return None
+
+
+class LazyWSResponse(WSResponse):
+    """A text frame received through a websocket, decoded only when its data is accessed.
+
+    The frame is decoded once, with the connection JSON codec. Frames that are not valid JSON are returned as text.
+    The raw frame stays available to identify the message without decoding it, until the data is replaced.
+    """
+
+    def __init__(self, raw: str, json_codec: JSONCodec = DEFAULT_JSON_CODEC):
+        self._raw: Optional[str] = raw
+        self._json_codec = json_codec
+        self._data: Any = None
+        self._decoded = False
+
+    @property
+    def raw(self) -> Optional[str]:
+        return self._raw
+
+    @property
+    def data(self) -> Any:
+        if not self._decoded:
+            try:
+                self._data = self._json_codec.loads(self._raw)
+            except ValueError:
+                self._data = self._raw
+            self._decoded = True
+        return self._data
+
+    @data.setter
+    def data(self, data: Any):
+        self._data = data
+        self._decoded = True
+        self._raw = None
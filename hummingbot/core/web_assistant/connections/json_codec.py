@@ -0,0 +1,88 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JSONCodec(ABC):
+    """Encodes request bodies and decodes response bodies for the web assistants.
+
+    `dumps` must return a `str`, since the authenticators sign the request body as text. `loads` accepts both `str`
+    and `bytes`, so responses can be decoded without building an intermediate string, and raises a `ValueError` on
+    invalid documents.
+    """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        ...
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is required to use the OrjsonCodec.")
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+def default_json_codec() -> JSONCodec:
+    """Returns the fastest codec available: orjson (a declared dependency), or ujson on installs that lack it."""
+    return OrjsonCodec() if orjson is not None else UJSONCodec()
+
+
+DEFAULT_JSON_CODEC: JSONCodec = default_json_codec()
+
+
+def scan_json_string_field(raw: str, key: str) -> Optional[str]:
+    """
+    Returns the value of the first `"key": "value"` string field of a JSON text, without decoding the text.
+
+    The scan does not follow the structure of the document and does not unescape the value, so it is meant for fields
+    the sender puts before any nested data, like the event type or the stream name of the exchange messages.
+
+    :param raw: the JSON text
+    :param key: the field name
+
+    :return: the field value, or None if the text has no such string field
+    """
+    marker = f'"{key}":'
+    start = raw.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    while start < len(raw) and raw[start] == " ":
+        start += 1
+    if start == len(raw) or raw[start] != '"':
+        return None
+    end = raw.find('"', start + 1)
+    return raw[start + 1:end] if end >= 0 else None
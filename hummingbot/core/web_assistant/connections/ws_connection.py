@@ -1,16 +1,17 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
-from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import LazyWSResponse, WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: JSONCodec = DEFAULT_JSON_CODEC):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -122,14 +123,11 @@ class WSConnection:
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
-        if msg.type == aiohttp.WSMsgType.BINARY:
-            data = msg.data
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        if msg.type == aiohttp.WSMsgType.TEXT:
+            # Text frames are decoded when their data is first accessed, so that the messages discarded by the
+            # receiver from the raw frame are never decoded
+            response = LazyWSResponse(msg.data, json_codec=self._json_codec)
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
-        response = WSResponse(data)
+            response = WSResponse(msg.data)
         return response
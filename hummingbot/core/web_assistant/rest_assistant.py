@@ -1,14 +1,16 @@
-import json
+import copy
 from asyncio import wait_for
-from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_REQUEST_PRIORITY, RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 
 
 class RESTAssistant:
@@ -17,6 +19,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    Request bodies are encoded with the `json_codec`, which should be the one the connection decodes responses with.
+    When a `request_coalescer` is given, identical public GET requests sent at the same time share one network call.
     """
     def __init__(
         self,
@@ -25,12 +30,16 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+        request_coalescer: Optional[RESTRequestCoalescer] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec
+        self._request_coalescer = request_coalescer
 
     async def execute_request(
         self,
@@ -43,6 +52,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -54,10 +64,40 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            priority=priority,
         )
         response_json = await response.json()
         return response_json
 
+    async def execute_request_and_get_bytes(
+        self,
+        url: str,
+        throttler_limit_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        method: RESTMethod = RESTMethod.GET,
+        is_auth_required: bool = False,
+        return_err: bool = False,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
+    ) -> bytes:
+        """Same as `execute_request`, but returns the raw response body for callers that parse it lazily."""
+        response = await self.execute_request_and_get_response(
+            url=url,
+            throttler_limit_id=throttler_limit_id,
+            params=params,
+            data=data,
+            method=method,
+            is_auth_required=is_auth_required,
+            return_err=return_err,
+            timeout=timeout,
+            headers=headers,
+            priority=priority,
+        )
+        body = await response.read()
+        return body
+
     async def execute_request_and_get_response(
             self,
             url: str,
@@ -69,8 +109,61 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
     ) -> RESTResponse:
+        request_args = dict(
+            url=url,
+            throttler_limit_id=throttler_limit_id,
+            params=params,
+            data=data,
+            method=method,
+            is_auth_required=is_auth_required,
+            return_err=return_err,
+            timeout=timeout,
+            headers=headers,
+            priority=priority,
+        )
+        key = None
+        if (self._request_coalescer is not None
+                and method == RESTMethod.GET
+                and not is_auth_required
+                and data is None):
+            key = RESTRequestCoalescer.request_key(
+                method=method,
+                url=url,
+                throttler_limit_id=throttler_limit_id,
+                params=params,
+                headers=headers,
+                return_err=return_err,
+                timeout=timeout,
+            )
+
+        if key is None:
+            response = await self._send_request(**request_args)
+        else:
+            response = await self._request_coalescer.execute(
+                key=key, request=lambda: self._send_request_and_read_body(**request_args))
+        return response
 
+    async def _send_request_and_read_body(self, **request_args) -> RESTResponse:
+        response = await self._send_request(**request_args)
+        # The body is read once, before the response is shared with the callers of coalesced requests
+        await response.read()
+        return response
+
+    async def _send_request(
+            self,
+            url: str,
+            throttler_limit_id: str,
+            params: Optional[Dict[str, Any]],
+            data: Optional[Dict[str, Any]],
+            method: RESTMethod,
+            is_auth_required: bool,
+            return_err: bool,
+            timeout: Optional[float],
+            headers: Optional[Dict[str, Any]],
+            priority: RequestPriority,
+    ) -> RESTResponse:
         headers = headers or {}
 
         local_headers = {
@@ -78,20 +171,21 @@ class RESTAssistant:
             # if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = self._json_codec.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=copy.copy(params),
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority) as request_context:
+            response = await self._call(request=request, timeout=timeout)
+            self._throttler.process_response_headers(response.headers, request_context)
 
             if 400 <= response.status:
                 if not return_err:
@@ -102,13 +196,28 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        request = self._copy_request(request)
+        resp = await self._call(request=request, timeout=timeout)
+        return resp
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        # The pre-processors and authenticators set the request fields or update the params, headers and data mappings
+        # in place, so a copy of the top level mappings is enough to leave the caller's request untouched
+        request = copy.copy(request)
+        request.params = copy.copy(request.params)
+        request.headers = copy.copy(request.headers)
+        if isinstance(request.data, dict):
+            request.data = copy.copy(request.data)
+        return request
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
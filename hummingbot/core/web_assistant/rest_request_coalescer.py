@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTResponse
+
+
+class _InFlightRequest:
+    __slots__ = ("task", "callers")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.callers = 0
+
+
+class RESTRequestCoalescer:
+    """Shares one network call between identical requests sent at the same time (single flight).
+
+    The first request for a key is sent, and the identical requests issued while it is in flight wait for its response
+    instead of being sent, so they also use the rate limits only once. Each caller decodes the shared response on its
+    own, so the callers never share the decoded objects. The request runs in its own task, so cancelling one of the
+    callers does not cancel the request for the others. The request is cancelled once all its callers are cancelled.
+
+    Only the requests whose response does not depend on the caller should be coalesced, which is why the REST
+    assistants use it only for public GET requests.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, _InFlightRequest] = {}
+        self._coalesced_requests = 0
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of requests that were served with the response of an identical request"""
+        return self._coalesced_requests
+
+    @staticmethod
+    def request_key(
+        method: RESTMethod,
+        url: str,
+        throttler_limit_id: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        return_err: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Optional[Hashable]:
+        """
+        Builds the key identifying identical requests.
+
+        :return: the key, or None if the request parameters are not hashable and the request can not be coalesced
+        """
+        try:
+            key = (
+                method,
+                url,
+                throttler_limit_id,
+                tuple(sorted((params or {}).items())),
+                tuple(sorted((headers or {}).items())),
+                return_err,
+                timeout,
+            )
+            hash(key)
+        except TypeError:
+            key = None
+        return key
+
+    async def execute(self, key: Hashable, request: Callable[[], Awaitable[RESTResponse]]) -> RESTResponse:
+        """
+        Returns the response of the in-flight request with the same key, or sends the request if there is none.
+
+        :param key: the request key, see `request_key`
+        :param request: creates the coroutine sending the request and reading the response body
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = _InFlightRequest(task=asyncio.ensure_future(request()))
+            self._in_flight[key] = in_flight
+            in_flight.task.add_done_callback(lambda _: self._forget(key, in_flight))
+        else:
+            self._coalesced_requests += 1
+
+        in_flight.callers += 1
+        try:
+            return await asyncio.shield(in_flight.task)
+        finally:
+            in_flight.callers -= 1
+            if in_flight.callers == 0 and not in_flight.task.done():
+                # All the callers were cancelled. New identical requests will not wait for the cancelled one
+                self._forget(key, in_flight)
+                in_flight.task.cancel()
+
+    def _forget(self, key: Hashable, in_flight: _InFlightRequest):
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+        if in_flight.task.done() and not in_flight.task.cancelled():
+            # Retrieve the exception, so it is not logged as never retrieved when all the callers were cancelled
+            in_flight.task.exception()
@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Set, Tuple
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
+from hummingbot.logger import HummingbotLogger
+
+
+class CachedResponse:
+    __slots__ = ("data", "stored_at")
+
+    def __init__(self, data: Any, stored_at: float):
+        self.data = data
+        self.stored_at = stored_at
+
+
+class _CacheEntry:
+    __slots__ = ("stored_at", "content")
+
+    def __init__(self, stored_at: float, content: str):
+        self.stored_at = stored_at
+        self.content = content
+
+
+class RESTResponseCache:
+    """Caches the responses of public REST requests in memory and on disk, with a time to live per endpoint.
+
+    Each response is stored in its own file in `cache_path`, so the cache survives restarts and a restarted connector
+    gets the responses at once. The responses are refreshed ahead of their expiration: a response younger than half its
+    time to live is returned as is, an older one is returned and refreshed in the background, and an expired one is
+    requested again before being returned.
+
+    The responses are kept encoded, and each caller gets its own decoded copy that it can modify.
+
+    It is meant for the exchange metadata (trading pairs, trading rules, fees), which rarely changes and is requested
+    again by every connector start.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(self, cache_path: str, ttls: Mapping[str, float], json_codec: JSONCodec = DEFAULT_JSON_CODEC):
+        """
+        :param cache_path: directory storing the cached responses
+        :param ttls: time to live of the responses, in seconds, per endpoint
+        :param json_codec: codec used to store the responses
+        """
+        self._cache_path = cache_path
+        self._ttls: Dict[str, float] = dict(ttls)
+        self._json_codec = json_codec
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._refreshing_keys: Set[str] = set()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """
+        :return: the time to live of the endpoint responses, or None if they are not cached
+        """
+        return self._ttls.get(endpoint)
+
+    def get(self, endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Optional[CachedResponse]:
+        """
+        :return: the cached response of the request, or None if there is none or it has expired
+        """
+        ttl = self.ttl(endpoint)
+        if ttl is None:
+            return None
+        key = self._key(url, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._entries[key] = entry
+        response = None
+        if entry is not None and self._time() - entry.stored_at <= ttl:
+            response = CachedResponse(data=self._json_codec.loads(entry.content)["data"], stored_at=entry.stored_at)
+        return response
+
+    def put(self, endpoint: str, url: str, data: Any, params: Optional[Mapping[str, Any]] = None):
+        """
+        Stores the response of a request, if the endpoint responses are cached
+        """
+        if self.ttl(endpoint) is None:
+            return
+        key = self._key(url, params)
+        stored_at = self._time()
+        try:
+            content = self._json_codec.dumps({
+                "url": url,
+                "params": {str(name): str(value) for name, value in (params or {}).items()},
+                "stored_at": stored_at,
+                "data": data,
+            })
+        except (TypeError, ValueError):
+            self.logger().warning(f"Could not cache the response of {url}.", exc_info=True)
+            return
+        entry = _CacheEntry(stored_at=stored_at, content=content)
+        self._entries[key] = entry
+        self._store(key, url, entry)
+
+    async def get_or_request(
+        self,
+        endpoint: str,
+        url: str,
+        request: Callable[[], Awaitable[Any]],
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        """
+        Returns the cached response of the request, refreshing it in the background if it is past half its time to
+        live. Sends the request, and caches its response, if there is no cached response or it has expired.
+
+        :param endpoint: the endpoint the time to live is defined for
+        :param url: the request URL
+        :param request: creates the coroutine sending the request and returning the decoded response
+        :param params: the request parameters
+        """
+        response = self.get(endpoint=endpoint, url=url, params=params)
+        if response is None:
+            data = await request()
+            self.put(endpoint=endpoint, url=url, data=data, params=params)
+            return data
+
+        key = self._key(url, params)
+        if (self._time() - response.stored_at > self.ttl(endpoint) / 2
+                and key not in self._refreshing_keys):
+            self._refreshing_keys.add(key)
+            safe_ensure_future(self._refresh(key=key, endpoint=endpoint, url=url, request=request, params=params))
+        return response.data
+
+    def clear(self):
+        """
+        Removes all the cached responses, from memory and from disk
+        """
+        self._entries.clear()
+        if os.path.isdir(self._cache_path):
+            for file_name in os.listdir(self._cache_path):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(self._cache_path, file_name))
+
+    async def _refresh(
+        self,
+        key: str,
+        endpoint: str,
+        url: str,
+        request: Callable[[], Awaitable[Any]],
+        params: Optional[Mapping[str, Any]],
+    ):
+        try:
+            data = await request()
+            self.put(endpoint=endpoint, url=url, data=data, params=params)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning(f"Could not refresh the cached response of {url}.", exc_info=True)
+        finally:
+            self._refreshing_keys.discard(key)
+
+    def _key(self, url: str, params: Optional[Mapping[str, Any]]) -> str:
+        params_items: Tuple = tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+        return hashlib.sha1(repr((url, params_items)).encode()).hexdigest()
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self._cache_path, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[_CacheEntry]:
+        file_path = self._file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as cache_file:
+                content = cache_file.read()
+            entry = _CacheEntry(stored_at=float(self._json_codec.loads(content)["stored_at"]), content=content)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.logger().warning(f"Ignoring the unreadable cached response {file_path}.")
+            entry = None
+        return entry
+
+    def _store(self, key: str, url: str, entry: _CacheEntry):
+        file_path = self._file_path(key)
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_path, exist_ok=True)
+            with open(temporary_path, "w") as cache_file:
+                cache_file.write(entry.content)
+            # Other bots might be reading the file
+            os.replace(temporary_path, file_path)
+        except OSError:
+            self.logger().warning(f"Could not store the response of {url} in the cache.", exc_info=True)
+
+    def _time(self) -> float:
+        return time.time()
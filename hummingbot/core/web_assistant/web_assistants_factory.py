@@ -3,9 +3,12 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
+from hummingbot.core.web_assistant.connections.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -17,7 +20,11 @@ class WebAssistantsFactory:
     The purpose of the `web_assistant` layer is to abstract away all WebSocket and REST operations from the exchange
     logic. The assistant objects are designed to be injectable with additional logic via the pre- and post-processor
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
-    additional information.
+    additional information. The `json_codec` is used by the REST assistants to encode the request bodies and to decode
+    the response bodies, and by the WebSocket assistants to decode the text messages. Unless `coalesce_requests` is
+    disabled, the REST assistants of the factory share one network call for identical public GET requests sent at the
+    same time, see `RESTRequestCoalescer`. All the assistants share one HTTP connection pool, configured with the
+    `connection_pool_config`.
 
     todo: integrate AsyncThrottler
     """
@@ -29,14 +36,19 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+        coalesce_requests: bool = True,
+        connection_pool_config: Optional[ConnectionPoolConfig] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(pool_config=connection_pool_config)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec
+        self._request_coalescer: Optional[RESTRequestCoalescer] = RESTRequestCoalescer() if coalesce_requests else None
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -46,19 +58,43 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_config(self) -> ConnectionPoolConfig:
+        return self._connections_factory.pool_config
+
+    def configure_connection_pool(self, connection_pool_config: ConnectionPoolConfig):
+        """
+        Changes the settings of the connection pool, before any assistant is created.
+        """
+        self._connections_factory.configure_pool(connection_pool_config)
+
+    async def prewarm_connections(self, urls: List[str], connections_per_host: int, throttler_limit_id: str) -> int:
+        """
+        Opens connections to the hosts of the URLs ahead of the requests. The requests opening them go through the
+        throttler like any other request, counted in the rate limit `throttler_limit_id`.
+
+        :return: the number of connections opened
+        """
+        return await self._connections_factory.prewarm(urls=urls,
+                                                       connections_per_host=connections_per_host,
+                                                       throttler=self._throttler,
+                                                       throttler_limit_id=throttler_limit_id)
+
     async def get_rest_assistant(self) -> RESTAssistant:
-        connection = await self._connections_factory.get_rest_connection()
+        connection = await self._connections_factory.get_rest_connection(json_codec=self._json_codec)
         assistant = RESTAssistant(
             connection=connection,
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self._json_codec,
+            request_coalescer=self._request_coalescer,
         )
         return assistant
 
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_codec=self._json_codec)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
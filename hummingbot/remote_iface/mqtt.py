@@ -26,7 +26,7 @@ from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParame
 
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.event_forwarder import BufferedEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
 from hummingbot.notifier.notifier_base import NotifierBase
@@ -384,8 +384,9 @@ class MQTTMarketEventForwarder:
         )
         self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
 
-        self._mqtt_fowarder: SourceInfoEventForwarder = \
-            SourceInfoEventForwarder(self._send_mqtt_event)
+        # Publishing is buffered to keep it off the connector code paths triggering the events
+        self._mqtt_fowarder: BufferedEventForwarder = \
+            BufferedEventForwarder(self._send_mqtt_event, self._ev_loop)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
             (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
             (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
@@ -498,6 +499,7 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self._mqtt_fowarder.flush()
 
 
 class MQTTNotifier(NotifierBase):
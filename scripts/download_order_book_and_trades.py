@@ -3,6 +3,8 @@ import os
 from datetime import datetime
 from typing import Dict
 
+import numpy as np
+
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -21,6 +23,7 @@ class DownloadTradesAndOrderBookSnapshots(ScriptStrategyBase):
     ob_temp_storage = {trading_pair: [] for trading_pair in trading_pairs}
     trades_temp_storage = {trading_pair: [] for trading_pair in trading_pairs}
     current_date = None
+    ob_snapshot_buffers = {}
     ob_file_paths = {}
     trades_file_paths = {}
     markets = {exchange: set(trading_pairs)}
@@ -43,11 +46,15 @@ class DownloadTradesAndOrderBookSnapshots(ScriptStrategyBase):
 
     def get_order_book_dict(self, exchange: str, trading_pair: str, depth: int = 50):
         order_book = self.connectors[exchange].get_order_book(trading_pair)
-        snapshot = order_book.snapshot
+        # The snapshot buffers are reused on every tick
+        buffers_key = (exchange, trading_pair, depth)
+        if buffers_key not in self.ob_snapshot_buffers:
+            self.ob_snapshot_buffers[buffers_key] = (np.empty((depth, 3)), np.empty((depth, 3)))
+        bids, asks = order_book.snapshot_arrays(depth, *self.ob_snapshot_buffers[buffers_key])
         return {
             "ts": self.current_timestamp,
-            "bids": snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+            "bids": bids[:, :2].tolist(),
+            "asks": asks[:, :2].tolist(),
         }
 
     def dump_and_clean_temp_storage(self):
@@ -86,6 +86,7 @@ def main():
         "nose",
         "nose-exclude",
         "numpy",
+        "orjson",
         "pandas",
         "pip",
         "pre-commit",
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""
+Measures the AsyncThrottler cost per request at 1k, 10k and 100k requests per minute, with a request limit linked to a
+pool limit as connectors usually define them.
+
+The clock is simulated: two minutes of requests are sent at the given rate, below the limits so that no request waits,
+and the second minute is measured, when the rate limit windows hold a full minute of requests.
+
+Usage: python test/debug/benchmark_async_throttler.py
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+REQUESTS_PER_MINUTE = (1_000, 10_000, 100_000)
+REQUEST_LIMIT_ID = "/order"
+POOL_LIMIT_ID = "REQUEST_WEIGHT"
+
+
+async def send_requests(throttler: AsyncThrottler, clock: list, count: int, interval: float):
+    for _ in range(count):
+        clock[0] += interval
+        async with throttler.execute_task(limit_id=REQUEST_LIMIT_ID):
+            pass
+
+
+def measure(requests_per_minute: int) -> float:
+    throttler = AsyncThrottler(rate_limits=[
+        RateLimit(limit_id=POOL_LIMIT_ID, limit=2 * requests_per_minute, time_interval=60),
+        RateLimit(limit_id=REQUEST_LIMIT_ID, limit=2 * requests_per_minute, time_interval=60,
+                  linked_limits=[LinkedLimitWeightPair(POOL_LIMIT_ID, 1)]),
+    ])
+    clock = [1_700_000_000.0]
+    interval = 60 / requests_per_minute
+    ev_loop = asyncio.get_event_loop()
+    with patch("time.time", lambda: clock[0]):
+        ev_loop.run_until_complete(send_requests(throttler, clock, requests_per_minute, interval))
+        start = time.perf_counter()
+        ev_loop.run_until_complete(send_requests(throttler, clock, requests_per_minute, interval))
+        elapsed = time.perf_counter() - start
+    return elapsed / requests_per_minute
+
+
+def main():
+    print(f"{'requests/min':>14}{'us/request':>14}")
+    for requests_per_minute in REQUESTS_PER_MINUTE:
+        print(f"{requests_per_minute:>14}{measure(requests_per_minute) * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
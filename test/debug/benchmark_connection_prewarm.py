@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""
+Measures the latency of the first order placed by a new connection pool against the MockWebServer, with a cold pool
+(the order opens the connection) and with a pool prewarmed by the ConnectionsFactory (the order reuses a connection
+opened ahead of it).
+
+The MockWebServer is served over plain HTTP on the local host, so the difference only includes the TCP handshake and
+the server side connection setup. Against an exchange the cold order also pays the network round trips of the TCP and
+TLS handshakes, and the DNS resolution.
+
+Usage: python test/debug/benchmark_connection_prewarm.py
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+ROUNDS = 300
+HOST = "api.binance.com"
+PATH = "/api/v3/order"
+ORDER = {
+    "symbol": "COINALPHAHBOT",
+    "side": "BUY",
+    "type": "LIMIT_MAKER",
+    "quantity": "1.00000000",
+    "price": "10000.00000000",
+    "newClientOrderId": "x-XEKWYICX-BCOHBOT1700000000000000",
+}
+ORDER_RESPONSE = {
+    "symbol": "COINALPHAHBOT",
+    "orderId": 28,
+    "orderListId": -1,
+    "clientOrderId": "x-XEKWYICX-BCOHBOT1700000000000000",
+    "transactTime": 1507725176595,
+    "price": "10000.00000000",
+    "origQty": "1.00000000",
+    "executedQty": "0.00000000",
+    "cummulativeQuoteQty": "0.00000000",
+    "status": "NEW",
+    "timeInForce": "GTC",
+    "type": "LIMIT_MAKER",
+    "side": "BUY",
+    "workingTime": 1507725176595,
+    "fills": [],
+}
+
+
+async def first_order_latency(url: str, prewarm: bool) -> float:
+    connections_factory = ConnectionsFactory()
+    assistant = RESTAssistant(
+        connection=await connections_factory.get_rest_connection(),
+        throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id=PATH, limit=10 * ROUNDS, time_interval=60)]),
+        auth=BinanceAuth(api_key="someKey", secret_key="someSecret", time_provider=TimeSynchronizer()),
+    )
+    try:
+        if prewarm:
+            await connections_factory.prewarm(urls=[url], connections_per_host=1)
+        start = time.perf_counter()
+        await assistant.execute_request(
+            url=url,
+            throttler_limit_id=PATH,
+            data=ORDER,
+            method=RESTMethod.POST,
+            is_auth_required=True,
+        )
+        return time.perf_counter() - start
+    finally:
+        await connections_factory._shared_client.close()
+
+
+async def run(url: str):
+    latencies = {"cold": [], "prewarmed": []}
+    # Alternate the variants, so that both see the same server and machine conditions
+    for _ in range(ROUNDS):
+        latencies["cold"].append(await first_order_latency(url, prewarm=False))
+        latencies["prewarmed"].append(await first_order_latency(url, prewarm=True))
+    print(f"{'pool':>10}{'median us':>12}{'p90 us':>12}")
+    for name, values in latencies.items():
+        print(f"{name:>10}{statistics.median(values) * 1e6:>12.1f}{percentile(values, 0.9) * 1e6:>12.1f}")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def main():
+    web_server = MockWebServer.get_instance()
+    web_server.start()
+    while not web_server.started:
+        time.sleep(0.1)
+    web_server.update_response("POST", HOST, PATH, ORDER_RESPONSE)
+    web_server.add_host_to_mock(HOST)
+    url = str(MockWebServer.reroute_local(f"https://{HOST}{PATH}"))
+    try:
+        asyncio.get_event_loop().run_until_complete(run(url))
+    finally:
+        web_server.stop()
+
+
+if __name__ == "__main__":
+    main()
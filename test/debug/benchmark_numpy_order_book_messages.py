@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+"""
+Compares the parse and apply throughput of the order book diff messages with string rows (OrderBookMessage) and with
+rows parsed once into arrays (NumpyOrderBookMessage), on feeds shaped like the Binance (depthUpdate b/a with
+[price, qty] rows) and OKX (books with [price, size, 0, orders] rows) order book streams.
+
+The parse step builds the message from the raw exchange payload, the apply step is what the order book tracker does
+with each diff: applying it to the order book and reading the top of the book.
+
+Usage: python test/debug/benchmark_numpy_order_book_messages.py
+"""
+
+import time
+from typing import Callable, Dict, List, Tuple, Type
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+TRADING_PAIR = "BTC-USDT"
+MID_PRICE = 30000.0
+TICK_SIZE = 0.01
+SNAPSHOT_DEPTH = 5_000
+DIFF_COUNT = 20_000
+# (feed, price levels changed per message side, extra columns per row)
+FEEDS = (("binance", 20, []), ("okx", 4, ["0", "3"]))
+
+
+def _random_rows(random: np.random.RandomState, levels: int, is_bid: bool, extra_columns: List[str]) -> List[List[str]]:
+    offsets = np.minimum(random.geometric(0.02, levels), SNAPSHOT_DEPTH)
+    prices = MID_PRICE - offsets * TICK_SIZE if is_bid else MID_PRICE + offsets * TICK_SIZE
+    amounts = np.where(random.uniform(size=levels) < 0.33, 0, random.uniform(0.01, 2, levels))
+    return [[f"{price:.2f}", f"{amount:.8f}"] + extra_columns for price, amount in zip(prices, amounts)]
+
+
+def raw_diffs(random: np.random.RandomState, levels: int, extra_columns: List[str]) -> List[Dict[str, any]]:
+    return [{
+        "update_id": update_id,
+        "bids": _random_rows(random, levels, True, extra_columns),
+        "asks": _random_rows(random, levels, False, extra_columns),
+    } for update_id in range(1, DIFF_COUNT + 1)]
+
+
+def snapshot_rows() -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+    offsets = np.arange(1, SNAPSHOT_DEPTH + 1)
+    bids = [OrderBookRow(round(MID_PRICE - offset * TICK_SIZE, 2), 1, 0) for offset in offsets]
+    asks = [OrderBookRow(round(MID_PRICE + offset * TICK_SIZE, 2), 1, 0) for offset in offsets]
+    return bids, asks
+
+
+def time_feed(message_class: Type[OrderBookMessage],
+              apply_message: Callable[[OrderBook, OrderBookMessage], None],
+              diffs: List[Dict[str, any]]) -> Tuple[float, float, OrderBook]:
+    order_book = OrderBook()
+    bids, asks = snapshot_rows()
+    order_book.apply_snapshot(bids, asks, 0)
+
+    start = time.perf_counter()
+    messages = [message_class(OrderBookMessageType.DIFF, {
+        "trading_pair": TRADING_PAIR,
+        "update_id": diff["update_id"],
+        "bids": diff["bids"],
+        "asks": diff["asks"],
+    }, timestamp=diff["update_id"]) for diff in diffs]
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for message in messages:
+        apply_message(order_book, message)
+        order_book.get_price(True)
+        order_book.get_price(False)
+    apply_time = time.perf_counter() - start
+    return parse_time, apply_time, order_book
+
+
+def apply_rows(order_book: OrderBook, message: OrderBookMessage):
+    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+
+def main():
+    random = np.random.RandomState(42)
+    print(f"{'feed':<10}{'levels/msg':>12}{'message':>24}{'parse (us/msg)':>16}{'apply (us/msg)':>16}"
+          f"{'msgs/s':>12}")
+    for feed, levels, extra_columns in FEEDS:
+        diffs = raw_diffs(random, levels, extra_columns)
+        results = []
+        for message_class, apply_message in ((OrderBookMessage, apply_rows),
+                                             (NumpyOrderBookMessage, OrderBook.apply_diff_message)):
+            parse_time, apply_time, order_book = time_feed(message_class, apply_message, diffs)
+            results.append(order_book)
+            print(f"{feed:<10}{2 * levels:>12}{message_class.__name__:>24}{parse_time / DIFF_COUNT * 1e6:>16.2f}"
+                  f"{apply_time / DIFF_COUNT * 1e6:>16.2f}{DIFF_COUNT / (parse_time + apply_time):>12.0f}")
+        assert list(results[0].bid_entries()) == list(results[1].bid_entries()), f"{feed} bid book mismatch"
+        assert list(results[0].ask_entries()) == list(results[1].ask_entries()), f"{feed} ask book mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+"""
+Compares the generator based order book depth walks (one OrderBookRow per level) with the native C++ depth walks
+used by OrderBook.c_get_price_for_volume and friends, and with the same queries answered by the cumulative depth index
+(OrderBook(depth_index=True)).
+
+Usage: python test/debug/benchmark_order_book_queries.py
+"""
+
+import math
+import time
+from typing import Callable, Iterator, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+DEPTHS = (10, 1_000, 50_000)
+MID_PRICE = 100.0
+
+
+def build_order_books(depth: int) -> Tuple[OrderBook, OrderBook]:
+    tick = MID_PRICE / (depth * 4)
+    levels = np.arange(1, depth + 1, dtype=np.float64)
+    amounts = np.random.uniform(0.5, 1.5, depth)
+    update_ids = np.ones(depth)
+    bids = np.column_stack((MID_PRICE - levels * tick, amounts, update_ids))
+    asks = np.column_stack((MID_PRICE + levels * tick, amounts, update_ids))
+    order_book = OrderBook()
+    indexed_order_book = OrderBook(depth_index=True)
+    order_book.apply_numpy_snapshot(bids, asks)
+    indexed_order_book.apply_numpy_snapshot(bids, asks)
+    return order_book, indexed_order_book
+
+
+def _entries(order_book: OrderBook, is_buy: bool) -> Iterator[OrderBookRow]:
+    return order_book.ask_entries() if is_buy else order_book.bid_entries()
+
+
+def legacy_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    cumulative_volume = 0
+    for row in _entries(order_book, is_buy):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return math.nan
+
+
+def legacy_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in _entries(order_book, is_buy):
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * row.price
+            total_volume += incremental_amount
+            return total_cost / total_volume
+    return math.nan
+
+
+def legacy_price_for_quote_volume(order_book: OrderBook, is_buy: bool, quote_volume: float) -> float:
+    cumulative_volume = 0
+    for row in _entries(order_book, is_buy):
+        cumulative_volume += row.amount * row.price
+        if cumulative_volume >= quote_volume:
+            return row.price
+    return math.nan
+
+
+def legacy_quote_volume_for_base_amount(order_book: OrderBook, is_buy: bool, base_amount: float) -> float:
+    cumulative_volume = 0
+    cumulative_base_amount = 0
+    for row in _entries(order_book, is_buy):
+        row_amount = row.amount
+        if row_amount + cumulative_base_amount >= base_amount:
+            row_amount = base_amount - cumulative_base_amount
+        cumulative_base_amount += row_amount
+        cumulative_volume += row_amount * row.price
+        if cumulative_base_amount >= base_amount:
+            break
+    return cumulative_volume
+
+
+def time_call(function: Callable, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    print(f"{'query':<32}{'depth':>8}{'legacy (us)':>14}{'native (us)':>14}{'indexed (us)':>14}{'speedup':>10}")
+    for depth in DEPTHS:
+        order_book, indexed_order_book = build_order_books(depth)
+        # Walk roughly 90% of the book, the worst realistic case for a deep sweep.
+        volume = depth * 0.9
+        quote_volume = volume * MID_PRICE
+        iterations = max(5, 200_000 // depth)
+        cases = [
+            ("price_for_volume",
+             lambda: legacy_price_for_volume(order_book, True, volume),
+             lambda: order_book.get_price_for_volume(True, volume).result_price,
+             lambda: indexed_order_book.get_price_for_volume(True, volume).result_price),
+            ("vwap_for_volume",
+             lambda: legacy_vwap_for_volume(order_book, False, volume),
+             lambda: order_book.get_vwap_for_volume(False, volume).result_price,
+             lambda: indexed_order_book.get_vwap_for_volume(False, volume).result_price),
+            ("price_for_quote_volume",
+             lambda: legacy_price_for_quote_volume(order_book, True, quote_volume),
+             lambda: order_book.get_price_for_quote_volume(True, quote_volume).result_price,
+             lambda: indexed_order_book.get_price_for_quote_volume(True, quote_volume).result_price),
+            ("quote_volume_for_base_amount",
+             lambda: legacy_quote_volume_for_base_amount(order_book, False, volume),
+             lambda: order_book.get_quote_volume_for_base_amount(False, volume).result_volume,
+             lambda: indexed_order_book.get_quote_volume_for_base_amount(False, volume).result_volume),
+        ]
+        for name, legacy, native, indexed in cases:
+            legacy_result, native_result = legacy(), native()
+            assert legacy_result == native_result or (math.isnan(legacy_result) and math.isnan(native_result)), \
+                f"{name} mismatch at depth {depth}: {legacy_result} != {native_result}"
+            # The index sums the levels in a different order, so allow for rounding differences.
+            assert math.isclose(native_result, indexed(), rel_tol=1e-9), f"{name} index mismatch at depth {depth}"
+            legacy_time = time_call(legacy, iterations)
+            native_time = time_call(native, iterations)
+            indexed_time = time_call(indexed, iterations)
+            print(f"{name:<32}{depth:>8}{legacy_time * 1e6:>14.2f}{native_time * 1e6:>14.2f}"
+                  f"{indexed_time * 1e6:>14.2f}{legacy_time / min(native_time, indexed_time):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""
+Measures the PubSub trigger_event() throughput with 1, 10 and 100 listeners on the same event, which is the path taken
+by every order book trade and order fill event.
+
+The listeners do nothing, so the numbers are the dispatch overhead alone.
+
+Usage: python test/debug/benchmark_pubsub_trigger.py
+"""
+
+import time
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.pubsub import PubSub
+
+LISTENER_COUNTS = (1, 10, 100)
+TRIGGER_DURATION = 1.0
+
+
+def trigger_rate(listener_count: int) -> float:
+    pubsub = PubSub()
+    # PubSub only keeps weak references to the listeners
+    listeners = [EventForwarder(lambda _: None) for _ in range(listener_count)]
+    for listener in listeners:
+        pubsub.add_listener(MarketEvent.OrderFilled, listener)
+
+    triggers = 0
+    start = time.perf_counter()
+    end = start + TRIGGER_DURATION
+    while time.perf_counter() < end:
+        for _ in range(1000):
+            pubsub.trigger_event(MarketEvent.OrderFilled, None)
+        triggers += 1000
+    return triggers / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'listeners':>10}{'triggers/s':>14}{'us/trigger':>14}{'ns/listener call':>18}")
+    for listener_count in LISTENER_COUNTS:
+        rate = trigger_rate(listener_count)
+        print(f"{listener_count:>10}{rate:>14.0f}{1e6 / rate:>14.2f}{1e9 / rate / listener_count:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
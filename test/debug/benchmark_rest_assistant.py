@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+"""
+Measures a signed order placement round trip through the RESTAssistant against the MockWebServer, for each JSON codec
+and for the previous request handling (deep copy of the request and standard library JSON encoding and decoding).
+
+The requests are signed with the Binance authenticator and the server answers with a Binance order response, so the
+request body encoding, the signature, the request copy and the response decoding are all part of the measurement.
+Since the local round trip is much slower than the client side of the request and varies from run to run, the client
+cost is also measured on its own, with a connection that replays a response received from the server.
+
+Usage: python test/debug/benchmark_rest_assistant.py
+"""
+
+import asyncio
+import time
+from copy import deepcopy
+from typing import Optional
+
+import aiohttp
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import (
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    UJSONCodec,
+    orjson,
+)
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+REQUESTS = 2_000
+HOST = "api.binance.com"
+PATH = "/api/v3/order"
+ORDER = {
+    "symbol": "COINALPHAHBOT",
+    "side": "BUY",
+    "type": "LIMIT_MAKER",
+    "quantity": "1.00000000",
+    "price": "10000.00000000",
+    "newClientOrderId": "x-XEKWYICX-BCOHBOT1700000000000000",
+}
+ORDER_RESPONSE = {
+    "symbol": "COINALPHAHBOT",
+    "orderId": 28,
+    "orderListId": -1,
+    "clientOrderId": "x-XEKWYICX-BCOHBOT1700000000000000",
+    "transactTime": 1507725176595,
+    "price": "10000.00000000",
+    "origQty": "1.00000000",
+    "executedQty": "0.00000000",
+    "cummulativeQuoteQty": "0.00000000",
+    "status": "NEW",
+    "timeInForce": "GTC",
+    "type": "LIMIT_MAKER",
+    "side": "BUY",
+    "workingTime": 1507725176595,
+    "fills": [],
+}
+
+
+class DeepCopyRESTAssistant(RESTAssistant):
+    """The previous request handling: every request is deep copied before it is processed"""
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        return await super()._call(request=deepcopy(request), timeout=timeout)
+
+
+class ReplayRESTConnection(RESTConnection):
+    """Answers every request with a response received from the server, without sending the request"""
+
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: JSONCodec):
+        super().__init__(aiohttp_client_session=None, json_codec=json_codec)
+        self._aiohttp_response = aiohttp_response
+
+    async def call(self, request: RESTRequest) -> RESTResponse:
+        return await self._build_resp(self._aiohttp_response)
+
+
+async def place_orders(assistant: RESTAssistant, url: str, count: int):
+    for _ in range(count):
+        await assistant.execute_request(
+            url=url,
+            throttler_limit_id=PATH,
+            data=ORDER,
+            method=RESTMethod.POST,
+            is_auth_required=True,
+        )
+
+
+async def measure(connection: RESTConnection, url: str, json_codec: JSONCodec, deep_copy: bool) -> float:
+    assistant_class = DeepCopyRESTAssistant if deep_copy else RESTAssistant
+    assistant = assistant_class(
+        connection=connection,
+        throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id=PATH, limit=10 * REQUESTS, time_interval=60)]),
+        auth=BinanceAuth(api_key="someKey", secret_key="someSecret", time_provider=TimeSynchronizer()),
+        json_codec=json_codec,
+    )
+    await place_orders(assistant, url, count=100)
+    start = time.perf_counter()
+    await place_orders(assistant, url, count=REQUESTS)
+    return (time.perf_counter() - start) / REQUESTS
+
+
+async def run(url: str):
+    variants = [("deepcopy + json", StdlibJSONCodec(), True),
+                ("json", StdlibJSONCodec(), False),
+                ("ujson", UJSONCodec(), False)]
+    if orjson is not None:
+        variants.append(("orjson", OrjsonCodec(), False))
+    async with aiohttp.ClientSession() as session:
+        response = await session.post(url)
+        await response.read()
+        print(f"{'variant':>18}{'round trip us/order':>22}{'client us/order':>18}")
+        for name, codec, deep_copy in variants:
+            round_trip = await measure(RESTConnection(session, json_codec=codec), url, codec, deep_copy)
+            client = await measure(ReplayRESTConnection(response, json_codec=codec), url, codec, deep_copy)
+            print(f"{name:>18}{round_trip * 1e6:>22.1f}{client * 1e6:>18.1f}")
+
+
+def main():
+    web_server = MockWebServer.get_instance()
+    web_server.start()
+    while not web_server.started:
+        time.sleep(0.1)
+    web_server.update_response("POST", HOST, PATH, ORDER_RESPONSE)
+    web_server.add_host_to_mock(HOST)
+    url = str(MockWebServer.reroute_local(f"https://{HOST}{PATH}"))
+    try:
+        asyncio.get_event_loop().run_until_complete(run(url))
+    finally:
+        web_server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+"""
+Compares the std::set backed OrderBook with the tick indexed TickOrderBook on diff heavy feeds shaped like the
+Binance (depthUpdate U/u/b/a) and Kucoin (level2 sequenceStart/sequenceEnd/changes) order book streams.
+
+The diff messages are built through the connectors' own parsing code, and their rows are extracted before timing, so
+that the numbers only cover OrderBook.apply_diffs() plus a top of book read, which is what the tracker does for every
+diff it receives.
+
+Usage: python test/debug/benchmark_tick_order_book.py
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
+
+TRADING_PAIR = "BTC-USDT"
+MID_PRICE = 30000.0
+TICK_SIZE = 0.01
+SNAPSHOT_DEPTH = 5_000
+DIFF_COUNT = 20_000
+# (feed, price levels changed per message)
+FEEDS = (("binance", 20), ("kucoin", 4))
+
+
+def _random_changes(random: np.random.RandomState, levels: int, is_bid: bool) -> List[List[str]]:
+    # Most of the activity happens close to the top of the book, a third of the changes are deletions.
+    offsets = np.minimum(random.geometric(0.02, levels), SNAPSHOT_DEPTH)
+    prices = MID_PRICE - offsets * TICK_SIZE if is_bid else MID_PRICE + offsets * TICK_SIZE
+    amounts = np.where(random.uniform(size=levels) < 0.33, 0, random.uniform(0.01, 2, levels))
+    return [[f"{price:.2f}", f"{amount:.8f}"] for price, amount in zip(prices, amounts)]
+
+
+def binance_diff_messages(random: np.random.RandomState, levels: int) -> List[OrderBookMessage]:
+    messages = []
+    update_id = 1
+    for _ in range(DIFF_COUNT):
+        msg = {
+            "e": "depthUpdate",
+            "E": 1_700_000_000_000 + update_id,
+            "s": "BTCUSDT",
+            "U": update_id,
+            "u": update_id + 2 * levels - 1,
+            "b": _random_changes(random, levels, True),
+            "a": _random_changes(random, levels, False),
+        }
+        update_id += 2 * levels
+        messages.append(BinanceOrderBook.diff_message_from_exchange(
+            msg, time.time(), {"trading_pair": TRADING_PAIR}))
+    return messages
+
+
+def kucoin_diff_messages(random: np.random.RandomState, levels: int) -> List[OrderBookMessage]:
+    messages = []
+    sequence = 1
+    for _ in range(DIFF_COUNT):
+        # Kucoin appends the sequence of each change to the price and size
+        bids = [change + [str(sequence + i)] for i, change in enumerate(_random_changes(random, levels, True))]
+        asks = [change + [str(sequence + levels + i)] for i, change in enumerate(_random_changes(random, levels, False))]
+        diff_data = {
+            "sequenceStart": sequence,
+            "sequenceEnd": sequence + 2 * levels - 1,
+            "symbol": "BTC-USDT",
+            "changes": {"bids": bids, "asks": asks},
+        }
+        sequence += 2 * levels
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR,
+            "update_id": diff_data["sequenceEnd"],
+            "first_update_id": diff_data["sequenceStart"],
+            "bids": diff_data["changes"]["bids"],
+            "asks": diff_data["changes"]["asks"],
+        }, time.time()))
+    return messages
+
+
+def snapshot_rows() -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+    offsets = np.arange(1, SNAPSHOT_DEPTH + 1)
+    bids = [OrderBookRow(round(MID_PRICE - offset * TICK_SIZE, 2), 1, 0) for offset in offsets]
+    asks = [OrderBookRow(round(MID_PRICE + offset * TICK_SIZE, 2), 1, 0) for offset in offsets]
+    return bids, asks
+
+
+def time_feed(order_book_factory: Callable[[], OrderBook],
+              diffs: List[Tuple[List[OrderBookRow], List[OrderBookRow], int]]) -> Tuple[float, OrderBook]:
+    order_book = order_book_factory()
+    bids, asks = snapshot_rows()
+    order_book.apply_snapshot(bids, asks, 0)
+    start = time.perf_counter()
+    for bid_rows, ask_rows, update_id in diffs:
+        order_book.apply_diffs(bid_rows, ask_rows, update_id)
+        order_book.get_price(True)
+        order_book.get_price(False)
+    return time.perf_counter() - start, order_book
+
+
+def main():
+    random = np.random.RandomState(42)
+    print(f"{'feed':<10}{'levels/msg':>12}{'OrderBook (us/msg)':>22}{'TickOrderBook (us/msg)':>26}{'speedup':>10}")
+    for feed, levels in FEEDS:
+        messages = (binance_diff_messages if feed == "binance" else kucoin_diff_messages)(random, levels)
+        diffs = [(message.bids, message.asks, message.update_id) for message in messages]
+        set_time, set_book = time_feed(OrderBook, diffs)
+        tick_time, tick_book = time_feed(lambda: TickOrderBook(tick_size=TICK_SIZE, window_ticks=2 * SNAPSHOT_DEPTH), diffs)
+        assert list(set_book.bid_entries()) == list(tick_book.bid_entries()), f"{feed} bid book mismatch"
+        assert list(set_book.ask_entries()) == list(tick_book.ask_entries()), f"{feed} ask book mismatch"
+        print(f"{feed:<10}{levels:>12}{set_time / DIFF_COUNT * 1e6:>22.2f}{tick_time / DIFF_COUNT * 1e6:>26.2f}"
+              f"{set_time / tick_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -91,11 +91,23 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ global_token_name               | USDT                 |\n"
                            "    | ∟ global_token_symbol             | $                    |\n"
                            "    | rate_limits_share_pct             | 100                  |\n"
+                           "    | rate_limits_share_group           |                      |\n"
+                           "    | exchange_metadata_cache           | False                |\n"
+                           "    | prewarm_connections               | 0                    |\n"
+                           "    | websocket_hot_standby             | False                |\n"
+                           "    | order_book_connections            | 1                    |\n"
+                           "    | order_book_diff_coalescing        | False                |\n"
+                           "    | order_book_dispatcher_shards      | 0                    |\n"
+                           "    | message_queue_max_size            | 0                    |\n"
+                           "    | order_book_queue_overflow_policy  | block                |\n"
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
+                           "    | event_driven_clock                | False                |\n"
+                           "    | min_tick_interval                 | 0.1                  |\n"
+                           "    | tick_profiling                    | False                |\n"
                            "    | market_data_collection            |                      |\n"
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
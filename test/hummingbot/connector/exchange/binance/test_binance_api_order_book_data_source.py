@@ -14,6 +14,7 @@ from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.data_type.bounded_message_queue import QueueOverflowPolicy
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 
@@ -215,6 +216,63 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_routes_events_from_the_raw_message(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        diff_event = {"e": "depthUpdate", "E": 123456789, "s": self.ex_trading_pair, "U": 1, "u": 2,
+                      "b": [["0.0024", "10"]], "a": [["0.0026", "100"]]}
+        trade_event = {"e": "trade", "E": 123456789, "s": self.ex_trading_pair, "t": 12345, "p": "0.001",
+                       "q": "100", "T": 123456785, "m": True}
+        for message in ({"result": None, "id": 1}, diff_event, trade_event):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps(message))
+
+        with patch.object(self.data_source, "_channel_originating_message",
+                          wraps=self.data_source._channel_originating_message) as channel_mock:
+            self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+            self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        # Only the subscription result had to be decoded to find its channel
+        channel_mock.assert_called_once_with(event_message={"result": None, "id": 1})
+        diff_queue = self.data_source._message_queue[self.data_source._diff_messages_queue_key]
+        trade_queue = self.data_source._message_queue[self.data_source._trade_messages_queue_key]
+        self.assertEqual(diff_event, diff_queue.get_nowait())
+        self.assertEqual(trade_event, trade_queue.get_nowait())
+        self.assertTrue(diff_queue.empty())
+        self.assertTrue(trade_queue.empty())
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_with_hot_standby_queues_each_message_once(self, ws_connect_mock):
+        primary_ws = self.mocking_assistant.create_websocket_mock()
+        standby_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [primary_ws, standby_ws]
+
+        def diff_event(update_id: int):
+            return {"e": "depthUpdate", "E": 123456789, "s": self.ex_trading_pair, "U": update_id, "u": update_id,
+                    "b": [["0.0024", "10"]], "a": [["0.0026", "100"]]}
+
+        trade_event = {"e": "trade", "E": 123456789, "s": self.ex_trading_pair, "t": 12345, "p": "0.001",
+                       "q": "100", "T": 123456785, "m": True}
+        # The primary connection drops before the last diff, which is received through the standby connection only
+        for message in (diff_event(2), diff_event(3), trade_event):
+            self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=primary_ws, message=json.dumps(message))
+        for message in (diff_event(2), trade_event, diff_event(3), diff_event(4)):
+            self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=standby_ws, message=json.dumps(message))
+
+        self.data_source.enable_hot_standby()
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(primary_ws)
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(standby_ws)
+
+        # Both connections are subscribed to the channels
+        self.assertEqual(2, len(self.mocking_assistant.json_messages_sent_through_websocket(primary_ws)))
+        self.assertEqual(2, len(self.mocking_assistant.json_messages_sent_through_websocket(standby_ws)))
+        diff_queue = self.data_source._message_queue[self.data_source._diff_messages_queue_key]
+        trade_queue = self.data_source._message_queue[self.data_source._trade_messages_queue_key]
+        self.assertEqual([2, 3, 4], [diff_queue.get_nowait()["u"] for _ in range(diff_queue.qsize())])
+        self.assertEqual([trade_event], [trade_queue.get_nowait() for _ in range(trade_queue.qsize())])
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -409,3 +467,18 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
 
         self.assertEqual(1027024, msg.update_id)
+
+    def test_full_bounded_queue_blocks_the_websocket_reader(self):
+        self.data_source.configure_message_queues(max_size=1, overflow_policy=QueueOverflowPolicy.BLOCK)
+        channel = self.data_source._diff_messages_queue_key
+        queue = self.data_source.message_queues[channel]
+
+        self.async_run_with_timeout(self.data_source._queue_message(channel=channel, event_message={"u": 1}))
+        queue_task = self.ev_loop.create_task(self.data_source._queue_message(channel=channel, event_message={"u": 2}))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertFalse(queue_task.done())
+
+        self.assertEqual({"u": 1}, self.async_run_with_timeout(queue.get()))
+        self.async_run_with_timeout(queue_task)
+        self.assertEqual({"u": 2}, queue.get_nowait())
+        self.assertEqual(0, queue.overflowed_messages)
@@ -1,9 +1,10 @@
 import asyncio
 import json
 import re
+import tempfile
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -15,6 +16,9 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.api_throttler.shared_throttler import SharedAsyncThrottler
+from hummingbot.core.data_type.bounded_message_queue import QueueOverflowPolicy
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
@@ -1099,6 +1103,181 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                             "Error: {'code':-1021,'msg':'Other error.'}")
         self.assertFalse(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
 
+    @aioresponses()
+    def test_api_requests_are_throttled_with_the_priority_of_the_operation(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        priorities: List[Tuple[str, RequestPriority]] = []
+        execute_task = self.exchange._throttler.execute_task
+
+        def record_priority(limit_id: str, priority: RequestPriority):
+            priorities.append((limit_id, priority))
+            return execute_task(limit_id=limit_id, priority=priority)
+
+        request_sent_event = asyncio.Event()
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+        mock_api.get(self.network_status_url,
+                     body=json.dumps(self.network_status_request_successful_mock_response),
+                     repeat=True)
+
+        with patch.object(self.exchange._throttler, "execute_task", side_effect=record_priority):
+            order_id = self.place_buy_order()
+            self.async_run_with_timeout(request_sent_event.wait())
+            order: InFlightOrder = self.exchange.in_flight_orders[order_id]
+
+            request_sent_event.clear()
+            self.configure_successful_cancelation_response(
+                order=order,
+                mock_api=mock_api,
+                callback=lambda *args, **kwargs: request_sent_event.set())
+            self.exchange.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
+            self.async_run_with_timeout(request_sent_event.wait())
+
+            self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.PING_PATH_URL))
+            self.async_run_with_timeout(self.exchange._api_get(path_url=CONSTANTS.PING_PATH_URL,
+                                                               priority=RequestPriority.CANCEL))
+
+        self.assertEqual(
+            [(CONSTANTS.ORDER_PATH_URL, RequestPriority.CREATE),
+             (CONSTANTS.ORDER_PATH_URL, RequestPriority.CANCEL),
+             (CONSTANTS.PING_PATH_URL, RequestPriority.PUBLIC_DATA),
+             (CONSTANTS.PING_PATH_URL, RequestPriority.CANCEL)],
+            priorities)
+
+    @aioresponses()
+    def test_restarted_exchange_gets_the_trading_rules_from_the_metadata_cache(self, mock_api):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.exchange_metadata_cache = True
+
+        def create_exchange() -> BinanceExchange:
+            return BinanceExchange(
+                client_config_map=client_config_map,
+                binance_api_key="testAPIKey",
+                binance_api_secret="testSecret",
+                trading_pairs=[self.trading_pair],
+            )
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("hummingbot.connector.exchange_py_base.data_path", return_value=directory):
+                # The response is mocked only once, the restarted exchange gets it from the cache
+                self.configure_trading_rules_response(mock_api=mock_api)
+                self.async_run_with_timeout(create_exchange()._update_trading_rules())
+
+                restarted_exchange = create_exchange()
+                self.async_run_with_timeout(restarted_exchange._update_trading_rules())
+
+        self.assertEqual(repr(self.expected_trading_rule),
+                         repr(restarted_exchange.trading_rules[self.trading_pair]))
+
+    def test_order_book_tracker_detects_sequence_gaps(self):
+        self.assertTrue(self.exchange.order_book_tracker.detect_sequence_gaps)
+
+    def test_stop_network_closes_the_shared_throttler(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rate_limits_share_group = "test_group"
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.assertIsInstance(exchange._throttler, SharedAsyncThrottler)
+        exchange._throttler.close = AsyncMock()
+
+        self.async_run_with_timeout(exchange.stop_network())
+
+        exchange._throttler.close.assert_awaited_once()
+
+    def test_shared_throttler_brokers_are_not_shared_across_domains(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rate_limits_share_group = "test_group"
+        exchanges = [BinanceExchange(client_config_map=client_config_map,
+                                     binance_api_key="testAPIKey",
+                                     binance_api_secret="testSecret",
+                                     trading_pairs=[self.trading_pair],
+                                     domain=domain)
+                     for domain in ("com", "us")]
+
+        self.assertNotEqual(exchanges[0]._throttler._socket_path, exchanges[1]._throttler._socket_path)
+
+    def test_order_book_diff_coalescing_is_enabled_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_diff_coalescing = True
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertFalse(self.exchange.order_book_tracker._coalesce_diffs)
+        self.assertTrue(exchange.order_book_tracker._coalesce_diffs)
+
+    def test_order_book_dispatcher_shards_are_set_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_dispatcher_shards = 2
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertEqual(0, self.exchange.order_book_tracker._dispatcher_shards)
+        self.assertEqual(2, exchange.order_book_tracker._dispatcher_shards)
+        self.assertEqual(2, len(exchange.order_book_tracker._shard_queues))
+
+    def test_message_queues_are_bounded_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.message_queue_max_size = 100
+        client_config_map.order_book_queue_overflow_policy = "drop_and_resnapshot"
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertEqual(0, self.exchange.order_book_tracker._queue_max_size)
+        diff_stream = exchange.order_book_tracker._order_book_diff_stream
+        self.assertEqual(100, diff_stream.maxsize)
+        self.assertEqual(QueueOverflowPolicy.DROP_AND_RESNAPSHOT, diff_stream.overflow_policy)
+        self.assertEqual(100, exchange._create_user_stream_tracker().user_stream.maxsize)
+
+    def test_websocket_hot_standby_is_enabled_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.websocket_hot_standby = True
+
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertIsNotNone(exchange._orderbook_ds._hot_standby_deduplicator)
+        self.assertIsNotNone(exchange._user_stream_tracker.data_source._hot_standby_deduplicator)
+
+    def test_connections_are_prewarmed_once_the_exchange_is_ready(self):
+        self.exchange._connections_to_prewarm = 2
+        prewarm_mock = AsyncMock(return_value=2)
+        self.exchange._web_assistants_factory.prewarm_connections = prewarm_mock
+        self.exchange._sleep = AsyncMock()
+
+        with patch.object(BinanceExchange, "ready", new_callable=PropertyMock, side_effect=[False, True]):
+            self.async_run_with_timeout(self.exchange._prewarm_connections_when_ready())
+
+        prewarm_mock.assert_awaited_once_with(
+            urls=[web_utils.private_rest_url(CONSTANTS.PING_PATH_URL, domain=self.exchange._domain)],
+            connections_per_host=2,
+            throttler_limit_id=CONSTANTS.PING_PATH_URL)
+        self.assertTrue(self.is_logged("INFO", "Opened 2 connections to binance ahead of the orders."))
+
     @aioresponses()
     def test_place_order_manage_server_overloaded_error_unkown_order(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -17,6 +17,7 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.bounded_message_queue import BoundedMessageQueue
 
 
 class BinanceUserStreamDataSourceUnitTests(unittest.TestCase):
@@ -235,6 +236,87 @@ class BinanceUserStreamDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(json.loads(self._user_update_event()), msg)
         mock_ws.return_value.ping.assert_called()
 
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_user_stream_with_hot_standby_queues_each_event_once(self, mock_api, mock_ws):
+        url = web_utils.private_rest_url(path_url=CONSTANTS.BINANCE_USER_STREAM_PATH_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        # The connections share the listen key, it is requested once
+        mock_api.post(regex_url, body=json.dumps({"listenKey": self.listen_key}))
+        primary_ws = self.mocking_assistant.create_websocket_mock()
+        standby_ws = self.mocking_assistant.create_websocket_mock()
+        mock_ws.side_effect = [primary_ws, standby_ws]
+
+        order_created = {"e": "executionReport", "E": 1499405658658, "s": self.ex_trading_pair, "i": 4293153,
+                         "x": "NEW", "X": "NEW", "t": -1}
+        order_filled = {"e": "executionReport", "E": 1499405658700, "s": self.ex_trading_pair, "i": 4293153,
+                        "x": "TRADE", "X": "FILLED", "t": 28457}
+        balance_update = {"e": "outboundAccountPosition", "E": 1564034571105, "u": 1564034571073,
+                          "B": [{"a": "ETH", "f": "10000.000000", "l": "0.000000"}]}
+        # The primary connection drops before the balance update, received through the standby connection only
+        for event in (order_created, order_filled):
+            self.mocking_assistant.add_websocket_aiohttp_message(primary_ws, json.dumps(event))
+        for event in (order_created, order_filled, balance_update):
+            self.mocking_assistant.add_websocket_aiohttp_message(standby_ws, json.dumps(event))
+
+        self.data_source.enable_hot_standby()
+        msg_queue = asyncio.Queue()
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_user_stream(msg_queue))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(primary_ws)
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(standby_ws)
+
+        events = [msg_queue.get_nowait() for _ in range(msg_queue.qsize())]
+        self.assertEqual(3, len(events))
+        self.assertEqual([order_created, order_filled, balance_update],
+                         sorted(events, key=lambda event: event["E"]))
+        self.assertEqual(2, len(self.data_source._hot_standby_ws_assistants))
+
+    def test_hot_standby_keeps_balance_updates_of_different_assets(self):
+        self.data_source.enable_hot_standby()
+        btc_update = {"e": "balanceUpdate", "E": 1573200697110, "a": "BTC", "d": "100.00000000", "T": 1573200697068}
+        eth_update = {"e": "balanceUpdate", "E": 1573200697110, "a": "ETH", "d": "-1.00000000", "T": 1573200697068}
+
+        self.assertTrue(self.data_source._is_first_copy(event_message=btc_update))
+        self.assertTrue(self.data_source._is_first_copy(event_message=eth_update))
+        self.assertFalse(self.data_source._is_first_copy(event_message=dict(btc_update)))
+
+    def test_hot_standby_keeps_list_statuses_of_different_order_lists(self):
+        self.data_source.enable_hot_standby()
+        first_list = {"e": "listStatus", "E": 1564035303637, "s": self.ex_trading_pair, "g": 2, "c": "OCO",
+                      "l": "EXEC_STARTED", "L": "EXECUTING", "T": 1564035303625}
+        second_list = dict(first_list, g=3)
+
+        self.assertTrue(self.data_source._is_first_copy(event_message=first_list))
+        self.assertTrue(self.data_source._is_first_copy(event_message=second_list))
+        self.assertFalse(self.data_source._is_first_copy(event_message=dict(first_list)))
+
+    def test_hot_standby_interruption_keeps_listen_key_while_other_connection_is_live(self):
+        self.data_source._sleep = AsyncMock()
+        self.data_source.enable_hot_standby()
+        manage_listen_key_task = MagicMock()
+        self.data_source._manage_listen_key_task = manage_listen_key_task
+        self.data_source._current_listen_key = self.listen_key
+        self.data_source._listen_key_initialized_event.set()
+        live_ws = AsyncMock()
+        failed_ws = AsyncMock()
+        self.data_source._hot_standby_ws_assistants.append(live_ws)
+
+        self.async_run_with_timeout(self.data_source._on_user_stream_interruption(websocket_assistant=failed_ws))
+
+        failed_ws.disconnect.assert_awaited_once()
+        live_ws.disconnect.assert_not_called()
+        manage_listen_key_task.cancel.assert_not_called()
+        self.assertEqual(self.listen_key, self.data_source._current_listen_key)
+        self.assertTrue(self.data_source._listen_key_initialized_event.is_set())
+
+        # Once the last connection drops, the listen key is released
+        self.data_source._hot_standby_ws_assistants.remove(live_ws)
+        self.async_run_with_timeout(self.data_source._on_user_stream_interruption(websocket_assistant=live_ws))
+
+        manage_listen_key_task.cancel.assert_called_once()
+        self.assertIsNone(self.data_source._current_listen_key)
+        self.assertFalse(self.data_source._listen_key_initialized_event.is_set())
+
     @aioresponses()
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_user_stream_does_not_queue_empty_payload(self, mock_api, mock_ws):
@@ -311,3 +393,16 @@ class BinanceUserStreamDataSourceUnitTests(unittest.TestCase):
             self._is_logged(
                 "ERROR",
                 "Unexpected error while listening to user stream. Retrying after 5 seconds..."))
+
+    def test_full_bounded_queue_blocks_the_user_stream_reader(self):
+        queue = BoundedMessageQueue(max_size=1)
+
+        self.async_run_with_timeout(self.data_source._process_event_message({"e": "first"}, queue))
+        process_task = self.ev_loop.create_task(self.data_source._process_event_message({"e": "second"}, queue))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertFalse(process_task.done())
+
+        self.assertEqual({"e": "first"}, self.async_run_with_timeout(queue.get()))
+        self.async_run_with_timeout(process_task)
+        self.assertEqual({"e": "second"}, queue.get_nowait())
+        self.assertEqual(0, queue.overflowed_messages)
@@ -352,7 +352,7 @@ class TestGateIoAPIOrderBookDataSource(unittest.TestCase):
         msg = output_queue.get_nowait()
 
         self.assertTrue(isinstance(msg, OrderBookMessage))
-        self.assertEqual(asks, msg.content["asks"][0], msg=f"{msg}")
+        self.assertEqual([float(value) for value in asks], msg.asks_array[0, :2].tolist(), msg=f"{msg}")
 
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_order_book_diffs_snapshot_skips_subscribe_unsubscribe_messages(self, ws_connect_mock):
@@ -179,6 +179,115 @@ class TestKucoinAPIOrderBookDataSource(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    def _sharded_data_source(self, trading_pairs, connections: int) -> KucoinAPIOrderBookDataSource:
+        self.connector._set_trading_pair_symbol_map(bidict({pair: pair for pair in trading_pairs}))
+        data_source = KucoinAPIOrderBookDataSource(
+            trading_pairs=trading_pairs,
+            connector=self.connector,
+            api_factory=self.connector._web_assistants_factory)
+        data_source.configure_subscription_sharding(connections=connections)
+        return data_source
+
+    def _mock_ws_token_request(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.PUBLIC_WS_DATA_PATH_URL)
+        resp = {
+            "code": "200000",
+            "data": {
+                "instanceServers": [
+                    {
+                        "endpoint": "wss://test.url/endpoint",
+                        "protocol": "websocket",
+                        "encrypt": True,
+                        "pingInterval": 50000,
+                        "pingTimeout": 10000
+                    }
+                ],
+                "token": "testToken"
+            }
+        }
+        mock_api.post(url, body=json.dumps(resp), repeat=True)
+
+    @staticmethod
+    def _diff_event(trading_pair: str) -> Dict:
+        return {
+            "type": "message",
+            "topic": f"/market/level2:{trading_pair}",
+            "subject": "trade.l2update",
+            "data": {
+                "sequenceStart": 1545896669105,
+                "sequenceEnd": 1545896669106,
+                "symbol": trading_pair,
+                "changes": {
+                    "asks": [["6", "1", "1545896669105"]],
+                    "bids": [["4", "1", "1545896669106"]]
+                }
+            }
+        }
+
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_shards_trading_pairs_across_connections(self, mock_api, ws_connect_mock):
+        trading_pairs = ["A-USDT", "B-USDT", "C-USDT"]
+        data_source = self._sharded_data_source(trading_pairs=trading_pairs, connections=2)
+        self._mock_ws_token_request(mock_api)
+        websocket_mocks = [self.mocking_assistant.create_websocket_mock() for _ in range(2)]
+        ws_connect_mock.side_effect = websocket_mocks
+        for websocket_mock, trading_pair in zip(websocket_mocks, ["A-USDT", "B-USDT"]):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=websocket_mock,
+                message=json.dumps(self._diff_event(trading_pair)))
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        for websocket_mock in websocket_mocks:
+            self.mocking_assistant.run_until_all_aiohttp_messages_delivered(websocket_mock)
+
+        topics = [[message["topic"] for message in self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=websocket_mock)] for websocket_mock in websocket_mocks]
+        self.assertEqual(["/market/match:A-USDT,C-USDT", "/market/level2:A-USDT,C-USDT"], topics[0])
+        self.assertEqual(["/market/match:B-USDT", "/market/level2:B-USDT"], topics[1])
+        self.assertTrue(self._is_logged("INFO", "Subscribed to 3 trading pairs through 2 connections."))
+
+        diffs_queue = data_source._message_queue[data_source._diff_messages_queue_key]
+        self.assertEqual(2, diffs_queue.qsize())
+        received_pairs = {diffs_queue.get_nowait()["data"]["symbol"] for _ in range(2)}
+        self.assertEqual({"A-USDT", "B-USDT"}, received_pairs)
+
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_sharded_subscriptions_are_rebalanced_by_message_rate_on_reconnection(self, mock_api, ws_connect_mock):
+        trading_pairs = ["A-USDT", "B-USDT", "C-USDT", "D-USDT"]
+        data_source = self._sharded_data_source(trading_pairs=trading_pairs, connections=2)
+        for trading_pair, messages in (("A-USDT", 100), ("B-USDT", 90), ("C-USDT", 10), ("D-USDT", 5)):
+            for _ in range(messages):
+                data_source.record_trading_pair_message(trading_pair)
+        self._mock_ws_token_request(mock_api)
+        websocket_mocks = [self.mocking_assistant.create_websocket_mock() for _ in range(2)]
+        ws_connect_mock.side_effect = websocket_mocks
+        for websocket_mock in websocket_mocks:
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=websocket_mock,
+                message=json.dumps({"type": "ack", "id": 1}))
+
+        self.listening_task = self.ev_loop.create_task(data_source.listen_for_subscriptions())
+        for websocket_mock in websocket_mocks:
+            self.mocking_assistant.run_until_all_aiohttp_messages_delivered(websocket_mock)
+
+        topics = [[message["topic"] for message in self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=websocket_mock)] for websocket_mock in websocket_mocks]
+        self.assertEqual(["/market/match:A-USDT,D-USDT", "/market/level2:A-USDT,D-USDT"], topics[0])
+        self.assertEqual(["/market/match:B-USDT,C-USDT", "/market/level2:B-USDT,C-USDT"], topics[1])
+        # The rates are measured again until the next reconnection
+        self.assertEqual({}, data_source._trading_pair_message_counts)
+
+    def test_trading_pairs_above_the_topic_limit_are_sharded(self):
+        trading_pairs = [f"COIN{index}-USDT" for index in range(CONSTANTS.WS_MAX_SYMBOLS_PER_TOPIC + 1)]
+        data_source = KucoinAPIOrderBookDataSource(
+            trading_pairs=trading_pairs,
+            connector=self.connector,
+            api_factory=self.connector._web_assistants_factory)
+
+        self.assertEqual(2, data_source._subscription_shards_count())
+
     @aioresponses()
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch("hummingbot.connector.exchange.kucoin.kucoin_web_utils.next_message_id")
@@ -2627,3 +2627,18 @@ class KucoinExchangeTests(unittest.TestCase):
 
         self.assertEqual(expected_initial_dict, status_dict)
         self.assertFalse(self.exchange.ready)
+
+    def test_order_book_subscription_sharding_is_configured_from_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_connections = 3
+
+        exchange = KucoinExchange(
+            client_config_map=client_config_map,
+            kucoin_api_key=self.api_key,
+            kucoin_passphrase=self.api_passphrase,
+            kucoin_secret_key=self.api_secret_key,
+            trading_pairs=["A-USDT", "B-USDT", "C-USDT", "D-USDT"],
+        )
+
+        self.assertEqual(3, exchange._orderbook_ds._subscription_connections)
+        self.assertEqual(3, exchange._orderbook_ds._subscription_shards_count())
@@ -21,6 +21,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.pubsub import PubSub
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
@@ -28,6 +29,19 @@ from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLCon
 from hummingbot.model.trade_fill import TradeFill
 
 
+class RecordedMarket(PubSub):
+    def __init__(self, display_name: str):
+        super().__init__()
+        self.display_name = display_name
+        self.tracking_states = {}
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
 class MarketsRecorderTests(TestCase):
     @staticmethod
     def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
@@ -416,3 +430,53 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual([[3, 1, 3], [2, 1, 2], [1, 1, 1]], market_data[0].order_book["bid"])
+        self.assertEqual([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], market_data[0].order_book["ask"])
+
+    def test_triggered_events_are_recorded_in_order_off_the_trigger_path(self):
+        market = RecordedMarket(self.display_name)
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[market],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+
+        market.trigger_event(MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent(
+            timestamp=int(time.time()),
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        ))
+        market.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=1640001112.223,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1000),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TID1",
+        ))
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual(1, len(orders[0].trade_fills))
@@ -11,7 +11,8 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RateLimitUsageHeader
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -88,79 +89,57 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertEqual(TEST_PATH_URL, rate_limit.limit_id)
         self.assertEqual(1, len(related_limits))
 
+    def _context(self, rate_limit: RateLimit, related_limits, limit_windows=None) -> AsyncRequestContext:
+        return AsyncRequestContext(limit_windows=limit_windows or self.throttler._limit_windows,
+                                   rate_limit=rate_limit,
+                                   related_limits=related_limits,
+                                   safety_margin_pct=self.throttler._safety_margin_pct)
+
     def test_flush_empty_task_logs(self):
         # Test: No entries in task_logs to flush
-        lock = asyncio.Lock()
-
         rate_limit = self.rate_limits[0]
-        self.assertEqual(0, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        window = self.throttler._limit_windows[rate_limit.limit_id]
+        self.assertEqual(0, len(window))
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         context.flush()
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, len(window))
 
     def test_flush_only_elapsed_tasks_are_flushed(self):
-        lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        window = self.throttler._limit_windows[rate_limit.limit_id]
+        window.log(1.0, rate_limit.weight)
+        window.log(time.time(), rate_limit.weight)
 
-        self.assertEqual(2, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertEqual(2, len(window))
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(window))
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
-
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.throttler._limit_windows[rate_limit.limit_id].log(time.time(), rate_limit.weight)
+
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         self.assertFalse(context.within_capacity())
 
     def test_within_capacity_singular_non_weighted_task_returns_true(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_pool_non_weighted_task_returns_false(self):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].log(time.time(), weight)
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(rate_limit, related_limits)
         self.assertFalse(context.within_capacity())
 
     def test_within_capacity_pool_non_weighted_task_returns_true(self):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(rate_limit, related_limits)
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_pool_weighted_tasks(self):
@@ -168,67 +147,137 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].log(time.time(), weight)
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.throttler._limit_windows[linked_limit.limit_id].log(time.time(), weight)
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=task_1,
-                                      related_limits=task_1_related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(task_1, task_1_related_limits)
         self.assertFalse(context.within_capacity())
 
         # However Task 2(weight=1) will not exceed the capacity(7/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=task_2,
-                                      related_limits=task_2_related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(task_2, task_2_related_limits)
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_returns_true(self):
-        lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         self.assertTrue(context.within_capacity())
 
     def test_acquire_appends_to_task_logs(self):
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        context = self._context(rate_limit, [])
         self.ev_loop.run_until_complete(context.acquire())
 
         # We acquire()'d just one rate_limit, task log should have only one entry
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(self.throttler._limit_windows[rate_limit.limit_id]))
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
-                                      rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.throttler._limit_windows[rate_limit.limit_id].log(time.time(), rate_limit.weight)
+        context = self._context(rate_limit, [(rate_limit, rate_limit.weight)])
         with self.assertRaises(asyncio.exceptions.TimeoutError):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
 
+    def test_acquire_wakes_up_when_capacity_is_freed(self):
+        rate_limit = RateLimit(limit_id="fast_limit", limit=2, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        sleep_delays = []
+        sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            sleep_delays.append(delay)
+            await sleep(delay)
+
+        async def execute_requests():
+            for _ in range(3):
+                # Without a scheduler, the context waits for the capacity on its own
+                async with self._context(rate_limit, [], limit_windows=throttler._limit_windows):
+                    pass
+
+        start = time.time()
+        with patch("hummingbot.core.api_throttler.async_request_context_base.asyncio.sleep", new=record_sleep):
+            self.ev_loop.run_until_complete(execute_requests())
+
+        # The third request waits once, until the first one leaves the window
+        self.assertEqual(1, len(sleep_delays))
+        self.assertAlmostEqual(0.2, sleep_delays[0], delta=0.05)
+        self.assertGreaterEqual(time.time() - start, 0.2)
+
+    def test_set_rate_limits_keeps_logged_requests(self):
+        rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
+        window = self.throttler._limit_windows[TEST_POOL_ID]
+        window.log(time.time(), rate_limit.weight)
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0)])
+
+        self.assertIs(window, self.throttler._limit_windows[TEST_POOL_ID])
+        self.assertEqual([TEST_POOL_ID], list(self.throttler._limit_windows.keys()))
+        self.assertEqual(2, window.rate_limit.limit)
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
+        self.assertFalse(context.within_capacity())
+
+    def test_process_response_headers_aligns_capacity_used_with_reported_usage(self):
+        throttler = AsyncThrottler(
+            rate_limits=self.rate_limits,
+            usage_headers=[RateLimitUsageHeader(header="X-USED-WEIGHT", limit_id=TEST_WEIGHTED_POOL_ID),
+                           RateLimitUsageHeader(header="X-REMAINING", reports_remaining=True)])
+        pool_window = throttler._limit_windows[TEST_WEIGHTED_POOL_ID]
+        task_window = throttler._limit_windows[TEST_WEIGHTED_TASK_2_ID]
+
+        context = throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID)
+        self.assertIsNone(context.acquired_at)
+        self.ev_loop.run_until_complete(context.acquire())
+        self.assertIsNotNone(context.acquired_at)
+        self.assertEqual(1, pool_window.capacity_used(time.time()))
+
+        # Another process uses the same key
+        throttler.process_response_headers({"X-USED-WEIGHT": "8", "X-REMAINING": "990"}, context)
+
+        self.assertEqual(8, pool_window.capacity_used(time.time()))
+        self.assertEqual(10, task_window.capacity_used(time.time()))
+        self.assertFalse(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+        throttler.process_response_headers({"X-USED-WEIGHT": "2", "X-REMAINING": "invalid"}, context)
+
+        self.assertEqual(2, pool_window.capacity_used(time.time()))
+        self.assertEqual(10, task_window.capacity_used(time.time()))
+        self.assertTrue(throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+
+    def test_reconcile_usage_wakes_up_waiting_requests(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        sent_at = time.time()
+        throttler._limit_windows[TEST_POOL_ID].log(sent_at, 10)
+
+        waiting_request = asyncio.ensure_future(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertFalse(waiting_request.done())
+
+        # The exchange reports less capacity used than logged, the request must not wait for the window to pass
+        throttler.reconcile_usage(limit_id=TEST_POOL_ID, sent_at=sent_at, reported_capacity_used=2)
+        self.ev_loop.run_until_complete(asyncio.wait_for(waiting_request, 1.0))
+
+        self.assertEqual(3, throttler._limit_windows[TEST_POOL_ID].capacity_used(time.time()))
+
+    def test_process_response_headers_without_usage_headers(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.throttler.process_response_headers({"X-USED-WEIGHT": "8"}, context)
+
+        self.assertEqual(1, self.throttler._limit_windows[TEST_POOL_ID].capacity_used(time.time()))
+
     def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
         throttler = AsyncThrottler(rate_limits=[])
         context = throttler.execute_task(limit_id="test_limit_id")
         self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
 
     @patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time")
     def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
@@ -238,17 +287,17 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             LinkedLimitWeightPair(per_second_limit.limit_id),
             LinkedLimitWeightPair(per_millisecond_limit.limit_id),
         ])
+        limit_windows = {rate_limit.limit_id: RateLimitWindow(rate_limit, 0)
+                         for rate_limit in [per_second_limit, per_millisecond_limit, specific_limit]}
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
+        limit_windows[per_millisecond_limit.limit_id].log(1640000000.0000, 1)
+        limit_windows[per_second_limit.limit_id].log(1640000000.0000, 1)
 
         context = AsyncRequestContext(
-            task_logs=tasks_log,
+            limit_windows=limit_windows,
             rate_limit=specific_limit,
             related_limits=[(per_millisecond_limit, 1), (per_second_limit, 1), (specific_limit, 1)],
-            lock=asyncio.Lock(),
             safety_margin_pct=0,
         )
 
@@ -257,12 +306,13 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertTrue(result)
 
         # Add one more occurrence of the same task but at millisecond 1
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
+        limit_windows[per_millisecond_limit.limit_id].log(1640000000.1000, 1)
+        limit_windows[per_second_limit.limit_id].log(1640000000.1000, 1)
 
         time_mock.return_value = 1640000000.1000
         result = context.within_capacity()
         self.assertFalse(result)
+        self.assertAlmostEqual(0.1, context.wait_time(), places=5)
 
         time_mock.return_value = 1640000000.1900
         result = context.within_capacity()
@@ -275,3 +325,4 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+        self.assertEqual(0, context.wait_time())
@@ -0,0 +1,149 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.priority_scheduler import LaneWaitStats
+
+SHARED_LIMIT_ID = "shared"
+CANCEL_LIMIT_ID = "/cancel"
+STATUS_LIMIT_ID = "/status"
+OTHER_LIMIT_ID = "other"
+
+
+class PriorityRequestSchedulerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=SHARED_LIMIT_ID, limit=1, time_interval=0.1),
+            RateLimit(limit_id=CANCEL_LIMIT_ID, limit=100, time_interval=0.1,
+                      linked_limits=[LinkedLimitWeightPair(SHARED_LIMIT_ID)]),
+            RateLimit(limit_id=STATUS_LIMIT_ID, limit=100, time_interval=0.1,
+                      linked_limits=[LinkedLimitWeightPair(SHARED_LIMIT_ID)]),
+            RateLimit(limit_id=OTHER_LIMIT_ID, limit=1, time_interval=0.1),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+        self.served: List[str] = []
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _request(self, name: str, limit_id: str, priority: RequestPriority):
+        async with self.throttler.execute_task(limit_id=limit_id, priority=priority):
+            self.served.append(name)
+
+    async def _fill_shared_limit(self):
+        await self._request("filler", SHARED_LIMIT_ID, RequestPriority.PUBLIC_DATA)
+
+    def test_request_takes_capacity_right_away_when_nobody_waits(self):
+        self.async_run_with_timeout(self._request("status", STATUS_LIMIT_ID, RequestPriority.PRIVATE_QUERY))
+
+        stats = self.throttler.priority_lane_stats[RequestPriority.PRIVATE_QUERY]
+        self.assertEqual(["status"], self.served)
+        self.assertEqual(1, stats.requests)
+        self.assertEqual(0, stats.delayed_requests)
+        self.assertEqual(0, self.throttler._scheduler.waiting_requests)
+
+    def test_higher_priority_request_is_served_first(self):
+        async def run():
+            await self._fill_shared_limit()
+            statuses = [asyncio.ensure_future(self._request(f"status_{i}", STATUS_LIMIT_ID, RequestPriority.PUBLIC_DATA))
+                        for i in range(2)]
+            await asyncio.sleep(0)
+            cancel = asyncio.ensure_future(self._request("cancel", CANCEL_LIMIT_ID, RequestPriority.CANCEL))
+            await asyncio.gather(cancel, *statuses)
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["filler", "cancel", "status_0", "status_1"], self.served)
+        cancel_stats = self.throttler.priority_lane_stats[RequestPriority.CANCEL]
+        public_stats = self.throttler.priority_lane_stats[RequestPriority.PUBLIC_DATA]
+        self.assertEqual(1, cancel_stats.delayed_requests)
+        self.assertEqual(3, public_stats.requests)
+        self.assertEqual(2, public_stats.delayed_requests)
+        self.assertGreater(public_stats.max_wait, cancel_stats.max_wait)
+
+    def test_new_request_does_not_overtake_waiting_requests(self):
+        async def run():
+            await self._fill_shared_limit()
+            cancel = asyncio.ensure_future(self._request("cancel", CANCEL_LIMIT_ID, RequestPriority.CANCEL))
+            await asyncio.sleep(0.15)
+            # The capacity is freed, but the status request must not take it before the waiting cancel
+            self.assertEqual(["filler", "cancel"], self.served)
+            await self._request("status", STATUS_LIMIT_ID, RequestPriority.PRIVATE_QUERY)
+            await cancel
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["filler", "cancel", "status"], self.served)
+
+    def test_requests_on_unrelated_limits_are_not_blocked(self):
+        async def run():
+            await self._fill_shared_limit()
+            status = asyncio.ensure_future(self._request("status", STATUS_LIMIT_ID, RequestPriority.CANCEL))
+            await asyncio.sleep(0)
+            await self._request("other", OTHER_LIMIT_ID, RequestPriority.PUBLIC_DATA)
+            self.assertEqual(["filler", "other"], self.served)
+            await status
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["filler", "other", "status"], self.served)
+
+    def test_waiting_request_is_promoted_to_prevent_starvation(self):
+        self.throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, priority_aging_interval=0.02)
+
+        async def run():
+            await self._fill_shared_limit()
+            status = asyncio.ensure_future(self._request("status", STATUS_LIMIT_ID, RequestPriority.PUBLIC_DATA))
+            await asyncio.sleep(0.08)
+            cancel = asyncio.ensure_future(self._request("cancel", CANCEL_LIMIT_ID, RequestPriority.CANCEL))
+            await asyncio.gather(status, cancel)
+
+        self.async_run_with_timeout(run())
+
+        # The status request waited long enough to be promoted to the cancel lane, and it was queued first
+        self.assertEqual(["filler", "status", "cancel"], self.served)
+
+    def test_cancelled_waiting_request_unblocks_lower_priority_requests(self):
+        async def run():
+            await self._fill_shared_limit()
+            cancel = asyncio.ensure_future(self._request("cancel", CANCEL_LIMIT_ID, RequestPriority.CANCEL))
+            status = asyncio.ensure_future(self._request("status", STATUS_LIMIT_ID, RequestPriority.PUBLIC_DATA))
+            await asyncio.sleep(0)
+            cancel.cancel()
+            await status
+            with self.assertRaises(asyncio.CancelledError):
+                await cancel
+
+        start = time.time()
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(["filler", "status"], self.served)
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(0, self.throttler._scheduler.waiting_requests)
+        self.assertEqual(0, len(self.throttler._scheduler._waiting_windows))
+
+
+class LaneWaitStatsTests(unittest.TestCase):
+
+    def test_add(self):
+        stats = LaneWaitStats()
+        stats.add(0.0)
+        stats.add(0.3)
+        stats.add(0.1)
+
+        self.assertEqual(3, stats.requests)
+        self.assertEqual(2, stats.delayed_requests)
+        self.assertAlmostEqual(0.4, stats.total_wait)
+        self.assertAlmostEqual(0.4 / 3, stats.mean_wait)
+        self.assertEqual(0.3, stats.max_wait)
+        self.assertEqual({"requests": 3, "delayed_requests": 2, "mean_wait": stats.mean_wait, "max_wait": 0.3},
+                         stats.to_dict())
@@ -0,0 +1,84 @@
+import unittest
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.rate_limit_window import RateLimitWindow
+
+
+class RateLimitWindowTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.window = RateLimitWindow(RateLimit(limit_id="test", limit=5, time_interval=10), safety_margin_pct=0.1)
+
+    def test_capacity_used_within_window(self):
+        self.window.log(100.0, 2)
+        self.window.log(105.0, 2)
+
+        self.assertEqual(11, self.window.length)
+        self.assertEqual(4, self.window.capacity_used(111.0))
+        self.assertTrue(self.window.has_capacity(111.0, 1))
+        self.assertFalse(self.window.has_capacity(111.0, 2))
+
+        self.assertEqual(2, self.window.capacity_used(111.1))
+        self.assertEqual(1, len(self.window))
+        self.assertEqual(0, self.window.capacity_used(116.1))
+        self.assertEqual(0, len(self.window))
+
+    def test_wait_time(self):
+        self.window.log(100.0, 2)
+        self.window.log(101.0, 1)
+        self.window.log(102.0, 2)
+
+        self.assertEqual(0, self.window.wait_time(103.0, 0))
+        self.assertAlmostEqual(8.0, self.window.wait_time(103.0, 1), places=5)
+        self.assertAlmostEqual(8.0, self.window.wait_time(103.0, 2), places=5)
+        self.assertAlmostEqual(9.0, self.window.wait_time(103.0, 3), places=5)
+        # Heavier than the limit
+        self.assertEqual(11, self.window.wait_time(103.0, 6))
+
+    def test_set_rate_limit_keeps_logged_requests(self):
+        self.window.log(100.0, 4)
+
+        self.window.set_rate_limit(RateLimit(limit_id="test", limit=3, time_interval=20), safety_margin_pct=0)
+
+        self.assertEqual(20, self.window.length)
+        self.assertFalse(self.window.has_capacity(115.0, 1))
+        self.assertTrue(self.window.has_capacity(120.1, 3))
+
+    def test_reconcile_adds_capacity_used_elsewhere(self):
+        self.window.log(100.0, 1)
+        self.window.log(101.0, 1)
+        # Logged after the request the report is for
+        self.window.log(103.0, 1)
+
+        self.window.reconcile(now=104.0, sent_at=101.0, reported_capacity_used=4)
+
+        self.assertEqual(5, self.window.capacity_used(104.0))
+        self.assertEqual(4, len(self.window))
+        # The difference is logged with the request the report is for
+        self.assertEqual(4, self.window.capacity_used(111.5))
+        self.assertEqual(1, self.window.capacity_used(112.5))
+
+    def test_reconcile_frees_capacity_from_the_oldest_requests(self):
+        self.window.log(100.0, 2)
+        self.window.log(101.0, 2)
+        self.window.log(103.0, 1)
+
+        self.window.reconcile(now=104.0, sent_at=101.0, reported_capacity_used=1)
+
+        self.assertEqual(2, self.window.capacity_used(104.0))
+        self.assertEqual(2, len(self.window))
+
+        self.window.reconcile(now=104.0, sent_at=103.0, reported_capacity_used=0)
+
+        self.assertEqual(0, self.window.capacity_used(104.0))
+        self.assertEqual(0, len(self.window))
+
+    def test_reconcile_with_matching_report_keeps_the_window(self):
+        self.window.log(100.0, 2)
+        self.window.log(101.0, 1)
+
+        self.window.reconcile(now=102.0, sent_at=101.0, reported_capacity_used=3)
+
+        self.assertEqual(3, self.window.capacity_used(102.0))
+        self.assertEqual(2, len(self.window))
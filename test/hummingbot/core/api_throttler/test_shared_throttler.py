@@ -0,0 +1,191 @@
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from typing import Awaitable, List, Tuple
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.shared_throttler import SharedAsyncThrottler, shared_throttler_socket_path
+
+POOL_ID = "pool"
+ENDPOINT_ID = "/endpoint"
+RATE_LIMITS = [
+    RateLimit(limit_id=POOL_ID, limit=4, time_interval=0.5),
+    RateLimit(limit_id=ENDPOINT_ID, limit=100, time_interval=0.5, linked_limits=[LinkedLimitWeightPair(POOL_ID)]),
+]
+
+
+def run_bot(socket_path: str, requests: int, barrier, results):
+    """
+    Bot process of the multi-process harness: sends requests through a shared throttler and reports when they were
+    allowed to run
+    """
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    throttler = SharedAsyncThrottler(RATE_LIMITS, socket_path=socket_path, safety_margin_pct=0)
+
+    async def run():
+        timestamps = []
+        for _ in range(requests):
+            async with throttler.execute_task(limit_id=ENDPOINT_ID):
+                timestamps.append(time.time())
+        results.put((os.getpid(), throttler.is_broker, timestamps))
+        # The broker must stay up until all the bots are done
+        await asyncio.get_event_loop().run_in_executor(None, barrier.wait)
+        await throttler.close()
+
+    asyncio.get_event_loop().run_until_complete(run())
+
+
+class SharedAsyncThrottlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.directory, "throttler.sock")
+        self.throttlers: List[SharedAsyncThrottler] = []
+
+    def tearDown(self) -> None:
+        for throttler in self.throttlers:
+            self.async_run_with_timeout(throttler.close())
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _throttler(self) -> SharedAsyncThrottler:
+        throttler = SharedAsyncThrottler(RATE_LIMITS, socket_path=self.socket_path, safety_margin_pct=0)
+        self.throttlers.append(throttler)
+        return throttler
+
+    async def _execute_requests(self, throttler: SharedAsyncThrottler, requests: int,
+                                priority: RequestPriority = RequestPriority.PRIVATE_QUERY) -> List[float]:
+        timestamps = []
+        for _ in range(requests):
+            async with throttler.execute_task(limit_id=ENDPOINT_ID, priority=priority):
+                timestamps.append(time.time())
+        return timestamps
+
+    def test_socket_path(self):
+        path = shared_throttler_socket_path(group="group_1", connector_name="binance", domain="com",
+                                            rate_limits=RATE_LIMITS)
+
+        self.assertEqual(tempfile.gettempdir(), os.path.dirname(path))
+        self.assertTrue(os.path.basename(path).startswith("hummingbot_throttler_group_1_binance_com_"))
+        self.assertEqual(path, shared_throttler_socket_path(group="group_1", connector_name="binance", domain="com",
+                                                            rate_limits=list(reversed(RATE_LIMITS))))
+
+    def test_socket_path_depends_on_the_domain_and_the_rate_limits(self):
+        path = shared_throttler_socket_path(group="group_1", connector_name="binance", domain="com",
+                                            rate_limits=RATE_LIMITS)
+
+        self.assertNotEqual(path, shared_throttler_socket_path(group="group_1", connector_name="binance", domain="us",
+                                                               rate_limits=RATE_LIMITS))
+        self.assertNotEqual(path, shared_throttler_socket_path(group="group_1", connector_name="binance", domain="com",
+                                                               rate_limits=RATE_LIMITS[:1]))
+
+    def test_first_throttler_becomes_the_broker_and_limits_are_shared(self):
+        broker = self._throttler()
+        client = self._throttler()
+
+        self.async_run_with_timeout(self._execute_requests(broker, 2))
+        self.async_run_with_timeout(self._execute_requests(client, 2))
+
+        self.assertTrue(broker.is_broker)
+        self.assertFalse(client.is_broker)
+        # Each throttler keeps track of the capacity its process used
+        self.assertEqual(2, broker._limit_windows[POOL_ID].capacity_used(time.time()))
+        self.assertEqual(2, client._limit_windows[POOL_ID].capacity_used(time.time()))
+        # The budget is used up by the requests of both throttlers
+        start = time.time()
+        self.async_run_with_timeout(self._execute_requests(client, 1))
+        self.assertGreater(time.time() - start, 0.3)
+        self.assertEqual(3, client.priority_lane_stats[RequestPriority.PRIVATE_QUERY].requests)
+        self.assertGreater(client.priority_lane_stats[RequestPriority.PRIVATE_QUERY].max_wait, 0.3)
+
+    def test_new_broker_is_elected_when_the_broker_exits(self):
+        broker = self._throttler()
+        client = self._throttler()
+        self.async_run_with_timeout(self._execute_requests(broker, 1))
+        self.async_run_with_timeout(self._execute_requests(client, 3))
+
+        self.async_run_with_timeout(broker.close())
+        start = time.time()
+        timestamps = self.async_run_with_timeout(self._execute_requests(client, 2))
+
+        self.assertTrue(client.is_broker)
+        # The new broker knows about the requests the client sent through the previous one: the first request fills
+        # up the pool, the second one waits
+        self.assertLess(timestamps[0] - start, 0.1)
+        self.assertGreater(timestamps[1] - start, 0.3)
+
+    def test_new_broker_is_not_sent_the_usage_reconciled_from_the_exchange(self):
+        broker = self._throttler()
+        client = self._throttler()
+        self.async_run_with_timeout(self._execute_requests(broker, 1))
+        self.async_run_with_timeout(self._execute_requests(client, 1))
+        # The exchange reports the usage of the whole account, every process of the group knows about it
+        client.reconcile_usage(limit_id=POOL_ID, sent_at=time.time(), reported_capacity_used=3)
+        self.assertEqual(3, client._limit_windows[POOL_ID].capacity_used(time.time()))
+
+        self.async_run_with_timeout(broker.close())
+        self.async_run_with_timeout(self._execute_requests(client, 1))
+
+        self.assertTrue(client.is_broker)
+        # Only the request the client sent itself is merged, with the one just sent
+        self.assertEqual(2, client._broker.throttler._limit_windows[POOL_ID].capacity_used(time.time()))
+
+    def test_falls_back_to_local_throttling_when_broker_election_is_not_supported(self):
+        throttler = self._throttler()
+
+        with patch.object(SharedAsyncThrottler, "_broker_election_supported", return_value=False):
+            timestamps = self.async_run_with_timeout(self._execute_requests(throttler, 5))
+
+        self.assertFalse(throttler.is_broker)
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.assertEqual(5, len(timestamps))
+        self.assertGreater(timestamps[-1] - timestamps[3], 0.3)
+        self.assertEqual(float("inf"), throttler._local_fallback_until)
+
+    def test_falls_back_to_local_throttling_when_no_broker_is_reachable(self):
+        # Another process holds the broker lock but does not serve the socket
+        other_throttler = self._throttler()
+        self.assertTrue(other_throttler._acquire_broker_lock())
+        throttler = self._throttler()
+
+        with patch("hummingbot.core.api_throttler.shared_throttler.BROKER_CONNECTION_ATTEMPTS", 2):
+            timestamps = self.async_run_with_timeout(self._execute_requests(throttler, 5))
+
+        self.assertFalse(throttler.is_broker)
+        self.assertEqual(5, len(timestamps))
+        # The local rate limits still apply
+        self.assertGreater(timestamps[-1] - timestamps[3], 0.3)
+        self.assertLess(time.time(), throttler._local_fallback_until)
+
+    def test_multiple_processes_share_the_rate_limits(self):
+        bots, requests_per_bot = 3, 4
+        context = multiprocessing.get_context("fork")
+        barrier = context.Barrier(bots)
+        results = context.Queue()
+        processes = [context.Process(target=run_bot, args=(self.socket_path, requests_per_bot, barrier, results))
+                     for _ in range(bots)]
+        for process in processes:
+            process.start()
+        bot_results: List[Tuple[int, bool, List[float]]] = [results.get(timeout=10) for _ in range(bots)]
+        for process in processes:
+            process.join(timeout=10)
+
+        self.assertEqual(1, sum(1 for _, is_broker, _ in bot_results if is_broker))
+        timestamps = sorted(timestamp for _, _, bot_timestamps in bot_results for timestamp in bot_timestamps)
+        self.assertEqual(bots * requests_per_bot, len(timestamps))
+        # No more than the pool limit in any rate limit period, across all the processes
+        for index in range(len(timestamps) - 4):
+            self.assertGreaterEqual(timestamps[index + 4] - timestamps[index], 0.5 - 0.01)
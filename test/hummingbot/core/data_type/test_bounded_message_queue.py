@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.core.data_type.bounded_message_queue import (
+    BoundedMessageQueue,
+    QueueOverflowPolicy,
+    merge_diff_messages,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class BoundedMessageQueueTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dropped_trading_pairs = []
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def _diff_message(trading_pair: str,
+                      update_id: int,
+                      bids: List[List[float]],
+                      asks: List[List[float]],
+                      with_first_update_id: bool = True):
+        content = {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }
+        if with_first_update_id:
+            content["first_update_id"] = update_id
+        return OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=update_id)
+
+    @staticmethod
+    def _trade_message(trading_pair: str, trade_id: int):
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair, "trade_id": trade_id, "price": 1, "amount": 1}, timestamp=trade_id)
+
+    def test_merge_diff_messages(self):
+        merged = merge_diff_messages(self._diff_message("A-B", 1, [[10, 1], [9, 1]], [[11, 1]]),
+                                     self._diff_message("A-B", 2, [[10, 0]], [[12, 2]]))
+
+        self.assertEqual(1, merged.first_update_id)
+        self.assertEqual(2, merged.update_id)
+        self.assertEqual(2, merged.timestamp)
+        self.assertEqual([OrderBookRow(10, 0, 2), OrderBookRow(9, 1, 2)], merged.bids)
+        self.assertEqual([OrderBookRow(11, 1, 2), OrderBookRow(12, 2, 2)], merged.asks)
+
+    def test_merge_diff_messages_without_first_update_id(self):
+        merged = merge_diff_messages(
+            self._diff_message("A-B", 1000, [[10, 1]], [], with_first_update_id=False),
+            self._diff_message("A-B", 2000, [[9, 1]], [], with_first_update_id=True))
+
+        self.assertFalse(merged.has_first_update_id)
+        self.assertEqual(2000, merged.update_id)
+
+    def test_unbounded_queue(self):
+        queue = BoundedMessageQueue()
+        for i in range(100):
+            queue.put_nowait(i)
+
+        self.assertFalse(queue.full())
+        self.assertEqual(100, queue.stats["depth"])
+        self.assertEqual(100, queue.max_depth)
+        self.assertEqual(0, queue.overflowed_messages)
+
+    def test_block_policy_waits_for_room(self):
+        queue = BoundedMessageQueue(max_size=2)
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        self.assertTrue(queue.full())
+
+        put_task = self.ev_loop.create_task(queue.put(3))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertFalse(put_task.done())
+
+        self.assertEqual(1, self.async_run_with_timeout(queue.get()))
+        self.async_run_with_timeout(put_task)
+        self.assertEqual(2, queue.qsize())
+
+        # Producers that can not wait go beyond the bound
+        queue.put_nowait(4)
+        self.assertEqual(3, queue.qsize())
+        self.assertEqual(1, queue.overflowed_messages)
+        self.assertEqual([2, 3, 4], [queue.get_nowait() for _ in range(3)])
+
+    def test_coalesce_policy_merges_diffs_of_same_trading_pair(self):
+        queue = BoundedMessageQueue(max_size=2, overflow_policy=QueueOverflowPolicy.COALESCE)
+        queue.put_nowait(self._diff_message("A-B", 1, [[10, 1]], []))
+        queue.put_nowait(self._diff_message("C-D", 2, [[20, 1]], []))
+
+        self.async_run_with_timeout(queue.put(self._diff_message("A-B", 3, [[10, 2], [9, 1]], [])))
+        queue.put_nowait(self._trade_message("A-B", 4))
+        queue.put_nowait(self._diff_message("E-F", 5, [[30, 1]], []))
+
+        self.assertEqual(1, queue.coalesced_messages)
+        self.assertEqual(2, queue.overflowed_messages)
+        merged = queue.get_nowait()
+        self.assertEqual(3, merged.update_id)
+        self.assertEqual([OrderBookRow(10, 2, 3), OrderBookRow(9, 1, 3)], merged.bids)
+        self.assertEqual(["C-D", "A-B", "E-F"], [queue.get_nowait().trading_pair for _ in range(3)])
+
+    def test_coalesce_policy_keeps_routing_time_of_tuples(self):
+        queue = BoundedMessageQueue(max_size=1, overflow_policy=QueueOverflowPolicy.COALESCE)
+        queue.put_nowait((100.0, self._diff_message("A-B", 1, [[10, 1]], [])))
+        queue.put_nowait((101.0, self._diff_message("A-B", 2, [[11, 1]], [])))
+
+        routing_time, merged = queue.get_nowait()
+        self.assertEqual(100.0, routing_time)
+        self.assertEqual(2, merged.update_id)
+        self.assertTrue(queue.empty())
+
+    def test_coalesce_policy_does_not_add_first_update_id_to_merged_diffs(self):
+        queue = BoundedMessageQueue(max_size=1, overflow_policy=QueueOverflowPolicy.COALESCE)
+        queue.put_nowait(self._diff_message("A-B", 1000, [[10, 1]], [], with_first_update_id=False))
+        queue.put_nowait(self._diff_message("A-B", 2000, [[11, 1]], [], with_first_update_id=False))
+
+        merged = queue.get_nowait()
+        self.assertEqual(1, queue.coalesced_messages)
+        self.assertFalse(merged.has_first_update_id)
+        self.assertEqual(2000, merged.first_update_id)
+        self.assertEqual(2000, merged.update_id)
+
+    def test_coalesce_policy_does_not_merge_diffs_across_a_snapshot(self):
+        queue = BoundedMessageQueue(max_size=2, overflow_policy=QueueOverflowPolicy.COALESCE)
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "A-B", "update_id": 5, "bids": [[1, 1]], "asks": []}, timestamp=5)
+        queue.put_nowait(self._diff_message("A-B", 1, [[2, 1]], []))
+        queue.put_nowait(snapshot)
+
+        queue.put_nowait(self._diff_message("A-B", 6, [[1, 0]], []))
+
+        self.assertEqual(0, queue.coalesced_messages)
+        self.assertEqual(1, queue.overflowed_messages)
+        self.assertEqual([1, 5, 6], [queue.get_nowait().update_id for _ in range(3)])
+
+    def test_drop_policy_drops_diffs_of_trading_pair(self):
+        queue = BoundedMessageQueue(max_size=3,
+                                    overflow_policy=QueueOverflowPolicy.DROP_AND_RESNAPSHOT,
+                                    on_drop=self.dropped_trading_pairs.append)
+        queue.put_nowait(self._diff_message("A-B", 1, [[10, 1]], []))
+        queue.put_nowait(self._trade_message("A-B", 2))
+        queue.put_nowait(self._diff_message("C-D", 3, [[20, 1]], []))
+
+        queue.put_nowait(self._diff_message("A-B", 4, [[10, 2]], []))
+
+        self.assertEqual(["A-B"], self.dropped_trading_pairs)
+        self.assertEqual(2, queue.dropped_messages)
+        self.assertEqual(2, queue.qsize())
+        self.assertEqual(OrderBookMessageType.TRADE, queue.get_nowait().type)
+        self.assertEqual("C-D", queue.get_nowait().trading_pair)
+
+    def test_drop_policy_drops_all_raw_messages(self):
+        queue = BoundedMessageQueue(max_size=2,
+                                    overflow_policy=QueueOverflowPolicy.DROP_AND_RESNAPSHOT,
+                                    on_drop=self.dropped_trading_pairs.append)
+        queue.put_nowait({"u": 1})
+        queue.put_nowait({"u": 2})
+
+        self.async_run_with_timeout(queue.put({"u": 3}))
+
+        self.assertEqual([None], self.dropped_trading_pairs)
+        self.assertEqual(3, queue.dropped_messages)
+        self.assertTrue(queue.empty())
+        self.assertEqual(2, queue.max_depth)
@@ -3,6 +3,10 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookBestPriceEvent, OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +54,243 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def _build_simple_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1], [7, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_get_price_for_volume(self):
+        order_book = self._build_simple_order_book()
+
+        result = order_book.get_price_for_volume(True, 1.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(1.5, result.result_volume)
+
+        result = order_book.get_price_for_volume(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_price_for_volume(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(4, result.result_volume)
+
+    def test_get_vwap_for_volume(self):
+        order_book = self._build_simple_order_book()
+
+        result = order_book.get_vwap_for_volume(True, 1.5)
+        self.assertAlmostEqual((4 + 5 * 0.5) / 1.5, result.result_price)
+        self.assertEqual(1.5, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(False, 2)
+        self.assertEqual(2.5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+
+    def test_get_price_for_quote_volume(self):
+        order_book = self._build_simple_order_book()
+
+        result = order_book.get_price_for_quote_volume(True, 9)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(9, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+    def test_get_quote_volume_for_base_amount(self):
+        order_book = self._build_simple_order_book()
+
+        self.assertEqual(6.5, order_book.get_quote_volume_for_base_amount(True, 1.5).result_volume)
+        self.assertEqual(5, order_book.get_quote_volume_for_base_amount(False, 2).result_volume)
+        self.assertEqual(22, order_book.get_quote_volume_for_base_amount(True, 10).result_volume)
+
+    def test_get_volume_for_price(self):
+        order_book = self._build_simple_order_book()
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(5, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 1)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+    def test_queries_on_empty_order_book(self):
+        order_book = OrderBook()
+
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 1).result_price))
+        self.assertTrue(np.isnan(order_book.get_vwap_for_volume(False, 1).result_price))
+        self.assertEqual(0, order_book.get_quote_volume_for_base_amount(True, 1).result_volume)
+
+    def _assert_same_query_results(self, expected: OrderBook, actual: OrderBook, volumes, prices):
+        for is_buy in (True, False):
+            for volume in volumes:
+                for query in ("get_price_for_volume",
+                              "get_vwap_for_volume",
+                              "get_price_for_quote_volume",
+                              "get_quote_volume_for_base_amount"):
+                    expected_result = getattr(expected, query)(is_buy, volume)
+                    actual_result = getattr(actual, query)(is_buy, volume)
+                    np.testing.assert_allclose(
+                        [expected_result.result_price, expected_result.result_volume],
+                        [actual_result.result_price, actual_result.result_volume],
+                        rtol=1e-9,
+                        err_msg=f"{query}(is_buy={is_buy}, volume={volume})")
+            for price in prices:
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    expected_result = getattr(expected, query)(is_buy, price)
+                    actual_result = getattr(actual, query)(is_buy, price)
+                    np.testing.assert_allclose(
+                        [expected_result.result_price, expected_result.result_volume],
+                        [actual_result.result_price, actual_result.result_volume],
+                        rtol=1e-9,
+                        err_msg=f"{query}(is_buy={is_buy}, price={price})")
+
+    def test_depth_index_matches_book_walk(self):
+        random = np.random.RandomState(42)
+        walked_book = OrderBook()
+        indexed_book = OrderBook(depth_index=True)
+        self.assertFalse(walked_book.depth_index_enabled)
+        self.assertTrue(indexed_book.depth_index_enabled)
+
+        prices = np.round(np.arange(90, 110, 0.25), 2)
+        bids = np.column_stack((prices[prices < 100], random.uniform(0.1, 2, len(prices[prices < 100])), np.ones(40)))
+        asks = np.column_stack((prices[prices > 100], random.uniform(0.1, 2, len(prices[prices > 100])), np.ones(39)))
+        for order_book in (walked_book, indexed_book):
+            order_book.apply_numpy_snapshot(bids, asks)
+        self._assert_same_query_results(walked_book, indexed_book, volumes=[0, 0.5, 3, 10, 45, 1000], prices=prices)
+
+        for update_id in range(2, 200):
+            # Diffs that update, insert and delete levels, some of them crossing the book.
+            bid_diffs = np.column_stack((random.choice(prices[prices < 102], 5),
+                                         random.choice([0, 0.5, 1, 3], 5),
+                                         np.full(5, update_id)))
+            ask_diffs = np.column_stack((random.choice(prices[prices > 98], 5),
+                                         random.choice([0, 0.5, 1, 3], 5),
+                                         np.full(5, update_id)))
+            for order_book in (walked_book, indexed_book):
+                order_book.apply_numpy_diffs(bid_diffs, ask_diffs)
+            if update_id % 20 == 0:
+                self._assert_same_query_results(walked_book, indexed_book, volumes=[0.5, 3, 10, 45], prices=prices)
+
+    def test_enable_depth_index_on_populated_book(self):
+        order_book = self._build_simple_order_book()
+        order_book.enable_depth_index()
+
+        self.assertTrue(order_book.depth_index_enabled)
+        self._assert_same_query_results(
+            self._build_simple_order_book(), order_book, volumes=[0.5, 1.5, 2, 10], prices=[1, 2.5, 5, 8]
+        )
+
+        order_book.apply_diffs([OrderBookRow(3.5, 1, 2)], [OrderBookRow(4, 0, 2)], 2)
+        self.assertEqual(3.5, order_book.get_price_for_volume(False, 1).result_price)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(3.25, order_book.get_vwap_for_volume(False, 2).result_price)
+
+    def test_snapshot_arrays(self):
+        order_book = self._build_simple_order_book()
+
+        bids, asks = order_book.snapshot_arrays()
+        np.testing.assert_array_equal([[3, 1, 1], [2, 1, 1], [1, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 1], [6, 1, 1], [7, 1, 1]], asks)
+
+        bids, asks = order_book.snapshot_arrays(2)
+        np.testing.assert_array_equal([[3, 1, 1], [2, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 1]], asks)
+
+        bids, asks = order_book.snapshot_arrays(0)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_snapshot_arrays_fills_caller_buffers(self):
+        order_book = self._build_simple_order_book()
+        bids_buffer = np.zeros((10, 3))
+        asks_buffer = np.zeros((10, 3))
+
+        bids, asks = order_book.snapshot_arrays(bids_array=bids_buffer, asks_array=asks_buffer)
+        self.assertTrue(np.shares_memory(bids, bids_buffer))
+        self.assertTrue(np.shares_memory(asks, asks_buffer))
+        np.testing.assert_array_equal([[3, 1, 1], [2, 1, 1], [1, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 1], [6, 1, 1], [7, 1, 1]], asks)
+
+        order_book.apply_diffs([OrderBookRow(3, 0, 2)], [OrderBookRow(4.5, 2, 2)], 2)
+        bids, asks = order_book.snapshot_arrays(2, bids_buffer, asks_buffer)
+        np.testing.assert_array_equal([[2, 1, 1], [1, 1, 1]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [4.5, 2, 2]], asks)
+
+    def test_snapshot_arrays_rejects_invalid_buffers(self):
+        order_book = self._build_simple_order_book()
+
+        with self.assertRaises(ValueError):
+            order_book.snapshot_arrays(5, np.zeros((4, 3)), np.zeros((5, 3)))
+        with self.assertRaises(ValueError):
+            order_book.snapshot_arrays(bids_array=np.zeros((4, 2)), asks_array=np.zeros((4, 3)))
+        with self.assertRaises(ValueError):
+            order_book.snapshot_arrays(bids_array=np.zeros((4, 3), dtype=np.float32), asks_array=np.zeros((4, 3)))
+        with self.assertRaises(ValueError):
+            order_book.snapshot_arrays(-1)
+
+    def test_apply_numpy_diffs_with_update_id(self):
+        order_book = self._build_simple_order_book()
+
+        order_book.apply_numpy_diffs(np.zeros((0, 3)), np.zeros((0, 3)), 7)
+        self.assertEqual(7, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.array([[3, 0, 8], [2.5, 2, 8]], dtype=np.float64), np.zeros((0, 3)))
+        self.assertEqual(8, order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(2.5, 2, 8), OrderBookRow(2, 1, 1), OrderBookRow(1, 1, 1)],
+                         list(order_book.bid_entries()))
+
+    def test_apply_messages_with_parsed_rows(self):
+        order_book = OrderBook()
+        snapshot = NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 10,
+            "bids": [["99", "1"], ["98", "2"]],
+            "asks": [["101", "1"]],
+        }, timestamp=1)
+        diff = NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 11,
+            "bids": [["99", "0"]],
+            "asks": [],
+        }, timestamp=2)
+
+        order_book.apply_snapshot_message(snapshot)
+        self.assertEqual(10, order_book.snapshot_uid)
+        order_book.apply_diff_message(diff)
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(98, 2, 10)], list(order_book.bid_entries()))
+
+        # Same result as the messages with string rows
+        other_order_book = OrderBook()
+        other_order_book.restore_from_snapshot_and_diffs(
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, snapshot.content, timestamp=1),
+            [OrderBookMessage(OrderBookMessageType.DIFF, {**diff.content, "bids": [["99", "0"]], "asks": []})])
+        self.assertEqual(list(other_order_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(other_order_book.ask_entries()), list(order_book.ask_entries()))
+
+    def test_best_price_update_event_fires_only_on_change(self):
+        order_book = self._build_simple_order_book()
+        logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.BestPriceUpdateEvent, logger)
+
+        order_book.apply_diffs([OrderBookRow(1, 3, 2)], [], 2)
+        self.assertEqual(0, len(logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(3, 0, 3)], [], 3)
+        order_book.apply_snapshot([OrderBookRow(2.5, 1, 4)], [OrderBookRow(3.5, 1, 4)], 4)
+        self.assertEqual([OrderBookBestPriceEvent(2, 4), OrderBookBestPriceEvent(2.5, 3.5)], logger.event_log)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -59,6 +61,28 @@ class OrderBookMessageTest(unittest.TestCase):
         )
         self.assertEqual(-1, msg.first_update_id)
 
+    def test_has_first_update_id(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 2, "first_update_id": 1},
+            timestamp=time.time(),
+        )
+        self.assertTrue(msg.has_first_update_id)
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 2},
+            timestamp=time.time(),
+        )
+        self.assertFalse(msg.has_first_update_id)
+
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"update_id": 2, "first_update_id": 1},
+            timestamp=time.time(),
+        )
+        self.assertFalse(msg.has_first_update_id)
+
     def test_trade_id(self):
         trade_id = "someTradeId"
 
@@ -248,3 +272,18 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_numpy_message_parses_rows_once(self):
+        raw_bids = [["10.5", "1", "100"], ["10.4", "0", "101"]]
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": "COINALPHA-HBOT", "update_id": 5, "bids": raw_bids, "asks": []},
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal([[10.5, 1, 5], [10.4, 0, 5]], msg.bids_array)
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertEqual([OrderBookRow(10.5, 1, 5), OrderBookRow(10.4, 0, 5)], msg.bids)
+        self.assertEqual([], msg.asks)
+        # The raw rows are left untouched
+        self.assertEqual(["10.5", "1", "100"], raw_bids[0])
@@ -0,0 +1,430 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.bounded_message_queue import QueueOverflowPolicy
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_gather
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MagicMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair],
+                                        coalesce_diffs=True, detect_sequence_gaps=True)
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot(
+            [OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1)], [OrderBookRow(101, 1, 1), OrderBookRow(102, 1, 1)], 1)
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _diff_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    def _sequenced_diff_message(self,
+                                first_update_id: int,
+                                update_id: int,
+                                bids: List[List[float]],
+                                asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": first_update_id,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    def _snapshot_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    def test_coalesced_diffs_last_write_wins(self):
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self._diff_message(3, [[99, 5]], [[101, 0]]))
+        queue.put_nowait(self._diff_message(4, [[99, 2], [97, 1]], [[103, 1]]))
+
+        merged_messages, deferred_message = self.tracker._apply_coalesced_diffs(
+            self.trading_pair, self._diff_message(2, [[99, 3], [98, 0]], [[101, 4]]))
+
+        self.assertEqual(3, merged_messages)
+        self.assertIsNone(deferred_message)
+        self.assertEqual(4, self.order_book.last_diff_uid)
+        self.assertEqual([OrderBookRow(99, 2, 4), OrderBookRow(97, 1, 4)], list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(102, 1, 1), OrderBookRow(103, 1, 4)], list(self.order_book.ask_entries()))
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+        stats = self.tracker.diff_coalescing_stats[self.trading_pair]
+        self.assertEqual(1, stats.applies)
+        self.assertEqual(3, stats.merged_messages)
+        self.assertEqual(3, stats.last_merged_messages)
+        self.assertEqual(3, stats.max_merged_messages)
+        self.assertEqual(3, stats.average_merged_messages)
+
+    def test_coalescing_stops_at_snapshot_message(self):
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        snapshot_message = self._snapshot_message(5, [[90, 1]], [[110, 1]])
+        queue.put_nowait(self._diff_message(3, [[99, 5]], []))
+        queue.put_nowait(snapshot_message)
+        queue.put_nowait(self._diff_message(6, [[91, 5]], []))
+
+        merged_messages, deferred_message = self.tracker._apply_coalesced_diffs(
+            self.trading_pair, self._diff_message(2, [[99, 3]], []))
+
+        self.assertEqual(2, merged_messages)
+        self.assertIs(snapshot_message, deferred_message)
+        self.assertEqual(1, queue.qsize())
+        self.assertEqual([OrderBookRow(99, 5, 3), OrderBookRow(98, 1, 1)], list(self.order_book.bid_entries()))
+
+    def test_track_single_book_coalesces_waiting_diffs(self):
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        self.tracker._saved_message_queues[self.trading_pair].append(self._diff_message(2, [[99, 3]], []))
+        queue.put_nowait(self._diff_message(3, [[99, 4]], []))
+        queue.put_nowait(self._snapshot_message(4, [[95, 1]], [[105, 1]]))
+        queue.put_nowait(self._diff_message(5, [[96, 1]], []))
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(asyncio.sleep(10), timeout=0.1)
+
+        # The diffs in the past diffs window are replayed on top of the snapshot
+        self.assertEqual([OrderBookRow(99, 4, 3), OrderBookRow(96, 1, 5), OrderBookRow(95, 1, 4)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(105, 1, 4)], list(self.order_book.ask_entries()))
+        stats = self.tracker.diff_coalescing_stats[self.trading_pair]
+        self.assertEqual(2, stats.applies)
+        self.assertEqual(3, stats.merged_messages)
+        self.assertEqual(2, stats.max_merged_messages)
+
+    def test_track_single_book_without_coalescing(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        tracker._tracking_message_queues[self.trading_pair].put_nowait(self._diff_message(2, [[99, 3]], []))
+        tracker._tracking_message_queues[self.trading_pair].put_nowait(self._diff_message(3, [[99, 0]], []))
+
+        self.tracking_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(asyncio.sleep(10), timeout=0.1)
+
+        self.assertFalse(tracker.coalesce_diffs)
+        self.assertEqual([OrderBookRow(98, 1, 1)], list(self.order_book.bid_entries()))
+        self.assertEqual(3, self.order_book.last_diff_uid)
+        self.assertEqual(0, len(tracker.diff_coalescing_stats))
+
+    def test_init_order_books_fetches_snapshots_concurrently(self):
+        trading_pairs = ["A-HBOT", "B-HBOT", "C-HBOT"]
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=trading_pairs)
+        snapshot_requests = {trading_pair: asyncio.Event() for trading_pair in trading_pairs}
+        requested = []
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            requested.append(trading_pair)
+            await snapshot_requests[trading_pair].wait()
+            return OrderBook()
+
+        self.data_source.get_new_order_book.side_effect = get_new_order_book
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(trading_pairs, requested)
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+        # The order books are ready one by one, in the order their snapshots arrive
+        snapshot_requests["B-HBOT"].set()
+        self.async_run_with_timeout(tracker.wait_order_book_ready("B-HBOT"))
+        self.assertEqual(["B-HBOT"], tracker.ready_trading_pairs)
+        self.assertTrue(tracker.is_order_book_ready("B-HBOT"))
+        self.assertFalse(tracker.is_order_book_ready("A-HBOT"))
+        self.assertIn("B-HBOT", tracker._tracking_tasks)
+        self.assertFalse(tracker.ready)
+
+        snapshot_requests["A-HBOT"].set()
+        snapshot_requests["C-HBOT"].set()
+        self.async_run_with_timeout(init_task)
+        self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        self.assertTrue(tracker.ready)
+
+        tracker.stop()
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    def test_init_order_books_retries_failed_snapshot(self, sleep_mock):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.data_source.get_new_order_book = AsyncMock(side_effect=[IOError("Test error"), self.order_book])
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertIs(self.order_book, tracker.order_books[self.trading_pair])
+        self.assertTrue(tracker.ready)
+        sleep_mock.assert_awaited_once_with(delay=tracker.INIT_ORDER_BOOK_RETRY_DELAY)
+        tracker.stop()
+
+    def test_shard_router_assigns_trading_pairs_to_shards(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=["A-HBOT", "B-HBOT", "C-HBOT"],
+                                   dispatcher_shards=2)
+        router = tracker._shard_router
+
+        self.assertEqual(0, router.shard_for("A-HBOT"))
+        self.assertEqual(1, router.shard_for("B-HBOT"))
+        self.assertEqual(0, router.shard_for("C-HBOT"))
+        # Trading pairs added later are assigned too, always to the same shard
+        self.assertEqual(1, router.shard_for("D-HBOT"))
+        self.assertEqual(1, router.shard_for("D-HBOT"))
+
+        router.put_nowait(self._diff_message(2, [[99, 3]], []))
+        self.assertEqual(1, router.qsize())
+        self.assertEqual(1, tracker._shard_queues[1].qsize() + tracker._shard_queues[0].qsize())
+
+    def test_dispatcher_applies_messages_of_its_shard(self):
+        other_pair = "OTHER-HBOT"
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=[self.trading_pair, other_pair],
+                                   dispatcher_shards=2)
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._order_book_ready_events[self.trading_pair].set()
+        router = tracker._shard_router
+        router.put_nowait(self._diff_message(2, [[99, 3]], []))
+        router.put_nowait(self._diff_message(3, [[97, 1]], [[101, 0]]))
+        # Messages older than the snapshot are discarded
+        router.put_nowait(self._diff_message(0, [[90, 1]], []))
+        # Messages for pairs still bootstrapping are saved for later
+        router.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": other_pair, "update_id": 2, "bids": [[10, 1]], "asks": []}, timestamp=2))
+
+        self.tracking_task = self.ev_loop.create_task(safe_gather(
+            tracker._dispatch_shard_messages(0), tracker._dispatch_shard_messages(1)))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual([OrderBookRow(99, 3, 2), OrderBookRow(98, 1, 1), OrderBookRow(97, 1, 3)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(102, 1, 1)], list(self.order_book.ask_entries()))
+        self.assertEqual(1, len(tracker._saved_message_queues[other_pair]))
+
+        shard_stats = tracker.shard_stats
+        self.assertEqual(3, shard_stats[0].processed_messages)
+        self.assertEqual(0, shard_stats[1].processed_messages)
+        self.assertEqual(0, shard_stats[0].pending_messages)
+        self.assertGreater(shard_stats[0].max_latency, 0)
+        self.assertGreaterEqual(shard_stats[0].max_latency, shard_stats[0].average_latency)
+
+        # Once the order book is built, the saved messages are applied
+        other_order_book = OrderBook()
+        self.data_source.get_new_order_book = AsyncMock(return_value=other_order_book)
+        self.async_run_with_timeout(tracker._init_order_book(other_pair))
+        self.assertEqual([OrderBookRow(10, 1, 2)], list(other_order_book.bid_entries()))
+        self.assertTrue(tracker.is_order_book_ready(other_pair))
+        self.assertEqual(0, len(tracker._tracking_tasks))
+
+    def test_dropped_diffs_trigger_resnapshot_of_trading_pair(self):
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source,
+                                   trading_pairs=[self.trading_pair],
+                                   queue_max_size=2,
+                                   queue_overflow_policy=QueueOverflowPolicy.DROP_AND_RESNAPSHOT)
+        data_source.configure_message_queues.assert_called_once_with(
+            max_size=2, overflow_policy=QueueOverflowPolicy.DROP_AND_RESNAPSHOT, on_drop=tracker._on_messages_dropped)
+        tracker._order_books[self.trading_pair] = self.order_book
+        snapshot_message = self._snapshot_message(10, [[95, 1]], [[105, 1]])
+
+        async def request_order_book_snapshot(trading_pair: str, output: asyncio.Queue):
+            output.put_nowait(snapshot_message)
+
+        data_source.request_order_book_snapshot.side_effect = request_order_book_snapshot
+
+        diff_stream = tracker._order_book_diff_stream
+        diff_stream.put_nowait(self._diff_message(2, [[99, 3]], []))
+        diff_stream.put_nowait(self._diff_message(3, [[99, 4]], []))
+        diff_stream.put_nowait(self._diff_message(4, [[99, 5]], []))
+        # Requests for the same trading pair are not duplicated while one is in flight
+        tracker._on_messages_dropped(None)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertTrue(diff_stream.empty())
+        self.assertEqual(3, diff_stream.dropped_messages)
+        data_source.request_order_book_snapshot.assert_called_once_with(
+            trading_pair=self.trading_pair, output=tracker._order_book_snapshot_stream)
+        self.assertIs(snapshot_message, tracker._order_book_snapshot_stream.get_nowait())
+        self.assertEqual(0, len(tracker._resnapshot_tasks))
+        self.assertEqual([self.trading_pair], tracker.resyncing_trading_pairs)
+
+    def test_queue_stats_and_order_book_lags(self):
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        self.tracker._order_book_diff_stream.put_nowait(self._diff_message(2, [], []))
+        queue.put_nowait(self._diff_message(2, [[99, 3]], []))
+
+        queue_stats = self.tracker.queue_stats
+        self.assertEqual(1, queue_stats["order_book_diff_stream"]["depth"])
+        self.assertEqual(1, queue_stats["order_book_diff_stream"]["max_depth"])
+        self.assertEqual(0, queue_stats["order_book_trade_stream"]["depth"])
+        self.assertEqual({"depth": 1}, queue_stats[self.trading_pair])
+
+        self.tracker._apply_coalesced_diffs(self.trading_pair, queue.get_nowait())
+        lag = self.tracker.order_book_lags[self.trading_pair]
+        # The message timestamp is 2 seconds after the epoch
+        self.assertGreater(lag, 1_000_000_000)
+
+    def test_sequence_gap_resyncs_trading_pair(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=[self.trading_pair],
+                                   detect_sequence_gaps=True)
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._last_update_ids[self.trading_pair] = self.order_book.snapshot_uid
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        snapshot_message = self._snapshot_message(6, [[95, 1]], [[105, 1]])
+
+        async def request_order_book_snapshot(trading_pair: str, output: asyncio.Queue):
+            output.put_nowait(snapshot_message)
+
+        self.data_source.request_order_book_snapshot = AsyncMock(side_effect=request_order_book_snapshot)
+
+        queue.put_nowait(self._sequenced_diff_message(2, 3, [[99, 3]], []))
+        # Updates 4 and 5 are missing
+        queue.put_nowait(self._sequenced_diff_message(6, 7, [[96, 1]], []))
+        queue.put_nowait(self._sequenced_diff_message(8, 8, [[97, 1]], []))
+
+        self.tracking_task = self.ev_loop.create_task(safe_gather(
+            tracker._track_single_book(self.trading_pair), tracker._order_book_snapshot_router()))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.data_source.request_order_book_snapshot.assert_called_once_with(
+            trading_pair=self.trading_pair, output=tracker._order_book_snapshot_stream)
+        self.data_source.add_sequence_checked_trading_pair.assert_called_once_with(self.trading_pair)
+        self.assertEqual(1, tracker.sequence_gaps[self.trading_pair])
+        self.assertEqual([], tracker.resyncing_trading_pairs)
+        # The buffered diffs newer than the snapshot are replayed on top of it
+        self.assertEqual([OrderBookRow(97, 1, 8), OrderBookRow(96, 1, 7), OrderBookRow(95, 1, 6)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual(8, tracker._last_update_ids[self.trading_pair])
+
+        # Diffs continuing the sequence are applied right away
+        queue.put_nowait(self._sequenced_diff_message(9, 9, [[97, 0]], []))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual([OrderBookRow(96, 1, 7), OrderBookRow(95, 1, 6)], list(self.order_book.bid_entries()))
+        self.assertEqual(1, tracker.sequence_gaps[self.trading_pair])
+
+    def test_resync_requests_new_snapshot_when_buffered_diffs_do_not_continue_it(self):
+        self.tracker._last_update_ids[self.trading_pair] = 1
+
+        merged_messages, _ = self.tracker._apply_coalesced_diffs(
+            self.trading_pair, self._sequenced_diff_message(5, 6, [[99, 3]], []))
+
+        self.assertEqual(0, merged_messages)
+        self.assertEqual([self.trading_pair], self.tracker.resyncing_trading_pairs)
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1)], list(self.order_book.bid_entries()))
+        self.assertEqual(0, self.tracker.diff_coalescing_stats[self.trading_pair].applies)
+
+        # The snapshot is older than the first buffered diff
+        self.tracker._restore_order_book(self.trading_pair, self._snapshot_message(3, [[95, 1]], [[105, 1]]))
+        self.assertEqual([self.trading_pair], self.tracker.resyncing_trading_pairs)
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1)], list(self.order_book.bid_entries()))
+
+        self.tracker._restore_order_book(self.trading_pair, self._snapshot_message(4, [[95, 1]], [[105, 1]]))
+        self.assertEqual([], self.tracker.resyncing_trading_pairs)
+        self.assertEqual([OrderBookRow(99, 3, 6), OrderBookRow(95, 1, 4)], list(self.order_book.bid_entries()))
+        self.assertEqual(6, self.tracker._last_update_ids[self.trading_pair])
+
+    def test_diffs_without_first_update_id_are_not_checked(self):
+        self.tracker._last_update_ids[self.trading_pair] = 1
+
+        merged_messages, _ = self.tracker._apply_coalesced_diffs(
+            self.trading_pair, self._diff_message(10, [[99, 3]], []))
+
+        self.assertEqual(1, merged_messages)
+        self.assertEqual([], self.tracker.resyncing_trading_pairs)
+        self.assertEqual(0, self.tracker.sequence_gaps[self.trading_pair])
+        self.data_source.add_sequence_checked_trading_pair.assert_not_called()
+
+    def test_sequence_gaps_are_not_detected_by_default(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._last_update_ids[self.trading_pair] = 1
+
+        self.assertFalse(tracker.detect_sequence_gaps)
+        self.assertTrue(tracker._accept_diff(self.trading_pair, self._sequenced_diff_message(5, 6, [[99, 3]], [])))
+        self.assertEqual([], tracker.resyncing_trading_pairs)
+
+    def test_coalesced_queue_diffs_without_first_update_id_do_not_resync(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=[self.trading_pair],
+                                   queue_max_size=1,
+                                   queue_overflow_policy=QueueOverflowPolicy.COALESCE,
+                                   detect_sequence_gaps=True)
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._tracking_message_queues[self.trading_pair] = tracker._create_message_queue()
+        tracker._last_update_ids[self.trading_pair] = 900
+
+        diff_stream = tracker._order_book_diff_stream
+        diff_stream.put_nowait(self._diff_message(1000, [[99, 3]], []))
+        diff_stream.put_nowait(self._diff_message(2000, [[97, 1]], []))
+        self.assertEqual(1, diff_stream.coalesced_messages)
+
+        self.tracking_task = self.ev_loop.create_task(safe_gather(
+            tracker._order_book_diff_router(), tracker._track_single_book(self.trading_pair)))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual([], tracker.resyncing_trading_pairs)
+        self.assertEqual(0, tracker.sequence_gaps[self.trading_pair])
+        self.data_source.request_order_book_snapshot.assert_not_called()
+        self.assertEqual([OrderBookRow(99, 3, 2000), OrderBookRow(98, 1, 1), OrderBookRow(97, 1, 2000)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual(2000, tracker._last_update_ids[self.trading_pair])
+
+    def test_diff_router_records_trading_pair_messages(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        tracker._order_book_diff_stream.put_nowait(self._diff_message(2, [[99, 3]], []))
+
+        self.tracking_task = self.ev_loop.create_task(tracker._order_book_diff_router())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.data_source.record_trading_pair_message.assert_called_once_with(self.trading_pair)
+
+    def test_dispatcher_records_trading_pair_diff_messages(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=[self.trading_pair],
+                                   dispatcher_shards=1)
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._order_book_ready_events[self.trading_pair].set()
+        router = tracker._shard_router
+        router.put_nowait(self._diff_message(2, [[99, 3]], []))
+        router.put_nowait(self._diff_message(3, [[97, 1]], []))
+        router.put_nowait(self._snapshot_message(4, [[95, 1]], [[105, 1]]))
+
+        self.tracking_task = self.ev_loop.create_task(tracker._dispatch_shard_messages(0))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(3, tracker.shard_stats[0].processed_messages)
+        self.assertEqual(2, self.data_source.record_trading_pair_message.call_count)
+        self.data_source.record_trading_pair_message.assert_called_with(self.trading_pair)
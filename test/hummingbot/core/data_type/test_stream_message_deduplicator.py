@@ -0,0 +1,37 @@
+import unittest
+
+from hummingbot.core.data_type.stream_message_deduplicator import StreamMessageDeduplicator
+
+
+class StreamMessageDeduplicatorTests(unittest.TestCase):
+
+    def test_accepts_each_sequence_once_and_in_order(self):
+        deduplicator = StreamMessageDeduplicator()
+
+        self.assertTrue(deduplicator.accept_sequence(stream="COINALPHA-HBOT", sequence=10))
+        self.assertFalse(deduplicator.accept_sequence(stream="COINALPHA-HBOT", sequence=10))
+        self.assertTrue(deduplicator.accept_sequence(stream="COINALPHA-HBOT", sequence=12))
+        # A lagging connection can not send the stream back
+        self.assertFalse(deduplicator.accept_sequence(stream="COINALPHA-HBOT", sequence=11))
+
+    def test_streams_are_independent(self):
+        deduplicator = StreamMessageDeduplicator()
+
+        self.assertTrue(deduplicator.accept_sequence(stream="COINALPHA-HBOT", sequence=10))
+        self.assertTrue(deduplicator.accept_sequence(stream="WETH-HBOT", sequence=5))
+
+    def test_accepts_each_key_once(self):
+        deduplicator = StreamMessageDeduplicator()
+
+        self.assertTrue(deduplicator.accept_key(("executionReport", 1, "NEW")))
+        self.assertFalse(deduplicator.accept_key(("executionReport", 1, "NEW")))
+        self.assertTrue(deduplicator.accept_key(("executionReport", 1, "TRADE")))
+
+    def test_only_the_last_keys_are_remembered(self):
+        deduplicator = StreamMessageDeduplicator(max_keys=2)
+
+        for key in ("first", "second", "third"):
+            self.assertTrue(deduplicator.accept_key(key))
+
+        self.assertTrue(deduplicator.accept_key("first"))
+        self.assertFalse(deduplicator.accept_key("third"))
@@ -0,0 +1,51 @@
+import unittest
+
+from hummingbot.core.data_type.subscription_shards import balanced_subscription_shards, subscription_shards_count
+
+
+class SubscriptionShardsTest(unittest.TestCase):
+
+    def test_shards_count_is_raised_to_fit_the_trading_pairs_per_connection_limit(self):
+        self.assertEqual(3, subscription_shards_count(
+            trading_pairs_count=250, connections=1, max_trading_pairs_per_connection=100))
+        self.assertEqual(4, subscription_shards_count(
+            trading_pairs_count=250, connections=4, max_trading_pairs_per_connection=100))
+        self.assertEqual(4, subscription_shards_count(
+            trading_pairs_count=250, connections=4, max_trading_pairs_per_connection=0))
+
+    def test_shards_count_never_exceeds_the_trading_pairs(self):
+        self.assertEqual(2, subscription_shards_count(
+            trading_pairs_count=2, connections=5, max_trading_pairs_per_connection=0))
+        self.assertEqual(1, subscription_shards_count(
+            trading_pairs_count=0, connections=5, max_trading_pairs_per_connection=0))
+
+    def test_shards_without_message_counts_get_the_same_number_of_trading_pairs(self):
+        shards = balanced_subscription_shards(trading_pairs=["A-USDT", "B-USDT", "C-USDT", "D-USDT", "E-USDT"],
+                                              shards_count=2)
+
+        self.assertEqual([["A-USDT", "C-USDT", "E-USDT"], ["B-USDT", "D-USDT"]], shards)
+
+    def test_busiest_trading_pairs_are_spread_across_the_shards(self):
+        message_counts = {"A-USDT": 100, "B-USDT": 90, "C-USDT": 10, "D-USDT": 5}
+
+        shards = balanced_subscription_shards(trading_pairs=["A-USDT", "B-USDT", "C-USDT", "D-USDT"],
+                                              shards_count=2,
+                                              message_counts=message_counts)
+
+        self.assertEqual([["A-USDT", "D-USDT"], ["B-USDT", "C-USDT"]], shards)
+
+    def test_shards_respect_the_trading_pairs_per_shard_limit(self):
+        message_counts = {"A-USDT": 100, "B-USDT": 1, "C-USDT": 1, "D-USDT": 1}
+
+        shards = balanced_subscription_shards(trading_pairs=["A-USDT", "B-USDT", "C-USDT", "D-USDT"],
+                                              shards_count=2,
+                                              max_trading_pairs_per_shard=2,
+                                              message_counts=message_counts)
+
+        self.assertEqual([["A-USDT", "D-USDT"], ["B-USDT", "C-USDT"]], shards)
+
+    def test_trading_pairs_that_do_not_fit_in_the_shards_raise_error(self):
+        with self.assertRaises(ValueError):
+            balanced_subscription_shards(trading_pairs=["A-USDT", "B-USDT", "C-USDT"],
+                                         shards_count=1,
+                                         max_trading_pairs_per_shard=2)
@@ -0,0 +1,210 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.tick_order_book import TickOrderBook
+
+
+class TickOrderBookTests(unittest.TestCase):
+
+    def _assert_same_book(self, expected: OrderBook, actual: TickOrderBook):
+        # The depth index sums the levels in a different order than the walks, the results can differ by rounding
+        assert_same_results = (np.testing.assert_allclose
+                               if expected.depth_index_enabled != actual.depth_index_enabled
+                               else np.testing.assert_array_equal)
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+            for volume in (0.5, 3, 20, 1000):
+                for query in ("get_price_for_volume",
+                              "get_vwap_for_volume",
+                              "get_price_for_quote_volume",
+                              "get_quote_volume_for_base_amount"):
+                    expected_result = getattr(expected, query)(is_buy, volume)
+                    actual_result = getattr(actual, query)(is_buy, volume)
+                    assert_same_results(
+                        [expected_result.result_price, expected_result.result_volume],
+                        [actual_result.result_price, actual_result.result_volume])
+            for price in (95.5, 99.9, 100.1, 104.5):
+                for query in ("get_volume_for_price", "get_quote_volume_for_price"):
+                    expected_result = getattr(expected, query)(is_buy, price)
+                    actual_result = getattr(actual, query)(is_buy, price)
+                    assert_same_results(
+                        [expected_result.result_price, expected_result.result_volume],
+                        [actual_result.result_price, actual_result.result_volume])
+
+    def test_infers_tick_size_from_snapshot(self):
+        order_book = TickOrderBook()
+        order_book.apply_snapshot(
+            bids=[OrderBookRow(99.5, 1, 1), OrderBookRow(99.75, 2, 1)],
+            asks=[OrderBookRow(100.25, 1, 1), OrderBookRow(101, 3, 1)],
+            update_id=1)
+
+        self.assertEqual(0.01, order_book.tick_size)
+        self.assertEqual(99.75, order_book.get_price(False))
+        self.assertEqual(100.25, order_book.get_price(True))
+
+    def test_regrids_when_a_finer_price_arrives(self):
+        order_book = TickOrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.assertEqual(1, order_book.tick_size)
+
+        order_book.apply_diffs([OrderBookRow(99.001, 2, 2)], [OrderBookRow(100.5, 1, 2)], 2)
+
+        self.assertEqual(0.001, order_book.tick_size)
+        self.assertEqual([OrderBookRow(99.001, 2, 2), OrderBookRow(99, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(100.5, 1, 2), OrderBookRow(101, 1, 1)], list(order_book.ask_entries()))
+
+    def test_empty_book_raises_on_get_price(self):
+        order_book = TickOrderBook(tick_size=0.01)
+
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(False, 1).result_price))
+
+    def test_matches_set_order_book_on_random_diffs(self):
+        random = np.random.RandomState(7)
+        set_book = OrderBook()
+        tick_book = TickOrderBook(tick_size=0.1)
+        prices = np.round(np.arange(95, 105, 0.1), 1)
+        bids = [OrderBookRow(price, 1, 1) for price in prices if price < 100]
+        asks = [OrderBookRow(price, 1, 1) for price in prices if price > 100]
+        set_book.apply_snapshot(bids, asks, 1)
+        tick_book.apply_snapshot(bids, asks, 1)
+        self._assert_same_book(set_book, tick_book)
+
+        for update_id in range(2, 500):
+            # Updates, insertions and deletions around the mid price, some of them crossing the book.
+            bid_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices < 101], 4), random.choice([0, 1, 2], 4))]
+            ask_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices > 99], 4), random.choice([0, 1, 2], 4))]
+            set_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+            tick_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+            self.assertEqual(set_book.last_diff_uid, tick_book.last_diff_uid)
+            if update_id % 50 == 0:
+                self._assert_same_book(set_book, tick_book)
+        self.assertEqual(0, tick_book.overflow_levels)
+
+    def test_depth_index_matches_set_order_book_on_random_diffs(self):
+        random = np.random.RandomState(11)
+        set_book = OrderBook()
+        tick_book = TickOrderBook(tick_size=0.1, depth_index=True)
+        prices = np.round(np.arange(95, 105, 0.1), 1)
+        bids = [OrderBookRow(price, 1, 1) for price in prices if price < 100]
+        asks = [OrderBookRow(price, 1, 1) for price in prices if price > 100]
+        set_book.apply_snapshot(bids, asks, 1)
+        tick_book.apply_snapshot(bids, asks, 1)
+        self.assertTrue(tick_book.depth_index_enabled)
+        self._assert_same_book(set_book, tick_book)
+
+        for update_id in range(2, 300):
+            bid_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices < 101], 4), random.choice([0, 1, 2], 4))]
+            ask_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices > 99], 4), random.choice([0, 1, 2], 4))]
+            set_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+            tick_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+            if update_id % 30 == 0:
+                self._assert_same_book(set_book, tick_book)
+
+    def test_depth_index_follows_the_window_and_regrids(self):
+        walked_book = TickOrderBook(tick_size=1, window_ticks=16)
+        indexed_book = TickOrderBook(tick_size=1, window_ticks=16)
+        for order_book in (walked_book, indexed_book):
+            order_book.apply_snapshot([OrderBookRow(90, 1, 1), OrderBookRow(80, 2, 1)],
+                                      [OrderBookRow(100, 1, 1), OrderBookRow(110, 1, 1)],
+                                      1)
+        indexed_book.enable_depth_index()
+        self._assert_same_book(walked_book, indexed_book)
+
+        for bids, asks, update_id in (([], [OrderBookRow(130, 1, 2)], 2),
+                                      ([OrderBookRow(99, 1, 3)], [], 3),
+                                      ([OrderBookRow(99.5, 3, 4)], [], 4),
+                                      ([OrderBookRow(99, 0, 5)], [OrderBookRow(100.3, 2, 5)], 5)):
+            walked_book.apply_diffs(bids, asks, update_id)
+            indexed_book.apply_diffs(bids, asks, update_id)
+            self._assert_same_book(walked_book, indexed_book)
+        self.assertEqual(walked_book.overflow_levels, indexed_book.overflow_levels)
+        self.assertEqual(0.1, indexed_book.tick_size)
+
+    def test_window_slides_with_best_price(self):
+        order_book = TickOrderBook(tick_size=1, window_ticks=16)
+        order_book.apply_snapshot([OrderBookRow(90, 1, 1)], [OrderBookRow(100, 1, 1), OrderBookRow(110, 1, 1)], 1)
+        self.assertEqual(0, order_book.overflow_levels)
+
+        # Deeper than the 16 ticks window, the level is kept in the overflow
+        order_book.apply_diffs([], [OrderBookRow(130, 1, 2)], 2)
+        self.assertEqual(1, order_book.overflow_levels)
+        self.assertEqual([100, 110, 130], [row.price for row in order_book.ask_entries()])
+
+        # The asks move up, the window follows them and takes the overflow level back
+        order_book.apply_diffs([], [OrderBookRow(100, 0, 3), OrderBookRow(120, 1, 3), OrderBookRow(122, 1, 3)], 3)
+        order_book.apply_diffs([], [OrderBookRow(110, 0, 4), OrderBookRow(130, 2, 4)], 4)
+        self.assertEqual([(120, 1), (122, 1), (130, 2)],
+                         [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(0, order_book.overflow_levels)
+
+        # A much better bid pushes the deepest bids out of the window
+        order_book.apply_diffs([OrderBookRow(115, 1, 5)], [], 5)
+        self.assertEqual([115, 90], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(1, order_book.overflow_levels)
+
+        # Once the window is empty it moves to the overflow levels
+        order_book.apply_diffs([OrderBookRow(115, 0, 6)], [], 6)
+        self.assertEqual([90], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(90, order_book.get_price(False))
+        self.assertEqual(0, order_book.overflow_levels)
+
+    def test_matches_set_order_book_with_levels_outside_of_the_window(self):
+        random = np.random.RandomState(3)
+        set_book = OrderBook()
+        tick_book = TickOrderBook(tick_size=0.1, window_ticks=16, depth_index=True)
+        walked_book = TickOrderBook(tick_size=0.1, window_ticks=16)
+        prices = np.round(np.arange(95, 105, 0.1), 1)
+        bids = [OrderBookRow(price, 1, 1) for price in prices if price < 100]
+        asks = [OrderBookRow(price, 1, 1) for price in prices if price > 100]
+        for order_book in (set_book, tick_book, walked_book):
+            order_book.apply_snapshot(bids, asks, 1)
+        self.assertGreater(walked_book.overflow_levels, 0)
+
+        for update_id in range(2, 500):
+            # Wide moves of the best prices, for the windows to slide both ways over the overflow levels
+            bid_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices < 102], 4), random.choice([0, 1, 2], 4))]
+            ask_diffs = [OrderBookRow(price, amount, update_id)
+                         for price, amount in zip(random.choice(prices[prices > 98], 4), random.choice([0, 1, 2], 4))]
+            for order_book in (set_book, tick_book, walked_book):
+                order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+            if update_id % 25 == 0:
+                self._assert_same_book(set_book, walked_book)
+                self._assert_same_book(set_book, tick_book)
+
+    def test_off_grid_price_does_not_lose_levels(self):
+        set_book = OrderBook()
+        tick_book = TickOrderBook()
+        bids = [OrderBookRow(100 - 0.5 * i, 1, 1) for i in range(20)] + [OrderBookRow(99.1234567, 1, 1)]
+        asks = [OrderBookRow(100.5 + 0.5 * i, 1, 1) for i in range(20)]
+        set_book.apply_snapshot(bids, asks, 1)
+        tick_book.apply_snapshot(bids, asks, 1)
+
+        self.assertAlmostEqual(1e-7, tick_book.tick_size)
+        self.assertEqual(39, tick_book.overflow_levels)
+        self._assert_same_book(set_book, tick_book)
+
+    def test_snapshot_data_frames(self):
+        order_book = TickOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2]], dtype=np.float64),
+                                        np.array([[3, 1, 1], [4, 1, 2]], dtype=np.float64))
+
+        bids, asks = order_book.snapshot
+
+        self.assertEqual([2., 1., 2.], bids.iloc[0].tolist())
+        self.assertEqual([3., 1., 1.], asks.iloc[0].tolist())
+
+        bids, asks = order_book.snapshot_arrays(1)
+        np.testing.assert_array_equal([[2, 1, 2]], bids)
+        np.testing.assert_array_equal([[3, 1, 1]], asks)
@@ -7,9 +7,35 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.pubsub import PubSub
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(TimeIterator):
+    """
+    c_tick() does not call into Python subclasses, the ticks are recorded by watching the current timestamp instead.
+    """
+    def __init__(self):
+        super().__init__()
+        self.tick_times = []
+
+    async def record(self, duration: float):
+        last_timestamp = self.current_timestamp
+        end = time.time() + duration
+        while time.time() < end:
+            if self.current_timestamp != last_timestamp:
+                last_timestamp = self.current_timestamp
+                self.tick_times.append(last_timestamp)
+            await asyncio.sleep(0.005)
+
+
+class ReadyPublisher(PubSub):
+    def __init__(self):
+        super().__init__()
+        self.ready = False
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +150,126 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_event_driven_clock_ticks_on_request(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.05)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        publisher = PubSub()
+        clock.add_tick_trigger(publisher, MarketEvent.OrderFilled)
+
+        async def trigger_ticks():
+            await asyncio.sleep(0.1)
+            publisher.trigger_event(MarketEvent.OrderFilled, None)
+            await asyncio.sleep(0.1)
+            # A burst of requests is merged into a single tick
+            for _ in range(5):
+                publisher.trigger_event(MarketEvent.OrderFilled, None)
+            await asyncio.sleep(0.1)
+
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(
+                clock.run_til(time.time() + 0.3), trigger_ticks(), recorder.record(0.3)))
+
+        self.assertEqual(2, clock.triggered_ticks)
+        self.assertEqual(4, clock.merged_tick_requests)
+        self.assertEqual(2, len(recorder.tick_times))
+
+        clock.remove_tick_trigger(publisher, MarketEvent.OrderFilled)
+        publisher.trigger_event(MarketEvent.OrderFilled, None)
+        self.assertEqual(4, clock.merged_tick_requests)
+
+    def test_event_driven_clock_keeps_min_tick_interval(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.2)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+
+        async def trigger_ticks():
+            for _ in range(5):
+                clock.request_tick()
+                await asyncio.sleep(0.05)
+
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(
+                clock.run_til(time.time() + 0.5), trigger_ticks(), recorder.record(0.5)))
+
+        self.assertLess(len(recorder.tick_times), 5)
+        self.assertEqual(len(recorder.tick_times), clock.triggered_ticks)
+        for previous_tick, tick in zip(recorder.tick_times, recorder.tick_times[1:]):
+            self.assertGreaterEqual(tick - previous_tick, 0.19)
+
+    def test_event_driven_clock_falls_back_to_tick_size(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=0.1)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.35), recorder.record(0.35)))
+
+        self.assertEqual(0, clock.triggered_ticks)
+        self.assertGreaterEqual(len(recorder.tick_times), 3)
+
+    def test_event_driven_clock_ticks_when_iterator_ready(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.05)
+        publisher = ReadyPublisher()
+        clock.add_readiness_trigger(publisher)
+
+        async def become_ready():
+            await asyncio.sleep(0.1)
+            publisher.ready = True
+
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.3), become_ready()))
+
+        self.assertEqual(1, clock.triggered_ticks)
+
+    def test_event_driven_clock_adds_order_book_triggers_once(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.05)
+        publisher = ReadyPublisher()
+        publisher.ready = True
+        order_book = PubSub()
+        publisher.order_books = {"COINALPHA-HBOT": order_book}
+        clock.add_connector_triggers(publisher)
+        clock.add_tick_trigger(publisher, MarketEvent.OrderFilled)
+
+        with clock:
+            for _ in range(3):
+                self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.1))
+
+        self.assertEqual(1, len(order_book.get_listeners(OrderBookEvent.BestPriceUpdateEvent)))
+        self.assertEqual(1, len(publisher.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual(1, clock.triggered_ticks)
+
+    def test_request_tick_ignored_in_realtime_mode(self):
+        self.clock_realtime.request_tick()
+        self.assertEqual(0, self.clock_realtime.merged_tick_requests)
+        self.clock_realtime.request_tick()
+        self.assertEqual(0, self.clock_realtime.merged_tick_requests)
+
+    def test_tick_profiling(self):
+        self.assertIsNone(self.clock_backtest.tick_profiler)
+        self.clock_backtest.add_iterator(TimeIterator())
+        self.clock_backtest.enable_tick_profiling()
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10 * self.tick_size)
+
+        stats = self.clock_backtest.tick_profiler.to_dict()
+        self.assertEqual(10, stats["ticks"])
+        self.assertEqual(10, stats["iterators"]["TimeIterator"]["count"])
+
+        self.clock_backtest.disable_tick_profiling()
+        self.assertIsNone(self.clock_backtest.tick_profiler)
+
+    def test_tick_profiling_in_realtime_mode(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(TimeIterator())
+        clock.enable_tick_profiling()
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.35))
+
+        profiler = clock.tick_profiler
+        self.assertGreaterEqual(profiler.tick_histogram.count, 3)
+        self.assertEqual(profiler.tick_histogram.count, profiler.iterator_histograms["TimeIterator"].count)
+        self.assertEqual(0, profiler.overrunning_ticks)
+        self.assertGreaterEqual(profiler.mean_drift, 0)
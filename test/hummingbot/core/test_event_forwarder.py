@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import unittest
+
+from hummingbot.core.event.event_forwarder import BufferedEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.pubsub import PubSub
+
+
+class BufferedEventForwarderTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pubsub = PubSub()
+        self.forwarded_events = []
+
+    def _forward(self, event_tag: int, caller: PubSub, arg: int):
+        self.forwarded_events.append((event_tag, caller, arg))
+
+    def _run_pending_callbacks(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_events_forwarded_in_order_off_the_trigger_path(self):
+        forwarder = BufferedEventForwarder(self._forward, self.ev_loop, max_batch_size=2)
+        self.pubsub.add_listener(MarketEvent.OrderFilled, forwarder)
+        self.pubsub.add_listener(MarketEvent.OrderCancelled, forwarder)
+
+        for i in range(5):
+            self.pubsub.trigger_event(MarketEvent.OrderFilled if i % 2 == 0 else MarketEvent.OrderCancelled, i)
+
+        self.assertEqual([], self.forwarded_events)
+        self.assertEqual(5, forwarder.queue_size)
+
+        self._run_pending_callbacks()
+
+        self.assertEqual(0, forwarder.queue_size)
+        self.assertEqual(5, forwarder.max_depth)
+        self.assertEqual([0, 1, 2, 3, 4], [arg for _, _, arg in self.forwarded_events])
+        self.assertEqual((MarketEvent.OrderFilled.value, self.pubsub), self.forwarded_events[0][:2])
+        self.assertEqual((MarketEvent.OrderCancelled.value, self.pubsub), self.forwarded_events[1][:2])
+
+    def test_full_queue_is_forwarded_by_the_trigger(self):
+        forwarder = BufferedEventForwarder(self._forward, self.ev_loop, max_queue_size=3)
+        self.pubsub.add_listener(MarketEvent.OrderFilled, forwarder)
+
+        for i in range(4):
+            self.pubsub.trigger_event(MarketEvent.OrderFilled, i)
+
+        self.assertEqual([0, 1, 2, 3], [arg for _, _, arg in self.forwarded_events])
+        self.assertEqual(1, forwarder.overflows)
+
+        self.pubsub.trigger_event(MarketEvent.OrderFilled, 4)
+        forwarder.flush()
+        self.assertEqual([0, 1, 2, 3, 4], [arg for _, _, arg in self.forwarded_events])
+        self._run_pending_callbacks()
+        self.assertEqual(5, len(self.forwarded_events))
+
+    def test_errors_do_not_stop_forwarding(self):
+        def forward(event_tag: int, caller: PubSub, arg: int):
+            if arg == 0:
+                raise ValueError("Test error")
+            self._forward(event_tag, caller, arg)
+
+        forwarder = BufferedEventForwarder(forward, self.ev_loop)
+        self.pubsub.add_listener(MarketEvent.OrderFilled, forwarder)
+
+        self.pubsub.trigger_event(MarketEvent.OrderFilled, 0)
+        self.pubsub.trigger_event(MarketEvent.OrderFilled, 1)
+        self._run_pending_callbacks()
+
+        self.assertEqual([1], [arg for _, _, arg in self.forwarded_events])
+
+    def test_events_triggered_from_other_threads(self):
+        forwarder = BufferedEventForwarder(self._forward, self.ev_loop)
+        self.pubsub.add_listener(MarketEvent.OrderFilled, forwarder)
+
+        thread = threading.Thread(target=self.pubsub.trigger_event, args=(MarketEvent.OrderFilled, 1))
+        thread.start()
+        thread.join()
+        self._run_pending_callbacks()
+
+        self.assertEqual([1], [arg for _, _, arg in self.forwarded_events])
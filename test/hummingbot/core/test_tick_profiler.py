@@ -0,0 +1,63 @@
+import unittest
+
+from hummingbot.core.tick_profiler import TickDurationHistogram, TickProfiler
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class TickProfilerTest(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = TickDurationHistogram()
+        self.assertEqual(0, histogram.percentile(99))
+
+        for duration in [5e-6, 5e-4, 5e-4, 2.0]:
+            histogram.add(duration)
+
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(2.0, histogram.max_duration)
+        self.assertAlmostEqual((5e-6 + 1e-3 + 2.0) / 4, histogram.mean_duration)
+        self.assertEqual(1, histogram.bucket_counts["<=1e-05s"])
+        self.assertEqual(2, histogram.bucket_counts["<=0.001s"])
+        self.assertEqual(1, histogram.bucket_counts[">1s"])
+        self.assertEqual(1e-3, histogram.percentile(50))
+        self.assertEqual(2.0, histogram.percentile(99))
+
+    def test_profiler_counts_overrunning_and_missed_ticks(self):
+        profiler = TickProfiler(tick_size=1.0)
+        iterator = TimeIterator()
+
+        profiler.record_wake_up(10.0, 10.01)
+        profiler.record_iterator_tick(iterator, 0.5)
+        profiler.record_tick(0.5)
+        profiler.record_wake_up(11.0, 13.5)
+        profiler.record_iterator_tick(iterator, 1.5)
+        profiler.record_tick(1.5)
+
+        self.assertEqual(1, profiler.overrunning_ticks)
+        self.assertEqual(2, profiler.missed_ticks)
+        self.assertAlmostEqual(2.51 / 2, profiler.mean_drift)
+        self.assertAlmostEqual(2.5, profiler.max_drift)
+
+        stats = profiler.to_dict()
+        self.assertEqual(2, stats["ticks"])
+        self.assertEqual(2, stats["iterators"]["TimeIterator"]["count"])
+        self.assertEqual(1.5, stats["iterators"]["TimeIterator"]["max_duration"])
+        self.assertIn("TimeIterator", profiler.format_status())
+
+    def test_profiler_keeps_a_histogram_per_iterator_of_the_same_class(self):
+        profiler = TickProfiler(tick_size=1.0)
+        first_iterator = TimeIterator()
+        second_iterator = TimeIterator()
+
+        profiler.record_iterator_tick(first_iterator, 0.1)
+        profiler.record_iterator_tick(second_iterator, 0.7)
+        profiler.record_iterator_tick(first_iterator, 0.2)
+
+        histograms = profiler.iterator_histograms
+        self.assertEqual(["TimeIterator", "TimeIterator (2)"], list(histograms.keys()))
+        self.assertEqual(2, histograms["TimeIterator"].count)
+        self.assertEqual(0.2, histograms["TimeIterator"].max_duration)
+        self.assertEqual(1, histograms["TimeIterator (2)"].count)
+        self.assertEqual(0.7, histograms["TimeIterator (2)"].max_duration)
+        self.assertEqual(0.7, profiler.to_dict()["iterators"]["TimeIterator (2)"]["max_duration"])
+        self.assertIn("TimeIterator (2)", profiler.format_status())
@@ -1,10 +1,17 @@
 import asyncio
+import time
 import unittest
-from typing import Awaitable
+from typing import Awaitable, Set
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.connections.connections_factory import (
     ConnectionsFactory
 )
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolConfig
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
 )
@@ -34,3 +41,101 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_the_connection_pool_config(self):
+        pool_config = ConnectionPoolConfig(limit=20, limit_per_host=5, keepalive_timeout=45, ttl_dns_cache=600)
+        factory = ConnectionsFactory(pool_config=pool_config)
+
+        client = self.async_run_with_timeout(factory._get_shared_client())
+
+        self.assertEqual(20, client.connector.limit)
+        self.assertEqual(5, client.connector.limit_per_host)
+        self.assertEqual(45, client.connector._keepalive_timeout)
+        self.assertTrue(client.connector.use_dns_cache)
+        self.async_run_with_timeout(client.close())
+
+    def test_pool_can_not_be_configured_once_the_connections_are_created(self):
+        factory = ConnectionsFactory()
+        factory.configure_pool(ConnectionPoolConfig(limit=10))
+        self.assertEqual(10, factory.pool_config.limit)
+
+        self.async_run_with_timeout(factory.get_rest_connection())
+
+        with self.assertRaises(RuntimeError):
+            factory.configure_pool(ConnectionPoolConfig(limit=20))
+        self.async_run_with_timeout(factory._shared_client.close())
+
+    def test_prewarm_opens_connections_reused_by_the_next_requests(self):
+        client_ports: Set[int] = set()
+
+        async def handler(request: web.Request):
+            client_ports.add(request.transport.get_extra_info("peername")[1])
+            return web.Response(text="pong")
+
+        async def prewarm_and_request():
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", handler)
+            server = TestServer(app)
+            await server.start_server()
+            factory = ConnectionsFactory()
+            try:
+                url = str(server.make_url("/api/v3/order"))
+                opened_connections = await factory.prewarm(urls=[url, url], connections_per_host=3)
+                prewarmed_ports = set(client_ports)
+                client = await factory._get_shared_client()
+
+                async def request():
+                    async with client.get(url) as response:
+                        await response.read()
+
+                await asyncio.gather(*[request() for _ in range(3)])
+            finally:
+                await factory._shared_client.close()
+                await server.close()
+            return opened_connections, prewarmed_ports
+
+        opened_connections, prewarmed_ports = self.async_run_with_timeout(prewarm_and_request(), timeout=5)
+
+        self.assertEqual(3, opened_connections)
+        self.assertEqual(3, len(prewarmed_ports))
+        # The requests did not open new connections
+        self.assertEqual(prewarmed_ports, client_ports)
+
+    def test_prewarm_requests_go_through_the_throttler(self):
+        requests_count = 0
+
+        async def handler(request: web.Request):
+            nonlocal requests_count
+            requests_count += 1
+            return web.Response(text="pong")
+
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="ping", limit=10, time_interval=60)])
+
+        async def prewarm():
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", handler)
+            server = TestServer(app)
+            await server.start_server()
+            factory = ConnectionsFactory()
+            try:
+                return await factory.prewarm(urls=[str(server.make_url("/api/v3/ping"))],
+                                             connections_per_host=3,
+                                             throttler=throttler,
+                                             throttler_limit_id="ping")
+            finally:
+                await factory._shared_client.close()
+                await server.close()
+
+        opened_connections = self.async_run_with_timeout(prewarm(), timeout=5)
+
+        self.assertEqual(3, opened_connections)
+        self.assertEqual(3, requests_count)
+        self.assertEqual(3, throttler._limit_windows["ping"].capacity_used(time.time()))
+
+    def test_prewarm_with_a_throttler_requires_the_rate_limit(self):
+        factory = ConnectionsFactory()
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(factory.prewarm(urls=["https://www.test.com"],
+                                                        connections_per_host=1,
+                                                        throttler=AsyncThrottler(rate_limits=[])))
@@ -2,13 +2,15 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable
+from unittest.mock import MagicMock
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import (
-    RESTMethod, RESTResponse, EndpointRESTRequest
+    RESTMethod, RESTResponse, EndpointRESTRequest, LazyWSResponse, WSResponse
 )
+from hummingbot.core.web_assistant.connections.json_codec import StdlibJSONCodec
 
 
 class DataTypesTest(unittest.TestCase):
@@ -51,6 +53,28 @@ class DataTypesTest(unittest.TestCase):
 
         self.assertEqual(body_str, text)
 
+    @aioresponses()
+    def test_rest_response_read(self, mocked_api):
+        url = "https://some.url"
+        body = b'{"one": 1}'
+        mocked_api.get(url=url, body=body)
+        aiohttp_response = self.async_run_with_timeout(aiohttp.ClientSession().get(url))
+
+        response = RESTResponse(aiohttp_response)
+
+        self.assertEqual(body, self.async_run_with_timeout(response.read()))
+        self.assertEqual({"one": 1}, self.async_run_with_timeout(response.json()))
+
+    @aioresponses()
+    def test_rest_response_json_of_empty_body_is_none(self, mocked_api):
+        url = "https://some.url"
+        mocked_api.get(url=url, body="")
+        aiohttp_response = self.async_run_with_timeout(aiohttp.ClientSession().get(url))
+
+        response = RESTResponse(aiohttp_response)
+
+        self.assertIsNone(self.async_run_with_timeout(response.json()))
+
     @aioresponses()
     def test_rest_response_repr(self, mocked_api):
         url = "https://some.url"
@@ -127,3 +151,33 @@ class EndpointRESTRequestTest(unittest.TestCase):
                 endpoint=endpoint,
                 data=data,
             )
+
+
+class LazyWSResponseTest(unittest.TestCase):
+    def test_decodes_data_once_when_accessed(self):
+        codec = MagicMock(wraps=StdlibJSONCodec())
+        raw = json.dumps({"e": "depthUpdate"})
+
+        response = LazyWSResponse(raw, json_codec=codec)
+
+        self.assertEqual(raw, response.raw)
+        codec.loads.assert_not_called()
+        self.assertEqual({"e": "depthUpdate"}, response.data)
+        self.assertEqual({"e": "depthUpdate"}, response.data)
+        codec.loads.assert_called_once_with(raw)
+
+    def test_data_is_the_text_when_it_is_not_json(self):
+        response = LazyWSResponse("pong")
+
+        self.assertEqual("pong", response.data)
+
+    def test_replacing_data_drops_the_raw_message(self):
+        response = LazyWSResponse(json.dumps({"one": 1}))
+
+        response.data = {"two": 2}
+
+        self.assertIsNone(response.raw)
+        self.assertEqual({"two": 2}, response.data)
+
+    def test_ws_response_has_no_raw_message(self):
+        self.assertIsNone(WSResponse(data={"one": 1}).raw)
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant.connections.json_codec import (
+    DEFAULT_JSON_CODEC,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    UJSONCodec,
+    orjson,
+    scan_json_string_field,
+)
+
+
+class JSONCodecTest(unittest.TestCase):
+    codecs = [StdlibJSONCodec(), UJSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+    def test_dumps_returns_text_the_stdlib_decodes(self):
+        obj = {"symbol": "COINALPHA-HBOT", "price": 0.1, "amount": 12, "open": True, "orders": [1, None]}
+
+        for codec in self.codecs:
+            with self.subTest(codec=type(codec).__name__):
+                encoded = codec.dumps(obj)
+
+                self.assertIsInstance(encoded, str)
+                self.assertEqual(obj, json.loads(encoded))
+
+    def test_loads_text_and_bytes(self):
+        obj = {"symbol": "COINALPHA-HBOT", "price": "0.1"}
+
+        for codec in self.codecs:
+            with self.subTest(codec=type(codec).__name__):
+                self.assertEqual(obj, codec.loads(json.dumps(obj)))
+                self.assertEqual(obj, codec.loads(json.dumps(obj).encode()))
+
+    def test_loads_raises_value_error_on_invalid_document(self):
+        for codec in self.codecs:
+            with self.subTest(codec=type(codec).__name__):
+                with self.assertRaises(ValueError):
+                    codec.loads(b"<html>Bad Gateway</html>")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_encodes_non_string_keys(self):
+        self.assertEqual({"1": "one"}, json.loads(OrjsonCodec().dumps({1: "one"})))
+
+    def test_default_codec_is_the_fastest_installed(self):
+        self.assertIsInstance(DEFAULT_JSON_CODEC, OrjsonCodec if orjson is not None else UJSONCodec)
+
+
+class ScanJSONStringFieldTest(unittest.TestCase):
+    def test_finds_the_first_string_field(self):
+        raw = json.dumps({"stream": "btcusdt@depth@100ms", "data": {"e": "depthUpdate", "stream": "other"}})
+
+        self.assertEqual("btcusdt@depth@100ms", scan_json_string_field(raw, "stream"))
+        self.assertEqual("depthUpdate", scan_json_string_field(raw, "e"))
+        self.assertEqual("depthUpdate", scan_json_string_field('{"e":"depthUpdate","E":1}', "e"))
+
+    def test_returns_none_for_missing_or_non_string_fields(self):
+        self.assertIsNone(scan_json_string_field('{"result":null,"id":1}', "e"))
+        self.assertIsNone(scan_json_string_field('{"result":null,"id":1}', "result"))
+        self.assertIsNone(scan_json_string_field('{"id":', "id"))
+        self.assertIsNone(scan_json_string_field('{"e":"unterminated', "e"))
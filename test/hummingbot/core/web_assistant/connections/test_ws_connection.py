@@ -118,9 +118,23 @@ class WSConnectionTest(unittest.TestCase):
         response = self.async_run_with_timeout(self.ws_connection.receive())
 
         self.assertIsInstance(response, WSResponse)
+        self.assertEqual(json.dumps(data), response.raw)
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_binary_message(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=b"\x1f\x8b", message_type=aiohttp.WSMsgType.BINARY
+        )
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertIsNone(response.raw)
+        self.assertEqual(b"\x1f\x8b", response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -1,19 +1,24 @@
 import asyncio
 import json
+import re
+import time
 import unittest
-from typing import Awaitable, Optional
+from typing import Any, Awaitable, List, Optional, Union
 from unittest.mock import patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, RateLimitUsageHeader
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, StdlibJSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
 
 
 class RESTAssistantTest(unittest.TestCase):
@@ -100,3 +105,154 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_rest_assistant_reports_rate_limit_usage_to_throttler(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({}), headers={"X-Used-Weight": "7"})
+        throttler = AsyncThrottler(
+            rate_limits=[RateLimit(limit_id="weight", limit=10, time_interval=60)],
+            usage_headers=[RateLimitUsageHeader(header="X-USED-WEIGHT")])
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=throttler)
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="weight"))
+
+        self.assertEqual(7, throttler._limit_windows["weight"].capacity_used(time.time()))
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_the_caller_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                request.headers.update({"X-API-KEY": "key"})
+                request.data["nonce"] = 1
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.POST,
+                          url=url,
+                          params={"symbol": "COINALPHA-HBOT"},
+                          headers={"Content-Type": "application/json"},
+                          data={"side": "BUY"},
+                          is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"symbol": "COINALPHA-HBOT", "signature": "sig"}, call_request.params)
+        self.assertEqual({"Content-Type": "application/json", "X-API-KEY": "key"}, call_request.headers)
+        self.assertEqual({"side": "BUY", "nonce": 1}, call_request.data)
+        self.assertEqual({"symbol": "COINALPHA-HBOT"}, req.params)
+        self.assertEqual({"Content-Type": "application/json"}, req.headers)
+        self.assertEqual({"side": "BUY"}, req.data)
+
+    @aioresponses()
+    def test_rest_assistant_encodes_and_decodes_with_the_json_codec(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.post(re.compile(f"^{url}"), body=json.dumps({"orderId": 1}))
+
+        class RecordingCodec(JSONCodec):
+            def __init__(self):
+                self.calls: List[str] = []
+                self._codec = StdlibJSONCodec()
+
+            def dumps(self, obj: Any) -> str:
+                self.calls.append("dumps")
+                return self._codec.dumps(obj)
+
+            def loads(self, data: Union[str, bytes]) -> Any:
+                self.calls.append("loads")
+                return self._codec.loads(data)
+
+        codec = RecordingCodec()
+        connection = RESTConnection(aiohttp.ClientSession(), json_codec=codec)
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), json_codec=codec)
+        params = {"symbol": "COINALPHA-HBOT"}
+
+        response = self.async_run_with_timeout(
+            assistant.execute_request(url=url, throttler_limit_id=url, method=RESTMethod.POST, params=params,
+                                      data={"side": "BUY"}))
+
+        self.assertEqual({"orderId": 1}, response)
+        self.assertEqual(["dumps", "loads"], codec.calls)
+        request = list(mocked_api.requests.values())[0][0]
+        self.assertEqual(json.dumps({"side": "BUY"}), request.kwargs["data"])
+        self.assertEqual(params, request.kwargs["params"])
+        self.assertIsNot(params, request.kwargs["params"])
+
+    @aioresponses()
+    def test_rest_assistant_execute_request_and_get_bytes(self, mocked_api):
+        url = "https://www.test.com/url"
+        body = json.dumps({"orderId": 1}).encode()
+        mocked_api.get(url, body=body)
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]))
+
+        response = self.async_run_with_timeout(assistant.execute_request_and_get_bytes(url=url, throttler_limit_id=url))
+
+        self.assertEqual(body, response)
+
+    @aioresponses()
+    def test_rest_assistant_coalesces_identical_public_get_requests(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"price": "10"}))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=60)])
+        coalescer = RESTRequestCoalescer()
+        assistants = [RESTAssistant(RESTConnection(aiohttp.ClientSession()), throttler=throttler,
+                                    request_coalescer=coalescer)
+                      for _ in range(3)]
+
+        async def run():
+            return await asyncio.gather(*[assistant.execute_request(url=url, throttler_limit_id=url)
+                                          for assistant in assistants])
+
+        responses = self.async_run_with_timeout(run())
+
+        self.assertEqual([{"price": "10"}] * 3, responses)
+        # Each caller gets its own decoded response
+        self.assertIsNot(responses[0], responses[1])
+        self.assertEqual(1, len(list(mocked_api.requests.values())[0]))
+        self.assertEqual(2, coalescer.coalesced_requests)
+        self.assertEqual(1, throttler._limit_windows[url].capacity_used(time.time()))
+
+    @aioresponses()
+    def test_rest_assistant_does_not_coalesce_authenticated_requests(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"balance": "10"}), repeat=True)
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        coalescer = RESTRequestCoalescer()
+        assistant = RESTAssistant(RESTConnection(aiohttp.ClientSession()),
+                                  throttler=AsyncThrottler(rate_limits=[]),
+                                  auth=AuthDummy(),
+                                  request_coalescer=coalescer)
+
+        async def run():
+            return await asyncio.gather(*[assistant.execute_request(url=url, throttler_limit_id=url,
+                                                                    is_auth_required=True)
+                                          for _ in range(2)])
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual(2, len(list(mocked_api.requests.values())[0]))
+        self.assertEqual(0, coalescer.coalesced_requests)
@@ -0,0 +1,132 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_request_coalescer import RESTRequestCoalescer
+
+
+class RESTRequestCoalescerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.coalescer = RESTRequestCoalescer()
+        self.sent_requests = 0
+        self.release_response = asyncio.Event()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _request(self, response=None, exception: Exception = None):
+        self.sent_requests += 1
+        await self.release_response.wait()
+        if exception is not None:
+            raise exception
+        return response
+
+    async def _release_response(self):
+        await asyncio.sleep(0)
+        self.release_response.set()
+
+    def test_request_key(self):
+        key = RESTRequestCoalescer.request_key(
+            method=RESTMethod.GET, url="https://test.url", throttler_limit_id="limit", params={"b": 2, "a": 1})
+        same_key = RESTRequestCoalescer.request_key(
+            method=RESTMethod.GET, url="https://test.url", throttler_limit_id="limit", params={"a": 1, "b": 2})
+        other_key = RESTRequestCoalescer.request_key(
+            method=RESTMethod.GET, url="https://test.url", throttler_limit_id="limit", params={"a": 2, "b": 2})
+
+        self.assertEqual(key, same_key)
+        self.assertNotEqual(key, other_key)
+        self.assertIsNone(RESTRequestCoalescer.request_key(
+            method=RESTMethod.GET, url="https://test.url", throttler_limit_id="limit", params={"symbols": ["A", "B"]}))
+
+    def test_identical_requests_in_flight_share_the_response(self):
+        response = MagicMock()
+
+        async def run():
+            return await asyncio.gather(
+                self.coalescer.execute(key="key", request=lambda: self._request(response)),
+                self.coalescer.execute(key="key", request=lambda: self._request(response)),
+                self._release_response(),
+            )
+
+        first, second, _ = self.async_run_with_timeout(run())
+
+        self.assertIs(response, first)
+        self.assertIs(response, second)
+        self.assertEqual(1, self.sent_requests)
+        self.assertEqual(1, self.coalescer.coalesced_requests)
+        self.assertEqual(0, len(self.coalescer._in_flight))
+
+    def test_requests_with_different_keys_are_sent(self):
+        async def run():
+            return await asyncio.gather(
+                self.coalescer.execute(key="key_1", request=lambda: self._request(1)),
+                self.coalescer.execute(key="key_2", request=lambda: self._request(2)),
+                self._release_response(),
+            )
+
+        first, second, _ = self.async_run_with_timeout(run())
+
+        self.assertEqual((1, 2), (first, second))
+        self.assertEqual(2, self.sent_requests)
+        self.assertEqual(0, self.coalescer.coalesced_requests)
+
+    def test_request_is_sent_again_once_the_previous_one_is_done(self):
+        self.release_response.set()
+
+        self.async_run_with_timeout(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+        self.async_run_with_timeout(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+
+        self.assertEqual(2, self.sent_requests)
+
+    def test_failed_request_raises_for_all_the_callers(self):
+        async def run():
+            return await asyncio.gather(
+                self.coalescer.execute(key="key", request=lambda: self._request(exception=IOError("Failed"))),
+                self.coalescer.execute(key="key", request=lambda: self._request(exception=IOError("Failed"))),
+                self._release_response(),
+                return_exceptions=True,
+            )
+
+        first, second, _ = self.async_run_with_timeout(run())
+
+        self.assertIsInstance(first, IOError)
+        self.assertIsInstance(second, IOError)
+        self.assertEqual(1, self.sent_requests)
+
+    def test_cancelled_caller_does_not_cancel_the_request_for_the_others(self):
+        async def run():
+            first = asyncio.ensure_future(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+            second = asyncio.ensure_future(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+            await asyncio.sleep(0)
+            first.cancel()
+            await self._release_response()
+            return await second
+
+        self.assertEqual(1, self.async_run_with_timeout(run()))
+        self.assertEqual(1, self.sent_requests)
+
+    def test_request_is_cancelled_when_all_the_callers_are_cancelled(self):
+        async def run():
+            first = asyncio.ensure_future(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+            second = asyncio.ensure_future(self.coalescer.execute(key="key", request=lambda: self._request(1)))
+            await asyncio.sleep(0)
+            request_task = self.coalescer._in_flight["key"].task
+            first.cancel()
+            second.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+            await asyncio.sleep(0)
+            return request_task
+
+        request_task = self.async_run_with_timeout(run())
+
+        self.assertTrue(request_task.cancelled())
+        self.assertEqual(0, len(self.coalescer._in_flight))
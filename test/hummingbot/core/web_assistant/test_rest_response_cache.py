@@ -0,0 +1,153 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
+
+ENDPOINT = "/exchangeInfo"
+URL = f"https://api.test.com{ENDPOINT}"
+TTL = 60
+
+
+class RESTResponseCacheTest(unittest.TestCase):
+    # logging.Level required to receive logs from the cache
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.now = 1000.0
+        self.requests = 0
+        self.log_records = []
+        self.cache = self._cache()
+        self.cache.logger().setLevel(1)
+        self.cache.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.cache.logger().removeHandler(self)
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _cache(self) -> RESTResponseCache:
+        cache = RESTResponseCache(cache_path=self.directory, ttls={ENDPOINT: TTL})
+        cache._time = lambda: self.now
+        return cache
+
+    async def _request(self):
+        self.requests += 1
+        return {"symbols": [{"symbol": "COINALPHAHBOT"}], "request": self.requests}
+
+    def _get_or_request(self, cache: RESTResponseCache, params=None):
+        return self.async_run_with_timeout(
+            cache.get_or_request(endpoint=ENDPOINT, url=URL, request=self._request, params=params))
+
+    def test_fresh_response_is_served_from_the_cache(self):
+        first = self._get_or_request(self.cache)
+        self.now += TTL / 4
+        second = self._get_or_request(self.cache)
+
+        self.assertEqual(1, self.requests)
+        self.assertEqual(first, second)
+
+    def test_requests_with_different_params_are_cached_separately(self):
+        self._get_or_request(self.cache, params={"symbol": "COINALPHAHBOT"})
+        response = self._get_or_request(self.cache, params={"symbol": "HBOTCOINALPHA"})
+
+        self.assertEqual(2, self.requests)
+        self.assertEqual(2, response["request"])
+
+    def test_expired_response_is_requested_again(self):
+        self._get_or_request(self.cache)
+        self.now += TTL + 1
+        response = self._get_or_request(self.cache)
+
+        self.assertEqual(2, self.requests)
+        self.assertEqual(2, response["request"])
+
+    def test_response_past_half_its_ttl_is_refreshed_in_the_background(self):
+        self._get_or_request(self.cache)
+        self.now += TTL * 3 / 4
+        response = self._get_or_request(self.cache)
+
+        # The cached response is returned at once, the refresh happens afterwards
+        self.assertEqual(1, response["request"])
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual(2, self.requests)
+        self.assertEqual(2, self._get_or_request(self.cache)["request"])
+        self.assertEqual(self.now, self.cache.get(endpoint=ENDPOINT, url=URL).stored_at)
+
+    def test_failed_background_refresh_keeps_the_cached_response(self):
+        self._get_or_request(self.cache)
+        self.now += TTL * 3 / 4
+
+        async def failing_request():
+            raise IOError("Error executing request")
+
+        response = self.async_run_with_timeout(
+            self.cache.get_or_request(endpoint=ENDPOINT, url=URL, request=failing_request))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(1, response["request"])
+        self.assertEqual(1, self.cache.get(endpoint=ENDPOINT, url=URL).data["request"])
+        self.assertTrue(self._is_logged("WARNING", f"Could not refresh the cached response of {URL}."))
+
+    def test_new_cache_starts_from_the_responses_stored_on_disk(self):
+        self._get_or_request(self.cache)
+
+        restarted_cache = self._cache()
+        response = self._get_or_request(restarted_cache)
+
+        self.assertEqual(1, self.requests)
+        self.assertEqual(1, response["request"])
+
+    def test_each_caller_gets_its_own_copy_of_the_response(self):
+        first = self._get_or_request(self.cache)
+        first["symbols"].clear()
+
+        second = self._get_or_request(self.cache)
+
+        self.assertEqual([{"symbol": "COINALPHAHBOT"}], second["symbols"])
+
+    def test_responses_of_endpoints_without_ttl_are_not_cached(self):
+        self.cache.put(endpoint="/time", url="https://api.test.com/time", data={"serverTime": 1})
+
+        self.assertIsNone(self.cache.ttl("/time"))
+        self.assertIsNone(self.cache.get(endpoint="/time", url="https://api.test.com/time"))
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_unreadable_cache_file_is_ignored(self):
+        self._get_or_request(self.cache)
+        file_name = os.listdir(self.directory)[0]
+        with open(os.path.join(self.directory, file_name), "w") as cache_file:
+            cache_file.write("{invalid")
+
+        response = self._get_or_request(self._cache())
+
+        self.assertEqual(2, response["request"])
+        self.assertTrue(self._is_logged(
+            "WARNING", f"Ignoring the unreadable cached response {os.path.join(self.directory, file_name)}."))
+
+    def test_clear_removes_the_stored_responses(self):
+        self._get_or_request(self.cache)
+
+        self.cache.clear()
+
+        self.assertEqual([], os.listdir(self.directory))
+        self.assertIsNone(self.cache.get(endpoint=ENDPOINT, url=URL))